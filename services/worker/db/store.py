@@ -2,6 +2,7 @@ import aiosqlite
 import json
 import logging
 import os
+from collections.abc import AsyncIterator
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
 
@@ -2503,24 +2504,26 @@ async def insert_mm_fill(fill: dict) -> int:
     return cursor.lastrowid
 
 
-async def update_mm_fill_adverse_selection(fill_id: int, mid_at_30s: float = None,
-                                            mid_at_120s: float = None):
-    db = await _get_db()
-    updates = []
-    values = []
-    if mid_at_30s is not None:
-        updates.append("mid_at_30s=?")
-        values.append(mid_at_30s)
-    if mid_at_120s is not None:
-        updates.append("mid_at_120s=?")
-        values.append(mid_at_120s)
-    if not updates:
+async def bulk_update_mm_fill_adverse_selection(
+    mid30_updates: list[tuple[float, int]],
+    mid120_updates: list[tuple[float, float, int]],
+):
+    """Write a batch of AS measurements in one transaction.
+
+    mid30_updates holds (mid_at_30s, fill_id) pairs. mid120_updates holds
+    (mid_at_120s, adverse_selection, fill_id) triples: the T+120s mid and
+    the AS computed from it land in the same UPDATE statement.
+    """
+    if not (mid30_updates or mid120_updates):
         return
-    values.append(fill_id)
-    await db.execute(
-        f"UPDATE mm_fills SET {', '.join(updates)} WHERE id=?",
-        tuple(values),
-    )
+    db = await _get_db()
+    if mid30_updates:
+        await db.executemany("UPDATE mm_fills SET mid_at_30s=? WHERE id=?", mid30_updates)
+    if mid120_updates:
+        await db.executemany(
+            "UPDATE mm_fills SET mid_at_120s=?, adverse_selection=? WHERE id=?",
+            mid120_updates,
+        )
     await db.commit()
 
 
@@ -2533,6 +2536,23 @@ async def get_recent_mm_fills(limit: int = 100) -> list[dict]:
     return [dict(r) for r in rows]
 
 
+async def get_mm_fills_today(today: str | None = None, limit: int = 2000) -> list[dict]:
+    """Fills created on the given UTC date (YYYY-MM-DD, default: today), newest first.
+
+    The date is a plain string lower bound on created_at, so the range scan
+    stays on idx_mm_fills_created.
+    """
+    if today is None:
+        today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+    db = await _get_db()
+    cursor = await db.execute(
+        "SELECT * FROM mm_fills WHERE created_at >= ? ORDER BY created_at DESC LIMIT ?",
+        (today, limit),
+    )
+    rows = await cursor.fetchall()
+    return [dict(r) for r in rows]
+
+
 async def get_recent_mm_quotes(limit: int = 500) -> list[dict]:
     db = await _get_db()
     cursor = await db.execute(
@@ -2542,8 +2562,11 @@ async def get_recent_mm_quotes(limit: int = 500) -> list[dict]:
     return [dict(r) for r in rows]
 
 
-async def get_pending_adverse_selection_fills(window_seconds: int = 120) -> list[dict]:
-    """Get fills that need adverse selection measurement (mid_at_30s or mid_at_120s is NULL)."""
+async def get_pending_adverse_selection_fills(window_seconds: int = 120) -> AsyncIterator[dict]:
+    """Yield fills that need adverse selection measurement (mid_at_30s or mid_at_120s is NULL).
+
+    Rows are streamed from the cursor one at a time rather than fetched as a list.
+    """
     db = await _get_db()
     cutoff = (datetime.now(timezone.utc) - timedelta(seconds=window_seconds + 30)).isoformat()
     cursor = await db.execute(
@@ -2553,8 +2576,8 @@ async def get_pending_adverse_selection_fills(window_seconds: int = 120) -> list
            ORDER BY created_at ASC""",
         (cutoff,)
     )
-    rows = await cursor.fetchall()
-    return [dict(r) for r in rows]
+    async for row in cursor:
+        yield dict(row)
 
 
 # ═══════════════════════════════════════════════════════════════════════
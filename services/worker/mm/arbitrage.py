@@ -23,9 +23,9 @@ DEFAULT_GAS_COST_USD = 0.005
 MIN_ARB_SIZE = 5.0  # Minimum size to justify gas cost
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ArbOpportunity:
-    """A detected arbitrage opportunity."""
+    """A detected arbitrage opportunity (immutable once scanned)."""
     market_id: str
     condition_id: str
     yes_token_id: str
@@ -226,14 +226,20 @@ class VolTracker:
 class StaleTracker:
     """Track how long a market's mid-price has been unchanged (stale)."""
 
-    def __init__(self, threshold_seconds: float = 60.0):
+    def __init__(self, threshold_seconds: float = 60.0, time_fn=time.monotonic):
+        """
+        Args:
+            threshold_seconds: Unchanged duration at which a market is fully stale.
+            time_fn: Monotonic clock; injectable so tests can freeze time.
+        """
         self._threshold = threshold_seconds
+        self._now = time_fn
         self._last_mid: dict[str, float] = {}
         self._last_change: dict[str, float] = {}  # monotonic time of last change
 
     def update_if_changed(self, market_id: str, mid: float) -> None:
         """Record a new mid observation. Updates last_change if mid moved."""
-        now = time.monotonic()
+        now = self._now()
         prev = self._last_mid.get(market_id)
         if prev is None or abs(mid - prev) > 1e-6:
             self._last_change[market_id] = now
@@ -246,7 +252,7 @@ class StaleTracker:
         last = self._last_change.get(market_id)
         if last is None:
             return 0.0
-        elapsed = time.monotonic() - last
+        elapsed = self._now() - last
         return min(elapsed / self._threshold, 1.0) if self._threshold > 0 else 0.0
 
     def reset(self, market_id: str) -> None:
@@ -1,6 +1,8 @@
 """Inventory tracking and management for market-making."""
 
 import logging
+import sys
+import time
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 
@@ -9,9 +11,14 @@ from config import MarketMakingConfig
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class MarketInventory:
-    """In-memory inventory state for a single market (YES + NO tokens)."""
+    """In-memory inventory state for a single market (YES + NO tokens).
+
+    realized_pnl / no_realized_pnl feed InventoryManager's running total.
+    Only process_fill, load_from_db and reconcile_with_clob may change them;
+    anything else that does must call InventoryManager._reseed_realized_pnl().
+    """
     market_id: str
     token_id: str
     no_token_id: str = ""
@@ -23,19 +30,29 @@ class MarketInventory:
     no_avg_entry_price: float = 0.0
     no_realized_pnl: float = 0.0
     opened_at: datetime | None = None
+    opened_at_mono: int | None = None  # time.monotonic_ns() at open; used for age math
     updated_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
 
     def position_age_hours(self) -> float:
         """Hours since position was opened."""
-        if self.opened_at is None or (self.net_position == 0 and self.no_position == 0):
+        if self.net_position == 0 and self.no_position == 0:
+            return 0.0
+        if self.opened_at_mono is not None:
+            return (time.monotonic_ns() - self.opened_at_mono) / 3.6e12
+        if self.opened_at is None:
             return 0.0
+        # Restored or externally set open time without a monotonic stamp
         now = datetime.now(timezone.utc)
         return (now - self.opened_at).total_seconds() / 3600
 
     @property
     def mergeable_pairs(self) -> float:
         """Number of YES+NO pairs that can be merged back to USDC."""
-        return min(self.net_position, self.no_position) if self.net_position > 0 and self.no_position > 0 else 0.0
+        yes = self.net_position
+        no = self.no_position
+        if yes <= 0 or no <= 0:
+            return 0.0
+        return yes if yes < no else no
 
 
 class InventoryManager:
@@ -44,14 +61,20 @@ class InventoryManager:
     def __init__(self, mm_config: MarketMakingConfig):
         self.config = mm_config
         self._inventory: dict[str, MarketInventory] = {}
+        # Running sum of YES+NO realized PnL; updated by process_fill and
+        # re-seeded by _reseed_realized_pnl when inventories are replaced
+        self._realized_pnl_total = 0.0
 
     def get(self, market_id: str) -> MarketInventory:
         """Get or create inventory for a market."""
-        if market_id not in self._inventory:
-            self._inventory[market_id] = MarketInventory(
+        inv = self._inventory.get(market_id)
+        if inv is None:
+            # Intern ids on first sight so repeated lookups hit the identity fast-path
+            market_id = sys.intern(market_id)
+            inv = self._inventory[market_id] = MarketInventory(
                 market_id=market_id, token_id=""
             )
-        return self._inventory[market_id]
+        return inv
 
     def process_fill(self, market_id: str, token_id: str,
                      side: str, price: float, size: float,
@@ -62,25 +85,29 @@ class InventoryManager:
         is_no_token: True if this fill is on the NO token side.
         """
         inv = self.get(market_id)
-        inv.updated_at = datetime.now(timezone.utc)
+        now = datetime.now(timezone.utc)
+        inv.updated_at = now
+        pnl_before = inv.realized_pnl + inv.no_realized_pnl
 
         if is_no_token:
-            inv.no_token_id = token_id
-            self._apply_fill(inv, side, price, size, no_side=True)
-        else:
-            inv.token_id = token_id
-            self._apply_fill(inv, side, price, size, no_side=False)
+            if inv.no_token_id != token_id:
+                inv.no_token_id = sys.intern(token_id)
+        elif inv.token_id != token_id:
+            inv.token_id = sys.intern(token_id)
+        self._apply_fill(inv, side, price, size, no_side=is_no_token)
 
         # Track position open time
-        if side == "BUY":
-            if is_no_token and inv.no_position > 0 and inv.opened_at is None:
-                inv.opened_at = datetime.now(timezone.utc)
-            elif not is_no_token and inv.net_position > 0 and inv.opened_at is None:
-                inv.opened_at = datetime.now(timezone.utc)
+        if side == "BUY" and inv.opened_at is None:
+            if (inv.no_position if is_no_token else inv.net_position) > 0:
+                inv.opened_at = now
+                inv.opened_at_mono = time.monotonic_ns()
 
         # Reset open time when position fully closed
         if inv.net_position == 0 and inv.no_position == 0:
             inv.opened_at = None
+            inv.opened_at_mono = None
+
+        self._realized_pnl_total += inv.realized_pnl + inv.no_realized_pnl - pnl_before
 
     @staticmethod
     def _apply_fill(inv: MarketInventory, side: str, price: float, size: float,
@@ -153,8 +180,8 @@ class InventoryManager:
     def process_split(self, market_id: str, amount: float, yes_token_id: str, no_token_id: str):
         """Record a split operation: adds equal amounts to YES and NO positions."""
         inv = self.get(market_id)
-        inv.token_id = yes_token_id
-        inv.no_token_id = no_token_id
+        inv.token_id = sys.intern(yes_token_id)
+        inv.no_token_id = sys.intern(no_token_id)
         inv.net_position += amount
         inv.no_position += amount
         inv.updated_at = datetime.now(timezone.utc)
@@ -176,8 +203,19 @@ class InventoryManager:
             total += abs(inv.no_position) * inv.no_avg_entry_price if inv.no_avg_entry_price > 0 else 0.0
         return total
 
+    def reset(self):
+        """Drop all positions and the realized PnL running total."""
+        self._inventory.clear()
+        self._realized_pnl_total = 0.0
+
     def get_total_realized_pnl(self) -> float:
-        return sum(inv.realized_pnl + inv.no_realized_pnl for inv in self._inventory.values())
+        return self._realized_pnl_total
+
+    def _reseed_realized_pnl(self):
+        """Recompute the realized PnL running total from scratch."""
+        self._realized_pnl_total = sum(
+            inv.realized_pnl + inv.no_realized_pnl for inv in self._inventory.values()
+        )
 
     def get_unwind_urgency(self, market_id: str, max_hours: float = 24.0) -> float:
         """Get unwind urgency factor based on position age.
@@ -253,26 +291,25 @@ class InventoryManager:
             mid = record["market_id"]
             by_market.setdefault(mid, []).append(record)
 
+        inventory = self._inventory
         for market_id, records in by_market.items():
-            inv = MarketInventory(market_id=market_id, token_id="")
+            market_id = sys.intern(market_id)
+            fields = {"market_id": market_id, "token_id": ""}
             for rec in records:
-                token_id = rec.get("token_id", "")
+                token_id = sys.intern(rec.get("token_id", ""))
                 pos = float(rec.get("net_position", 0))
                 avg = float(rec.get("avg_entry_price", 0))
                 pnl = float(rec.get("realized_pnl", 0))
                 # Heuristic: if there's already a YES token set and this is a different token,
                 # treat it as NO. Otherwise, first token is YES.
-                if inv.token_id and token_id != inv.token_id:
-                    inv.no_token_id = token_id
-                    inv.no_position = pos
-                    inv.no_avg_entry_price = avg
-                    inv.no_realized_pnl = pnl
+                if fields["token_id"] and token_id != fields["token_id"]:
+                    fields.update(no_token_id=token_id, no_position=pos,
+                                  no_avg_entry_price=avg, no_realized_pnl=pnl)
                 else:
-                    inv.token_id = token_id
-                    inv.net_position = pos
-                    inv.avg_entry_price = avg
-                    inv.realized_pnl = pnl
-            self._inventory[market_id] = inv
+                    fields.update(token_id=token_id, net_position=pos,
+                                  avg_entry_price=avg, realized_pnl=pnl)
+            inventory[market_id] = MarketInventory(**fields)
+        self._reseed_realized_pnl()
         logger.info(f"Loaded inventory for {len(by_market)} markets from DB ({len(db_inventory)} records)")
 
     def reconcile_with_clob(self, db_inventory: list[dict]) -> list[dict]:
@@ -320,6 +357,8 @@ class InventoryManager:
                         else:
                             mem_inv.net_position = db_pos
                     else:
+                        market_id = sys.intern(market_id)
+                        db_token = sys.intern(db_token)
                         inv = MarketInventory(
                             market_id=market_id,
                             token_id=db_token if not is_no else "",
@@ -333,4 +372,6 @@ class InventoryManager:
                         self._inventory[market_id] = inv
                         mem_inv = inv  # For subsequent records
 
+        if divergences:
+            self._reseed_realized_pnl()
         return divergences
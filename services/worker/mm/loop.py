@@ -1,11 +1,18 @@
 """Main market-making loop: scan -> filter -> quote -> reconcile -> repeat."""
 
 import asyncio
+import functools
 import json
 import logging
 import time as _time
+from collections.abc import Callable
 from datetime import datetime, timezone
 
+try:
+    import numpy as np
+except ImportError:  # numpy is optional; locked-capital sum falls back to Python
+    np = None
+
 from config import AppConfig
 from executor.client import PolymarketClient
 from mm.scanner import MarketScanner
@@ -24,7 +31,7 @@ from mm.engine import (
     StaleTracker,
 )
 from mm.as_engine import compute_as_quotes, estimate_time_remaining, KappaEstimator, ASParams
-from mm.state import QuotePair, OrderState
+from mm.state import QuotePair, OrderState, OPEN_STATES
 from mm.arbitrage import scan_for_arbitrage, execute_arbitrage
 from db import store
 
@@ -91,16 +98,58 @@ def _cooldown_seconds_for_streak(
     return min(max_seconds, base_seconds * level)
 
 
+# Books up to this size use an unrolled straight-line sum (see build_locked_capital_fn)
+_UNROLL_MAX_QUOTES = 16
+
+
+@functools.lru_cache(maxsize=_UNROLL_MAX_QUOTES + 1)
+def build_locked_capital_fn(n: int) -> Callable[[dict[str, QuotePair]], float]:
+    """Generate a locked-capital function specialised for exactly n quote pairs.
+
+    The per-pair BID check and multiply-add are unrolled, so there is no
+    loop or list building. Generated once per n and cached.
+    """
+    lines = ["def locked_capital(active_quotes):"]
+    if n == 0:
+        lines.append("    return 0.0")
+    else:
+        names = ", ".join(f"p{i}" for i in range(n))
+        lines.append(f"    {names}, = active_quotes.values()")
+        lines.append("    acc = 0.0")
+        for i in range(n):
+            lines.append(f"    if p{i}.bid_order_id and p{i}.bid_state & OPEN_MASK:")
+            lines.append(f"        acc += p{i}.bid_size * p{i}.bid_price")
+        lines.append("    return acc")
+    namespace = {"OPEN_MASK": int(OPEN_STATES)}
+    exec(compile("\n".join(lines), f"<locked_capital_{n}>", "exec"), namespace)
+    return namespace["locked_capital"]
+
+
 def _compute_locked_capital(active_quotes: dict[str, QuotePair]) -> float:
     """Compute USDC.e locked in live open orders (BID only).
 
     ASK orders sell tokens we already hold — they don't lock USDC.
     """
-    locked = 0.0
-    for pair in active_quotes.values():
-        if pair.bid_order_id and pair.bid_state in (OrderState.LIVE, OrderState.PARTIAL, OrderState.NEW):
-            locked += pair.bid_size * pair.bid_price  # BUY locks shares × price
-    return locked
+    n = len(active_quotes)
+    if n <= _UNROLL_MAX_QUOTES:
+        return build_locked_capital_fn(n)(active_quotes)
+    return _locked_capital_generic(active_quotes)
+
+
+def _locked_capital_generic(active_quotes: dict[str, QuotePair]) -> float:
+    """Locked capital for a book of any size; the reference for the unrolled functions."""
+    # Gather the locking BID legs into parallel columns, then reduce in one dot product
+    live = [
+        (pair.bid_size, pair.bid_price)
+        for pair in active_quotes.values()
+        if pair.bid_order_id and pair.bid_state & OPEN_STATES
+    ]
+    if not live:
+        return 0.0
+    if np is not None:
+        cols = np.array(live, dtype=np.float64)
+        return float(np.dot(cols[:, 0], cols[:, 1]))  # BUY locks shares × price
+    return sum(size * price for size, price in live)
 
 
 def _should_cancel_for_requote(
@@ -671,11 +720,11 @@ async def mm_loop(config: AppConfig, client: PolymarketClient, risk=None):
                 if existing and existing.is_active:
                     existing_has_ask = bool(
                         existing.ask_order_id
-                        and existing.ask_state in (OrderState.NEW, OrderState.LIVE, OrderState.PARTIAL)
+                        and existing.ask_state & OPEN_STATES
                     )
                     existing_has_bid = bool(
                         existing.bid_order_id
-                        and existing.bid_state in (OrderState.NEW, OrderState.LIVE, OrderState.PARTIAL)
+                        and existing.bid_state & OPEN_STATES
                     )
                     should_refresh_sides = (
                         place_ask != existing_has_ask
@@ -4,6 +4,13 @@ import logging
 import math
 from datetime import datetime, timezone
 
+try:
+    import numpy as np
+    from numba import njit
+except ImportError:  # numba is optional; kernels below fall back to plain Python
+    np = None
+    njit = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -124,16 +131,34 @@ def compute_pnl(fills: list[dict]) -> dict:
     }
 
 
+def _sharpe_kernel(returns, daily_rf: float) -> float:
+    """Annualized Sharpe of a return sequence (n >= 2). JIT-compiled when numba is available."""
+    n = len(returns)
+    mean_excess = 0.0
+    for r in returns:
+        mean_excess += r - daily_rf
+    mean_excess /= n
+    variance = 0.0
+    for r in returns:
+        d = r - daily_rf - mean_excess
+        variance += d * d
+    variance /= n - 1
+    std = math.sqrt(variance) if variance > 0 else 0.001
+    return (mean_excess / std) * math.sqrt(365)
+
+
+if njit is not None:
+    # Lazy: compiled on the first call, so importing the worker stays side-effect free
+    _sharpe_kernel = njit(_sharpe_kernel)
+
+
 def sharpe_ratio(daily_returns: list[float], risk_free_rate: float = 0.0) -> float:
     """Compute annualized Sharpe ratio from daily returns."""
     if len(daily_returns) < 2:
         return 0.0
-    mean_ret = sum(daily_returns) / len(daily_returns)
-    excess = [r - risk_free_rate / 365 for r in daily_returns]
-    mean_excess = sum(excess) / len(excess)
-    variance = sum((r - mean_excess) ** 2 for r in excess) / (len(excess) - 1)
-    std = math.sqrt(variance) if variance > 0 else 0.001
-    return (mean_excess / std) * math.sqrt(365)
+    if njit is not None:
+        daily_returns = np.asarray(daily_returns, dtype=np.float64)
+    return float(_sharpe_kernel(daily_returns, risk_free_rate / 365))
 
 
 def profit_factor(fills: list[dict]) -> float:
@@ -163,6 +188,22 @@ def profit_factor(fills: list[dict]) -> float:
     return gross_profit / gross_loss
 
 
+def _pf_kernel(pnl) -> tuple[float, float]:
+    """Sum gains and losses of a PnL sequence. JIT-compiled when numba is available."""
+    gains = 0.0
+    losses = 0.0
+    for x in pnl:
+        if x > 0:
+            gains += x
+        elif x < 0:
+            losses -= x
+    return gains, losses
+
+
+if njit is not None:
+    _pf_kernel = njit(_pf_kernel)
+
+
 def profit_factor_from_round_trips(round_trips: list[dict]) -> float:
     """Compute profit factor from completed round-trips.
 
@@ -175,14 +216,10 @@ def profit_factor_from_round_trips(round_trips: list[dict]) -> float:
     Returns:
         Gross gains / gross losses. Returns inf if no losses.
     """
-    gross_gains = 0.0
-    gross_losses = 0.0
-    for rt in round_trips:
-        pnl = float(rt.get("net_pnl", 0))
-        if pnl > 0:
-            gross_gains += pnl
-        elif pnl < 0:
-            gross_losses += abs(pnl)
+    pnl = [float(rt.get("net_pnl", 0)) for rt in round_trips]
+    if njit is not None:
+        pnl = np.array(pnl, dtype=np.float64)
+    gross_gains, gross_losses = _pf_kernel(pnl)
     if gross_losses == 0:
         return float("inf") if gross_gains > 0 else 0.0
     return gross_gains / gross_losses
@@ -2,13 +2,112 @@
 
 import asyncio
 import logging
+from collections import OrderedDict
+from collections.abc import Iterable
+from dataclasses import dataclass
 from datetime import datetime, timezone, timedelta
 
+try:
+    import numpy as np
+except ImportError:  # numpy is optional; daily averages fall back to Python loops
+    np = None
+
 from db import store
 from mm import metrics as mm_metrics
 
 logger = logging.getLogger(__name__)
 
+# Max concurrent get_book_summary calls when measuring adverse selection
+_BOOK_FETCH_CONCURRENCY = 10
+
+# quote_id -> token_id entries kept by MetricsCollector (least recently used evicted)
+_TOKEN_CACHE_MAX = 4096
+
+# Bound on "?" placeholders per IN (...) query (old SQLite builds cap at 999)
+_IN_LIST_CHUNK = 500
+
+
+def _due_windows(fill: dict, now: datetime) -> tuple[bool, bool]:
+    """Which AS windows (T+30s, T+120s) are unmeasured and have elapsed for a fill."""
+    # Both windows already measured: nothing to do, skip the parse
+    want_30 = fill.get("mid_at_30s") is None
+    want_120 = fill.get("mid_at_120s") is None
+    if not (want_30 or want_120):
+        return False, False
+
+    created_str = fill.get("created_at", "")
+    if not created_str:
+        return False, False
+
+    try:
+        # Parse fill timestamp
+        fill_time = datetime.fromisoformat(created_str.replace("Z", "+00:00"))
+        if fill_time.tzinfo is None:
+            fill_time = fill_time.replace(tzinfo=timezone.utc)
+        age_seconds = (now - fill_time).total_seconds()
+    except (ValueError, TypeError):
+        return False, False
+
+    return want_30 and age_seconds >= 30, want_120 and age_seconds >= 120
+
+
+@dataclass(slots=True)
+class _FillColumns:
+    """Column-wise (SoA) copy of fill rows for the numpy aggregates.
+
+    Missing mid_at_fill / adverse_selection values are stored as NaN. The
+    BUY/SELL string compare happens once here: side_sign is +1/-1 int8.
+    """
+    price: "np.ndarray"
+    mid_at_fill: "np.ndarray"
+    side_sign: "np.ndarray"
+    adverse_selection: "np.ndarray"
+
+    @classmethod
+    def from_rows(cls, fills: list[dict]) -> "_FillColumns":
+        # One pass over the dicts into an (n, 4) buffer; columns are views of its transpose
+        nan = float("nan")
+        buf = np.array(
+            [
+                (
+                    f["price"],
+                    f.get("mid_at_fill") or nan,
+                    1.0 if f["side"] == "BUY" else -1.0,
+                    nan if (a := f.get("adverse_selection")) is None else a,
+                )
+                for f in fills
+            ],
+            dtype=np.float64,
+        ).reshape(len(fills), 4)
+        price, mid, sign, as_vals = buf.T
+        return cls(price, mid, sign.astype(np.int8), as_vals)
+
+
+def _fill_quality_and_as_averages(fills: list[dict]) -> tuple[float, float]:
+    """Mean fill quality (bps, fills with a positive mid_at_fill) and mean AS (measured fills)."""
+    if np is None:
+        fq_values = []
+        for f in fills:
+            mid = f.get("mid_at_fill")
+            if mid and mid > 0:
+                fq_values.append(mm_metrics.fill_quality(f["price"], mid, f["side"]))
+        as_values = [f["adverse_selection"] for f in fills if f.get("adverse_selection") is not None]
+        fq_avg = sum(fq_values) / len(fq_values) if fq_values else 0.0
+        as_avg = sum(as_values) / len(as_values) if as_values else 0.0
+        return fq_avg, as_avg
+
+    cols = _FillColumns.from_rows(fills)
+    prices, mids, signs, as_vals = cols.price, cols.mid_at_fill, cols.side_sign, cols.adverse_selection
+
+    fq_mask = mids > 0  # False for NaN too
+    fq_avg = 0.0
+    if fq_mask.any():
+        m = mids[fq_mask]
+        fq_avg = float((signs[fq_mask] * (m - prices[fq_mask]) / m).mean() * 10000)
+    as_mask = ~np.isnan(as_vals)
+    as_avg = float(as_vals[as_mask].mean()) if as_mask.any() else 0.0
+    return fq_avg, as_avg
+
 
 class MetricsCollector:
     """Collects and computes MM performance metrics."""
@@ -19,7 +118,8 @@ class MetricsCollector:
             client: PolymarketClient instance for book_summary lookups.
         """
         self._client = client
-        self._token_cache: dict[int, str] = {}  # quote_id -> token_id
+        self._token_cache: OrderedDict[int, str] = OrderedDict()  # quote_id -> token_id (LRU)
+        self._token_cache_max = _TOKEN_CACHE_MAX
         self._side_cache: dict[int, str] = {}   # quote_id -> side (from mm_quotes doesn't have side, but fills do)
 
     async def measure_adverse_selection(self):
@@ -30,66 +130,71 @@ class MetricsCollector:
         if not self._client:
             return
 
+        now = datetime.now(timezone.utc)
+        # (fill, needs_30s, needs_120s) for fills due a measurement; other
+        # pending rows are dropped as they stream past
+        candidates: list[tuple[dict, bool, bool]] = []
+
         try:
-            pending = await store.get_pending_adverse_selection_fills(window_seconds=180)
+            async for fill in store.get_pending_adverse_selection_fills(window_seconds=180):
+                needs_30, needs_120 = _due_windows(fill, now)
+                if needs_30 or needs_120:
+                    candidates.append((fill, needs_30, needs_120))
         except Exception as e:
             logger.debug(f"AS measurement: failed to get pending fills: {e}")
             return
 
-        if not pending:
+        if not candidates:
             return
 
-        now = datetime.now(timezone.utc)
-        measured_30 = 0
-        measured_120 = 0
+        # Resolve every fill's quote -> token in one query
+        tokens = await self._resolve_token_ids(fill.get("quote_id") for fill, _, _ in candidates)
+        due = [
+            (fill, tokens[fill.get("quote_id")], needs_30, needs_120)
+            for fill, needs_30, needs_120 in candidates
+            if fill.get("quote_id") in tokens
+        ]
+        if not due:
+            return
 
-        for fill in pending:
-            fill_id = fill["id"]
-            created_str = fill.get("created_at", "")
-            if not created_str:
-                continue
+        # One book fetch per distinct token, issued concurrently
+        mids = await self._get_current_mids({token_id for _, token_id, _, _ in due})
 
-            try:
-                # Parse fill timestamp
-                fill_time = datetime.fromisoformat(created_str.replace("Z", "+00:00"))
-                if fill_time.tzinfo is None:
-                    fill_time = fill_time.replace(tzinfo=timezone.utc)
-                age_seconds = (now - fill_time).total_seconds()
-            except (ValueError, TypeError):
-                continue
+        # Rows flushed in one batch below: (mid_at_30s, fill_id) and
+        # (mid_at_120s, adverse_selection, fill_id)
+        mid30_updates: list[tuple[float, int]] = []
+        mid120_updates: list[tuple[float, float, int]] = []
 
-            # Get token_id for this fill's quote
-            token_id = await self._get_token_id(fill.get("quote_id"))
-            if not token_id:
+        for fill, token_id, needs_30, needs_120 in due:
+            mid = mids.get(token_id)
+            if mid is None:
                 continue
+            fill_id = fill["id"]
 
             # Measure mid at T+30s
-            if fill.get("mid_at_30s") is None and age_seconds >= 30:
-                mid = await self._get_current_mid(token_id)
-                if mid is not None:
-                    await store.update_mm_fill_adverse_selection(fill_id, mid_at_30s=mid)
-                    measured_30 += 1
+            if needs_30:
+                mid30_updates.append((mid, fill_id))
 
             # Measure mid at T+120s and calculate AS
-            if fill.get("mid_at_120s") is None and age_seconds >= 120:
-                mid = await self._get_current_mid(token_id)
-                if mid is not None:
-                    # Calculate adverse selection
-                    as_bps = mm_metrics.adverse_selection(
-                        fill_price=fill["price"],
-                        mid_at_fill=fill.get("mid_at_fill", fill["price"]),
-                        mid_at_later=mid,
-                        side=fill["side"],
-                    )
-                    await store.update_mm_fill_adverse_selection(
-                        fill_id, mid_at_120s=mid
-                    )
-                    # Store AS value directly
-                    await self._update_as_value(fill_id, as_bps)
-                    measured_120 += 1
-
-        if measured_30 or measured_120:
-            logger.info(f"AS measurement: {measured_30} at T+30s, {measured_120} at T+120s")
+            if needs_120:
+                as_bps = mm_metrics.adverse_selection(
+                    fill_price=fill["price"],
+                    mid_at_fill=fill.get("mid_at_fill", fill["price"]),
+                    mid_at_later=mid,
+                    side=fill["side"],
+                )
+                mid120_updates.append((mid, as_bps, fill_id))
+
+        if not (mid30_updates or mid120_updates):
+            return
+        try:
+            await store.bulk_update_mm_fill_adverse_selection(mid30_updates, mid120_updates)
+        except Exception as e:
+            logger.debug(f"Failed to persist AS measurements: {e}")
+            return
+        logger.info(
+            f"AS measurement: {len(mid30_updates)} at T+30s, {len(mid120_updates)} at T+120s"
+        )
 
     async def compute_daily_metrics(self) -> dict:
         """Compute today's aggregated MM metrics.
@@ -100,39 +205,27 @@ class MetricsCollector:
         today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
 
         try:
-            all_fills = await store.get_recent_mm_fills(limit=2000)
+            # Date filter runs in SQL: only today's rows leave the DB
+            today_fills = await store.get_mm_fills_today(today, limit=2000)
         except Exception as e:
             logger.debug(f"Metrics computation error: {e}")
             return {}
 
-        today_fills = [
-            f for f in all_fills
-            if f.get("created_at", "").startswith(today)
-        ]
-
         if not today_fills:
             return {}
 
         # PnL
         pnl = mm_metrics.compute_pnl(today_fills)
 
-        # Fill quality average
-        fq_values = []
-        for f in today_fills:
-            mid = f.get("mid_at_fill")
-            if mid and mid > 0:
-                fq = mm_metrics.fill_quality(f["price"], mid, f["side"])
-                fq_values.append(fq)
-        fq_avg = sum(fq_values) / len(fq_values) if fq_values else 0.0
-
-        # Adverse selection average (only fills with AS measured)
-        as_values = [f["adverse_selection"] for f in today_fills if f.get("adverse_selection") is not None]
-        as_avg = sum(as_values) / len(as_values) if as_values else 0.0
+        # Fill quality average + adverse selection average (only fills with AS measured)
+        fq_avg, as_avg = _fill_quality_and_as_averages(today_fills)
 
         # Spread capture (needs quotes)
         try:
             quotes = await store.get_recent_mm_quotes(limit=2000)
-            today_quotes = [q for q in quotes if q.get("created_at", "").startswith(today)]
+            today_quotes = [
+                q for q in quotes if (ca := q.get("created_at")) and ca.startswith(today)
+            ]
             scr = mm_metrics.spread_capture_rate(today_fills, today_quotes)
         except Exception:
             scr = 0.0
@@ -205,24 +298,55 @@ class MetricsCollector:
         except Exception:
             return 0.0
 
-    async def _get_token_id(self, quote_id: int | None) -> str | None:
-        """Get token_id for a quote, with caching."""
-        if quote_id is None:
-            return None
-        if quote_id in self._token_cache:
-            return self._token_cache[quote_id]
+    async def _resolve_token_ids(self, quote_ids: Iterable[int | None]) -> dict[int, str]:
+        """Map quote_ids to token_ids, fetching all cache misses in one IN-list query.
+
+        Unknown quote_ids (and None) are absent from the result.
+        """
+        resolved: dict[int, str] = {}
+        missing: list[int] = []
+        for qid in set(quote_ids):
+            if qid is None:
+                continue
+            token_id = self._token_cache.get(qid)
+            if token_id is not None:
+                self._token_cache.move_to_end(qid)
+                resolved[qid] = token_id
+            else:
+                missing.append(qid)
+        if not missing:
+            return resolved
         try:
             db = await store._get_db()
-            cursor = await db.execute(
-                "SELECT token_id FROM mm_quotes WHERE id=?", (quote_id,)
-            )
-            row = await cursor.fetchone()
-            if row:
-                self._token_cache[quote_id] = row["token_id"]
-                return row["token_id"]
-        except Exception:
-            pass
-        return None
+            for i in range(0, len(missing), _IN_LIST_CHUNK):
+                chunk = missing[i:i + _IN_LIST_CHUNK]
+                cursor = await db.execute(
+                    f"SELECT id, token_id FROM mm_quotes WHERE id IN ({','.join('?' * len(chunk))})",
+                    chunk,
+                )
+                for row in await cursor.fetchall():
+                    self._cache_token_id(row["id"], row["token_id"])
+                    resolved[row["id"]] = row["token_id"]
+        except Exception as e:
+            logger.debug(f"Token lookup failed for {len(missing)} quotes: {e}")
+        return resolved
+
+    def _cache_token_id(self, quote_id: int, token_id: str):
+        self._token_cache[quote_id] = token_id
+        if len(self._token_cache) > self._token_cache_max:
+            self._token_cache.popitem(last=False)
+
+    async def _get_current_mids(self, token_ids: set[str]) -> dict[str, float | None]:
+        """Fetch current mids for several tokens concurrently (bounded)."""
+        sem = asyncio.Semaphore(_BOOK_FETCH_CONCURRENCY)
+
+        async def fetch(token_id: str) -> float | None:
+            async with sem:
+                return await self._get_current_mid(token_id)
+
+        ordered = list(token_ids)
+        results = await asyncio.gather(*(fetch(t) for t in ordered))
+        return dict(zip(ordered, results))
 
     async def _get_current_mid(self, token_id: str) -> float | None:
         """Fetch current mid price from order book."""
@@ -236,18 +360,6 @@ class MetricsCollector:
             pass
         return None
 
-    async def _update_as_value(self, fill_id: int, as_bps: float):
-        """Store computed adverse selection value."""
-        try:
-            db = await store._get_db()
-            await db.execute(
-                "UPDATE mm_fills SET adverse_selection=? WHERE id=?",
-                (as_bps, fill_id)
-            )
-            await db.commit()
-        except Exception as e:
-            logger.debug(f"Failed to update AS value for fill {fill_id}: {e}")
-
     async def _compute_rolling_sharpe(self, days: int = 7) -> float:
         """Compute Sharpe from recent daily percentage returns.
 
@@ -8,8 +8,17 @@ event risk, budget constraints, post-only filtering).
 import logging
 from dataclasses import dataclass, field
 
+try:
+    import numpy as np
+except ImportError:  # numpy is optional; ladders fall back to a Python loop
+    np = None
+
 logger = logging.getLogger(__name__)
 
+# Ladders at least this deep compute their per-level prices/sizes with numpy;
+# shallower ones are cheaper as a plain loop
+_NP_MIN_LEVELS = 8
+
 
 @dataclass
 class OrderProposal:
@@ -75,6 +84,13 @@ def create_base_proposal(
     return proposal
 
 
+def _affine(offset: float, step: float, mults) -> list[float]:
+    """offset + step * m for each multiplier (list or numpy array), as floats."""
+    if np is not None and isinstance(mults, np.ndarray):
+        return (offset + step * mults).tolist()
+    return [offset + step * m for m in mults]
+
+
 def apply_multi_level(
     proposal: QuoteProposal,
     levels: int = 1,
@@ -92,38 +108,51 @@ def apply_multi_level(
         return proposal
 
     mid = proposal.mid
+    lvls = range(1, levels)
+    if np is not None and levels >= _NP_MIN_LEVELS:
+        exps = np.arange(1, levels, dtype=np.float64)
+        mults = np.power(spread_mult, exps)
+        sz_mults = np.power(size_mult, exps)
+    else:
+        mults = [spread_mult ** lvl for lvl in lvls]
+        sz_mults = [size_mult ** lvl for lvl in lvls]
+
     new_bids = list(proposal.bids)
     new_asks = list(proposal.asks)
 
-    for lvl in range(1, levels):
-        mult = spread_mult ** lvl
-        sz_mult = size_mult ** lvl
-
-        if proposal.bids:
-            base = proposal.bids[0]
-            delta_from_mid = mid - base.price
-            new_price = max(0.01, round(mid - delta_from_mid * mult, 2))
-            new_bids.append(OrderProposal(
+    if proposal.bids:
+        base = proposal.bids[0]
+        delta_from_mid = mid - base.price
+        prices = _affine(mid, -delta_from_mid, mults)
+        sizes = _affine(0.0, base.size, sz_mults)
+        new_bids.extend(
+            OrderProposal(
                 market_id=base.market_id,
                 token_id=base.token_id,
                 side="BUY",
-                price=new_price,
-                size=round(base.size * sz_mult, 1),
+                price=max(0.01, round(price, 2)),
+                size=round(size, 1),
                 level=lvl,
-            ))
-
-        if proposal.asks:
-            base = proposal.asks[0]
-            delta_from_mid = base.price - mid
-            new_price = min(0.99, round(mid + delta_from_mid * mult, 2))
-            new_asks.append(OrderProposal(
+            )
+            for lvl, price, size in zip(lvls, prices, sizes)
+        )
+
+    if proposal.asks:
+        base = proposal.asks[0]
+        delta_from_mid = base.price - mid
+        prices = _affine(mid, delta_from_mid, mults)
+        sizes = _affine(0.0, base.size, sz_mults)
+        new_asks.extend(
+            OrderProposal(
                 market_id=base.market_id,
                 token_id=base.token_id,
                 side="SELL",
-                price=new_price,
-                size=round(base.size * sz_mult, 1),
+                price=min(0.99, round(price, 2)),
+                size=round(size, 1),
                 level=lvl,
-            ))
+            )
+            for lvl, price, size in zip(lvls, prices, sizes)
+        )
 
     proposal.bids = new_bids
     proposal.asks = new_asks
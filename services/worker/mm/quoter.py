@@ -2,7 +2,7 @@
 
 import logging
 
-from mm.state import QuotePair, OrderState, parse_clob_status
+from mm.state import QuotePair, OrderState, OPEN_STATES, CANCELLABLE_STATES, parse_clob_status
 from config import MarketMakingConfig
 
 logger = logging.getLogger(__name__)
@@ -121,13 +121,13 @@ class Quoter:
     def cancel_quote_pair(self, pair: QuotePair) -> bool:
         """Cancel both sides of a quote pair."""
         success = True
-        if pair.bid_order_id and pair.bid_state in (OrderState.LIVE, OrderState.PARTIAL):
+        if pair.bid_order_id and pair.bid_state & CANCELLABLE_STATES:
             if not self.client.cancel_order(pair.bid_order_id):
                 success = False
             else:
                 pair.update_bid_state(OrderState.CANCELLED)
 
-        if pair.ask_order_id and pair.ask_state in (OrderState.LIVE, OrderState.PARTIAL):
+        if pair.ask_order_id and pair.ask_state & CANCELLABLE_STATES:
             if not self.client.cancel_order(pair.ask_order_id):
                 success = False
             else:
@@ -240,9 +240,7 @@ class Quoter:
         fills = []
 
         # Check bid
-        if pair.bid_order_id and pair.bid_state in (
-            OrderState.LIVE, OrderState.PARTIAL, OrderState.NEW
-        ):
+        if pair.bid_order_id and pair.bid_state & OPEN_STATES:
             is_filled, status, size_matched, meta = self.client.is_order_filled(
                 pair.bid_order_id
             )
@@ -263,9 +261,7 @@ class Quoter:
                 pair.update_bid_state(new_state)
 
         # Check ask
-        if pair.ask_order_id and pair.ask_state in (
-            OrderState.LIVE, OrderState.PARTIAL, OrderState.NEW
-        ):
+        if pair.ask_order_id and pair.ask_state & OPEN_STATES:
             is_filled, status, size_matched, meta = self.client.is_order_filled(
                 pair.ask_order_id
             )
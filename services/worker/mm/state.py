@@ -3,18 +3,36 @@
 import logging
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from enum import Enum
+from enum import IntFlag
 
 logger = logging.getLogger(__name__)
 
 
-class OrderState(Enum):
-    NEW = "NEW"
-    LIVE = "LIVE"
-    PARTIAL = "PARTIAL"
-    FILLED = "FILLED"
-    CANCELLED = "CANCELLED"
-    UNKNOWN = "UNKNOWN"
+class OrderState(IntFlag):
+    NEW = 1
+    LIVE = 2
+    PARTIAL = 4
+    FILLED = 8
+    CANCELLED = 16
+    UNKNOWN = 32
+
+    def __str__(self) -> str:
+        # IntFlag would print the bare int; log and persist the member name
+        # ("LIVE", or "LIVE|FILLED" for a combination) so OrderState[s] reads it back
+        return self.name
+
+
+# States in which an order is resting on the book (and a BID locks USDC).
+# Test with `state & OPEN_STATES` rather than tuple membership.
+OPEN_STATES = OrderState.NEW | OrderState.LIVE | OrderState.PARTIAL
+
+# Open states the exchange has acknowledged, i.e. orders with something to cancel.
+CANCELLABLE_STATES = OrderState.LIVE | OrderState.PARTIAL
+
+
+# QuotePair.spread/mid work in integer units of 1/PRICE_SCALE (0.0001), finer
+# than any Polymarket tick (0.01 or 0.001), so tick-aligned prices are exact.
+PRICE_SCALE = 10_000
 
 
 # Valid transitions: {current_state: {allowed_next_states}}
@@ -77,18 +95,16 @@ class QuotePair:
 
     @property
     def spread(self) -> float:
-        return self.ask_price - self.bid_price
+        # Integer price units, so 0.30 - 0.10 is 0.2 rather than 0.19999999999999998
+        return (round(self.ask_price * PRICE_SCALE) - round(self.bid_price * PRICE_SCALE)) / PRICE_SCALE
 
     @property
     def mid(self) -> float:
-        return (self.bid_price + self.ask_price) / 2
+        return (round(self.bid_price * PRICE_SCALE) + round(self.ask_price * PRICE_SCALE)) / (2 * PRICE_SCALE)
 
     @property
     def is_active(self) -> bool:
-        return (
-            self.bid_state in (OrderState.NEW, OrderState.LIVE, OrderState.PARTIAL)
-            or self.ask_state in (OrderState.NEW, OrderState.LIVE, OrderState.PARTIAL)
-        )
+        return bool((self.bid_state | self.ask_state) & OPEN_STATES)
 
     @property
     def is_fully_filled(self) -> bool:
@@ -109,7 +125,7 @@ class QuotePair:
             self.updated_at = datetime.now(timezone.utc)
             return True
         logger.warning(
-            f"Invalid bid transition {self.bid_state.value} -> {new_state.value} "
+            f"Invalid bid transition {self.bid_state.name} -> {new_state.name} "
             f"for {self.market_id[:16]}"
         )
         return False
@@ -123,7 +139,7 @@ class QuotePair:
             self.updated_at = datetime.now(timezone.utc)
             return True
         logger.warning(
-            f"Invalid ask transition {self.ask_state.value} -> {new_state.value} "
+            f"Invalid ask transition {self.ask_state.name} -> {new_state.name} "
             f"for {self.market_id[:16]}"
         )
         return False
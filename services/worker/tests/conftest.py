@@ -32,8 +32,9 @@ os.environ.setdefault("MIN_EDGE_PERCENT", "10")
 # Config fixtures
 # ---------------------------------------------------------------------------
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def polymarket_config():
+    # Session-scoped: tests that need different values must use monkeypatch.setattr
     from config import PolymarketConfig
     return PolymarketConfig()
 
@@ -228,3 +229,18 @@ def mock_claude_caller():
     def caller(system_prompt, user_prompt, max_tokens=4096):
         return '{"action": "SKIP", "reasoning": "test"}'
     return caller
+
+
+# ---------------------------------------------------------------------------
+# Event loop for synchronous tests that drive coroutines
+# ---------------------------------------------------------------------------
+
+@pytest.fixture(scope="session")
+def runner():
+    """One asyncio.Runner (and its loop) shared by the whole session.
+
+    For plain ``def`` tests that call ``runner.run(coro)``; ``async def``
+    tests keep going through pytest-asyncio.
+    """
+    with asyncio.Runner() as r:
+        yield r
@@ -11,6 +11,8 @@ from types import SimpleNamespace
 
 import pytest
 
+from mm.state import OrderState
+
 # All tests are async
 pytestmark = pytest.mark.asyncio
 
@@ -2694,3 +2696,97 @@ class TestCdPositions:
         assert result is not None
         expected_pnl = (0.35 - 0.50) * 30.0  # -4.5
         assert float(result["pnl_realized"]) == pytest.approx(expected_pnl, abs=0.01)
+
+
+# ====================================================================
+# MM FILLS
+# ====================================================================
+
+class TestMmQuoteStatus:
+    @pytest.mark.parametrize("state", list(OrderState), ids=lambda s: s.name)
+    async def test_order_state_round_trips(self, test_db, state):
+        qid = await test_db.insert_mm_quote({
+            "market_id": "m1", "token_id": "t1", "bid_price": 0.48,
+            "ask_price": 0.52, "size": 10.0, "status": f"{state}",
+        })
+        await test_db.update_mm_quote_status(qid, str(state))
+        db = await test_db._get_db()
+        cursor = await db.execute("SELECT status FROM mm_quotes WHERE id=?", (qid,))
+        stored = (await cursor.fetchone())["status"]
+        assert stored == state.name
+        assert OrderState[stored] is state
+
+
+class TestGetMmFillsToday:
+    async def test_returns_only_rows_from_that_day(self, test_db):
+        ids = [
+            await test_db.insert_mm_fill({"order_id": f"o{i}", "side": "BUY", "price": 0.5, "size": 1.0})
+            for i in range(3)
+        ]
+        db = await test_db._get_db()
+        stamps = ("2026-03-01 08:00:00", "2026-03-01T23:59:00+00:00", "2026-02-28 23:59:59")
+        for fid, ts in zip(ids, stamps):
+            await db.execute("UPDATE mm_fills SET created_at=? WHERE id=?", (ts, fid))
+        await db.commit()
+
+        rows = await test_db.get_mm_fills_today("2026-03-01")
+        assert [r["id"] for r in rows] == [ids[1], ids[0]]
+
+    async def test_defaults_to_current_utc_date(self, test_db):
+        fid = await test_db.insert_mm_fill({"order_id": "o1", "side": "BUY", "price": 0.5, "size": 1.0})
+        assert [r["id"] for r in await test_db.get_mm_fills_today()] == [fid]
+
+
+class TestGetPendingAdverseSelectionFills:
+    async def test_streams_unmeasured_fills_oldest_first(self, test_db):
+        f1 = await test_db.insert_mm_fill({"order_id": "o1", "side": "BUY", "price": 0.5, "size": 1.0})
+        f2 = await test_db.insert_mm_fill({"order_id": "o2", "side": "SELL", "price": 0.5, "size": 1.0})
+        f3 = await test_db.insert_mm_fill({"order_id": "o3", "side": "BUY", "price": 0.5, "size": 1.0})
+        await test_db.bulk_update_mm_fill_adverse_selection([(0.5, f2)], [(0.5, 1.0, f2)])
+        db = await test_db._get_db()
+        now = datetime.now(timezone.utc)
+        for age, fid in ((90, f1), (60, f2), (30, f3)):
+            await db.execute(
+                "UPDATE mm_fills SET created_at=? WHERE id=?",
+                ((now - timedelta(seconds=age)).isoformat(), fid),
+            )
+        await db.commit()
+
+        pending = test_db.get_pending_adverse_selection_fills(window_seconds=180)
+        assert not isinstance(pending, list)
+        ids = [row["id"] async for row in pending]
+        assert ids == [f1, f3]
+
+
+class TestBulkUpdateMmFillAdverseSelection:
+    async def _fill_ids(self, test_db, n):
+        return [
+            await test_db.insert_mm_fill(
+                {"order_id": f"o{i}", "side": "BUY", "price": 0.50, "size": 10.0}
+            )
+            for i in range(n)
+        ]
+
+    async def test_writes_each_column(self, test_db):
+        f1, f2 = await self._fill_ids(test_db, 2)
+        await test_db.bulk_update_mm_fill_adverse_selection(
+            [(0.51, f1), (0.52, f2)], [(0.55, 12.5, f1)],
+        )
+        rows = {r["id"]: r for r in await test_db.get_recent_mm_fills(limit=10)}
+        assert rows[f1]["mid_at_30s"] == 0.51
+        assert rows[f2]["mid_at_30s"] == 0.52
+        assert rows[f1]["mid_at_120s"] == 0.55
+        assert rows[f1]["adverse_selection"] == 12.5
+        assert rows[f2]["mid_at_120s"] is None
+        assert rows[f2]["adverse_selection"] is None
+
+    async def test_empty_batch_is_noop(self, test_db):
+        await self._fill_ids(test_db, 2)
+        before = await test_db.get_recent_mm_fills(limit=10)
+        db = await test_db._get_db()
+        changes = db.total_changes
+
+        await test_db.bulk_update_mm_fill_adverse_selection([], [])
+
+        assert db.total_changes == changes
+        assert await test_db.get_recent_mm_fills(limit=10) == before
@@ -1,13 +1,139 @@
 """Tests for executor/client.py (PolymarketClient)."""
 
-import asyncio
-import json
-from datetime import datetime, timezone, timedelta
+import copy
+import functools
 from types import SimpleNamespace
-from unittest.mock import AsyncMock, MagicMock, patch, PropertyMock
+from unittest.mock import MagicMock, patch
 
 import pytest
-from py_clob_client.exceptions import PolyApiException
+
+from executor.client import PolymarketClient
+
+
+# Test payloads: built once at import instead of per test call
+_API_CREDS = {"api_key": "k", "secret": "s"}
+_ORDER_ABC = {"orderID": "abc"}
+_EMPTY_BOOK = {"bids": [], "asks": []}
+_LIVE = {"status": "LIVE"}
+_MAX_ALLOWANCE_HEX = "0x" + "f" * 64
+_FAKE_TX_HASH = "0x" + "ab" * 32
+_FAKE_CONDITION_ID = "ab" * 32
+
+
+def _rpc_resp(result=None, json_body=None, status=200):
+    """Lightweight stand-in for a requests.Response from the RPC / Gamma API."""
+    body = json_body if json_body is not None else {"result": result}
+    return SimpleNamespace(status_code=status, json=lambda: body, raise_for_status=lambda: None)
+
+
+# Canned Polygon RPC responses for the split/merge transaction flow, keyed by JSON-RPC method
+_RPC_FIXTURES = {
+    "eth_call": _rpc_resp(_MAX_ALLOWANCE_HEX),  # large allowance
+    "eth_getTransactionCount": _rpc_resp("0x5"),
+    "eth_gasPrice": _rpc_resp("0x3B9ACA00"),  # 1 gwei
+    "eth_sendRawTransaction": _rpc_resp(_FAKE_TX_HASH),
+    "eth_getTransactionReceipt": _rpc_resp({"status": "0x1"}),
+}
+
+
+def _rpc_router(url, json=None, **kwargs):
+    return _RPC_FIXTURES[json["method"]]
+
+
+class _HttpStub:
+    """Plain-callable stand-in for requests.post/get.
+
+    Mirrors the return_value/side_effect knobs of a Mock without the
+    child-mock and patcher machinery.
+    """
+
+    def __init__(self):
+        self.return_value = None
+        self.side_effect = None
+
+    def __call__(self, *args, **kwargs):
+        effect = self.side_effect
+        if effect is None:
+            return self.return_value
+        if isinstance(effect, BaseException):
+            raise effect
+        if callable(effect):
+            return effect(*args, **kwargs)
+        if isinstance(effect, list):
+            effect = self.side_effect = iter(effect)
+        return next(effect)
+
+
+@pytest.fixture(autouse=True)
+def _no_net(monkeypatch):
+    """Route executor.client's requests.post/get to per-test stubs."""
+    post, get = _HttpStub(), _HttpStub()
+    monkeypatch.setattr("executor.client.requests.post", post)
+    monkeypatch.setattr("executor.client.requests.get", get)
+    return post, get
+
+
+@pytest.fixture
+def recording_post(_no_net, monkeypatch):
+    """MagicMock requests.post for the few tests that inspect call arguments."""
+    mock_post = MagicMock()
+    monkeypatch.setattr("executor.client.requests.post", mock_post)
+    return mock_post
+
+
+# Return values every ClobClient mock starts with (configure_mock dotted names)
+_CLOB_DEFAULTS = {"create_or_derive_api_creds.return_value": {}}
+
+
+@functools.lru_cache(maxsize=1)
+def _clob_template():
+    mock_instance = MagicMock()
+    mock_instance.configure_mock(**_CLOB_DEFAULTS)
+    return mock_instance
+
+
+def _fresh_clob():
+    """Return an isolated copy of the cached ClobClient mock.
+
+    deepcopy rather than copy.copy: a shallow copy shares child mocks, so
+    return values and call history would leak between tests.
+    """
+    return copy.deepcopy(_clob_template())
+
+
+@pytest.fixture(scope="class")
+def _class_connected_client(polymarket_config):
+    """Connect once per class, with the network stubbed for the fixture's lifetime.
+
+    The function-scoped ``_no_net`` guard is not yet active while a class
+    fixture is set up, so connect()'s CTF approval check would otherwise
+    hit the configured RPC.
+    """
+    post, get = _HttpStub(), _HttpStub()
+    post.side_effect = _rpc_router
+    with patch("executor.client.requests.post", post), \
+            patch("executor.client.requests.get", get), \
+            patch("executor.client.ClobClient") as MockClob:
+        mock_instance = _fresh_clob()
+        MockClob.return_value = mock_instance
+
+        pm = PolymarketClient(polymarket_config)
+        pm.connect()
+        yield pm, mock_instance
+
+
+@pytest.fixture
+def connected_client(_class_connected_client):
+    """A connected PolymarketClient backed by a mocked ClobClient.
+
+    The client is connected once per test class; the CLOB mock's calls,
+    return values and side effects are reset to the template defaults
+    before each test.
+    """
+    pm, mock_instance = _class_connected_client
+    mock_instance.reset_mock(return_value=True, side_effect=True)
+    mock_instance.configure_mock(**_CLOB_DEFAULTS)
+    return pm, mock_instance
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -18,31 +144,31 @@ from py_clob_client.exceptions import PolyApiException
 class TestPolymarketClientInit:
     """Constructor and connection lifecycle."""
 
-    def test_init_sets_config_and_no_client(self, polymarket_config):
-        from executor.client import PolymarketClient
-
-        pm = PolymarketClient(polymarket_config)
-        assert pm.config is polymarket_config
-        assert pm._client is None
+    @pytest.mark.parametrize("connected", [False, True])
+    def test_client_property(self, polymarket_config, connected):
+        with patch("executor.client.ClobClient") as MockClob:
+            mock_instance = _fresh_clob()
+            MockClob.return_value = mock_instance
 
-    def test_client_property_raises_when_not_connected(self, polymarket_config):
-        from executor.client import PolymarketClient
-
-        pm = PolymarketClient(polymarket_config)
-        with pytest.raises(RuntimeError, match="Client not connected"):
-            _ = pm.client
+            pm = PolymarketClient(polymarket_config)
+            if connected:
+                pm.connect()
+                assert pm.client is mock_instance
+            else:
+                assert pm._client is None
+                with pytest.raises(RuntimeError, match="Client not connected"):
+                    _ = pm.client
 
     @patch("executor.client.ClobClient")
     def test_connect_initializes_clob_client(self, MockClob, polymarket_config):
-        from executor.client import PolymarketClient
-
         mock_instance = MagicMock()
-        mock_instance.create_or_derive_api_creds.return_value = {"api_key": "k", "secret": "s"}
+        mock_instance.create_or_derive_api_creds.return_value = _API_CREDS
         MockClob.return_value = mock_instance
 
         pm = PolymarketClient(polymarket_config)
         pm.connect()
 
+        assert pm.config is polymarket_config
         MockClob.assert_called_once_with(
             polymarket_config.host,
             key=polymarket_config.private_key,
@@ -51,21 +177,9 @@ class TestPolymarketClientInit:
             funder=polymarket_config.funder_address or None,
         )
         mock_instance.create_or_derive_api_creds.assert_called_once()
-        mock_instance.set_api_creds.assert_called_once_with({"api_key": "k", "secret": "s"})
+        mock_instance.set_api_creds.assert_called_once_with(_API_CREDS)
         assert pm._client is mock_instance
 
-    @patch("executor.client.ClobClient")
-    def test_client_property_returns_client_after_connect(self, MockClob, polymarket_config):
-        from executor.client import PolymarketClient
-
-        mock_instance = MagicMock()
-        mock_instance.create_or_derive_api_creds.return_value = {}
-        MockClob.return_value = mock_instance
-
-        pm = PolymarketClient(polymarket_config)
-        pm.connect()
-        assert pm.client is mock_instance
-
 
 # ---------------------------------------------------------------------------
 # Price data
@@ -75,10 +189,7 @@ class TestPolymarketClientInit:
 class TestGetMidpoint:
     @patch("executor.client.ClobClient")
     def test_midpoint_float_response(self, MockClob, polymarket_config):
-        from executor.client import PolymarketClient
-
-        mock_instance = MagicMock()
-        mock_instance.create_or_derive_api_creds.return_value = {}
+        mock_instance = _fresh_clob()
         mock_instance.get_midpoint.return_value = 0.65
         MockClob.return_value = mock_instance
 
@@ -89,10 +200,7 @@ class TestGetMidpoint:
 
     @patch("executor.client.ClobClient")
     def test_midpoint_dict_response(self, MockClob, polymarket_config):
-        from executor.client import PolymarketClient
-
-        mock_instance = MagicMock()
-        mock_instance.create_or_derive_api_creds.return_value = {}
+        mock_instance = _fresh_clob()
         mock_instance.get_midpoint.return_value = {"mid": "0.72"}
         MockClob.return_value = mock_instance
 
@@ -101,27 +209,11 @@ class TestGetMidpoint:
         result = pm.get_midpoint("tok-123")
         assert result == 0.72
 
-    @patch("executor.client.ClobClient")
-    def test_midpoint_exception_returns_none(self, MockClob, polymarket_config):
-        from executor.client import PolymarketClient
-
-        mock_instance = MagicMock()
-        mock_instance.create_or_derive_api_creds.return_value = {}
-        mock_instance.get_midpoint.side_effect = Exception("network error")
-        MockClob.return_value = mock_instance
-
-        pm = PolymarketClient(polymarket_config)
-        pm.connect()
-        assert pm.get_midpoint("tok-123") is None
-
 
 class TestGetPrice:
     @patch("executor.client.ClobClient")
     def test_price_float_response(self, MockClob, polymarket_config):
-        from executor.client import PolymarketClient
-
-        mock_instance = MagicMock()
-        mock_instance.create_or_derive_api_creds.return_value = {}
+        mock_instance = _fresh_clob()
         mock_instance.get_price.return_value = 0.55
         MockClob.return_value = mock_instance
 
@@ -132,10 +224,7 @@ class TestGetPrice:
 
     @patch("executor.client.ClobClient")
     def test_price_dict_response(self, MockClob, polymarket_config):
-        from executor.client import PolymarketClient
-
-        mock_instance = MagicMock()
-        mock_instance.create_or_derive_api_creds.return_value = {}
+        mock_instance = _fresh_clob()
         mock_instance.get_price.return_value = {"price": "0.48"}
         MockClob.return_value = mock_instance
 
@@ -143,47 +232,17 @@ class TestGetPrice:
         pm.connect()
         assert pm.get_price("tok-123") == 0.48
 
-    @patch("executor.client.ClobClient")
-    def test_price_exception_returns_none(self, MockClob, polymarket_config):
-        from executor.client import PolymarketClient
-
-        mock_instance = MagicMock()
-        mock_instance.create_or_derive_api_creds.return_value = {}
-        mock_instance.get_price.side_effect = Exception("timeout")
-        MockClob.return_value = mock_instance
-
-        pm = PolymarketClient(polymarket_config)
-        pm.connect()
-        assert pm.get_price("tok-123") is None
-
 
 class TestGetOrderBook:
     @patch("executor.client.ClobClient")
     def test_order_book_success(self, MockClob, polymarket_config):
-        from executor.client import PolymarketClient
-
-        mock_instance = MagicMock()
-        mock_instance.create_or_derive_api_creds.return_value = {}
-        book = {"bids": [], "asks": []}
-        mock_instance.get_order_book.return_value = book
-        MockClob.return_value = mock_instance
-
-        pm = PolymarketClient(polymarket_config)
-        pm.connect()
-        assert pm.get_order_book("tok-123") == book
-
-    @patch("executor.client.ClobClient")
-    def test_order_book_exception_returns_none(self, MockClob, polymarket_config):
-        from executor.client import PolymarketClient
-
-        mock_instance = MagicMock()
-        mock_instance.create_or_derive_api_creds.return_value = {}
-        mock_instance.get_order_book.side_effect = Exception("err")
+        mock_instance = _fresh_clob()
+        mock_instance.get_order_book.return_value = _EMPTY_BOOK
         MockClob.return_value = mock_instance
 
         pm = PolymarketClient(polymarket_config)
         pm.connect()
-        assert pm.get_order_book("tok-123") is None
+        assert pm.get_order_book("tok-123") == _EMPTY_BOOK
 
 
 # ---------------------------------------------------------------------------
@@ -194,35 +253,29 @@ class TestGetOrderBook:
 class TestPlaceLimitOrder:
     @patch("executor.client.ClobClient")
     def test_buy_checks_balance_and_places(self, MockClob, polymarket_config):
-        from executor.client import PolymarketClient
-
-        mock_instance = MagicMock()
-        mock_instance.create_or_derive_api_creds.return_value = {}
+        mock_instance = _fresh_clob()
         mock_instance.create_order.return_value = "signed-order"
-        mock_instance.post_order.return_value = {"orderID": "abc"}
+        mock_instance.post_order.return_value = _ORDER_ABC
         MockClob.return_value = mock_instance
 
         pm = PolymarketClient(polymarket_config)
         pm.connect()
 
-        with patch.object(pm, "get_onchain_balance", return_value=100.0):
-            result = pm.place_limit_order("tok-123", price=0.50, size=10.0, side="BUY")
+        pm.get_onchain_balance = lambda: 100.0
+        result = pm.place_limit_order("tok-123", price=0.50, size=10.0, side="BUY")
 
         assert result == {"orderID": "abc"}
 
     @patch("executor.client.ClobClient")
     def test_buy_insufficient_balance_returns_none(self, MockClob, polymarket_config):
-        from executor.client import PolymarketClient
-
-        mock_instance = MagicMock()
-        mock_instance.create_or_derive_api_creds.return_value = {}
+        mock_instance = _fresh_clob()
         MockClob.return_value = mock_instance
 
         pm = PolymarketClient(polymarket_config)
         pm.connect()
 
-        with patch.object(pm, "get_onchain_balance", return_value=1.0):
-            result = pm.place_limit_order("tok-123", price=0.50, size=10.0, side="BUY")
+        pm.get_onchain_balance = lambda: 1.0
+        result = pm.place_limit_order("tok-123", price=0.50, size=10.0, side="BUY")
 
         assert result is None
         mock_instance.create_order.assert_not_called()
@@ -230,10 +283,7 @@ class TestPlaceLimitOrder:
     @patch("executor.client.ClobClient")
     def test_sell_preflight_sufficient_token_balance(self, MockClob, polymarket_config):
         """SELL order proceeds when token balance covers size."""
-        from executor.client import PolymarketClient
-
-        mock_instance = MagicMock()
-        mock_instance.create_or_derive_api_creds.return_value = {}
+        mock_instance = _fresh_clob()
         mock_instance.create_order.return_value = "signed"
         mock_instance.post_order.return_value = {"orderID": "sell-1"}
         MockClob.return_value = mock_instance
@@ -242,26 +292,23 @@ class TestPlaceLimitOrder:
         pm.connect()
 
         # Token balance = 10, need 5 -> OK
-        with patch.object(pm, "get_token_balance", return_value=10.0):
-            result = pm.place_limit_order("tok-123", price=0.60, size=5.0, side="SELL")
+        pm.get_token_balance = lambda token_id: 10.0
+        result = pm.place_limit_order("tok-123", price=0.60, size=5.0, side="SELL")
 
         assert result == {"orderID": "sell-1"}
 
     @patch("executor.client.ClobClient")
     def test_sell_preflight_insufficient_token_balance(self, MockClob, polymarket_config):
         """SELL order rejected when token balance is below required size."""
-        from executor.client import PolymarketClient
-
-        mock_instance = MagicMock()
-        mock_instance.create_or_derive_api_creds.return_value = {}
+        mock_instance = _fresh_clob()
         MockClob.return_value = mock_instance
 
         pm = PolymarketClient(polymarket_config)
         pm.connect()
 
         # Token balance = 1, need 5 -> rejected
-        with patch.object(pm, "get_token_balance", return_value=1.0):
-            result = pm.place_limit_order("tok-123", price=0.60, size=5.0, side="SELL")
+        pm.get_token_balance = lambda token_id: 1.0
+        result = pm.place_limit_order("tok-123", price=0.60, size=5.0, side="SELL")
 
         assert result is None
         mock_instance.create_order.assert_not_called()
@@ -269,10 +316,7 @@ class TestPlaceLimitOrder:
     @patch("executor.client.ClobClient")
     def test_buy_balance_none_proceeds(self, MockClob, polymarket_config):
         """When balance check returns None, order should still proceed."""
-        from executor.client import PolymarketClient
-
-        mock_instance = MagicMock()
-        mock_instance.create_or_derive_api_creds.return_value = {}
+        mock_instance = _fresh_clob()
         mock_instance.create_order.return_value = "signed"
         mock_instance.post_order.return_value = {"orderID": "x"}
         MockClob.return_value = mock_instance
@@ -280,34 +324,30 @@ class TestPlaceLimitOrder:
         pm = PolymarketClient(polymarket_config)
         pm.connect()
 
-        with patch.object(pm, "get_onchain_balance", return_value=None):
-            result = pm.place_limit_order("tok-123", price=0.50, size=10.0, side="BUY")
+        pm.get_onchain_balance = lambda: None
+        result = pm.place_limit_order("tok-123", price=0.50, size=10.0, side="BUY")
 
         assert result == {"orderID": "x"}
 
     @patch("executor.client.ClobClient")
     def test_place_order_exception_returns_none(self, MockClob, polymarket_config):
-        from executor.client import PolymarketClient
-
-        mock_instance = MagicMock()
-        mock_instance.create_or_derive_api_creds.return_value = {}
+        mock_instance = _fresh_clob()
         mock_instance.create_order.side_effect = Exception("order fail")
         MockClob.return_value = mock_instance
 
         pm = PolymarketClient(polymarket_config)
         pm.connect()
 
-        with patch.object(pm, "get_onchain_balance", return_value=100.0):
-            result = pm.place_limit_order("tok-123", price=0.50, size=10.0, side="BUY")
+        pm.get_onchain_balance = lambda: 100.0
+        result = pm.place_limit_order("tok-123", price=0.50, size=10.0, side="BUY")
 
         assert result is None
 
     @patch("executor.client.ClobClient")
     def test_post_only_cross_retries_with_safer_price(self, MockClob, polymarket_config):
-        from executor.client import PolymarketClient
+        from py_clob_client.exceptions import PolyApiException
 
-        mock_instance = MagicMock()
-        mock_instance.create_or_derive_api_creds.return_value = {}
+        mock_instance = _fresh_clob()
         mock_instance.create_order.return_value = "signed"
         mock_instance.post_order.side_effect = [
             PolyApiException(error_msg={"error": "invalid post-only order: order crosses book"}),
@@ -318,14 +358,14 @@ class TestPlaceLimitOrder:
         pm = PolymarketClient(polymarket_config)
         pm.connect()
 
-        with patch.object(pm, "get_onchain_balance", return_value=100.0):
-            result = pm.place_limit_order(
-                "tok-123",
-                price=0.50,
-                size=10.0,
-                side="BUY",
-                post_only=True,
-            )
+        pm.get_onchain_balance = lambda: 100.0
+        result = pm.place_limit_order(
+            "tok-123",
+            price=0.50,
+            size=10.0,
+            side="BUY",
+            post_only=True,
+        )
 
         assert result == {"orderID": "retry-ok"}
         assert mock_instance.create_order.call_count == 2
@@ -336,10 +376,9 @@ class TestPlaceLimitOrder:
 
     @patch("executor.client.ClobClient")
     def test_post_only_cross_retries_multiple_ticks_until_success(self, MockClob, polymarket_config):
-        from executor.client import PolymarketClient
+        from py_clob_client.exceptions import PolyApiException
 
-        mock_instance = MagicMock()
-        mock_instance.create_or_derive_api_creds.return_value = {}
+        mock_instance = _fresh_clob()
         mock_instance.create_order.return_value = "signed"
         mock_instance.post_order.side_effect = [
             PolyApiException(error_msg={"error": "invalid post-only order: order crosses book"}),
@@ -351,14 +390,14 @@ class TestPlaceLimitOrder:
         pm = PolymarketClient(polymarket_config)
         pm.connect()
 
-        with patch.object(pm, "get_onchain_balance", return_value=100.0):
-            result = pm.place_limit_order(
-                "tok-123",
-                price=0.50,
-                size=10.0,
-                side="BUY",
-                post_only=True,
-            )
+        pm.get_onchain_balance = lambda: 100.0
+        result = pm.place_limit_order(
+            "tok-123",
+            price=0.50,
+            size=10.0,
+            side="BUY",
+            post_only=True,
+        )
 
         assert result == {"orderID": "retry-ok-2"}
         assert mock_instance.create_order.call_count == 3
@@ -369,30 +408,14 @@ class TestPlaceLimitOrder:
 class TestGetOrder:
     @patch("executor.client.ClobClient")
     def test_get_order_success(self, MockClob, polymarket_config):
-        from executor.client import PolymarketClient
-
-        mock_instance = MagicMock()
-        mock_instance.create_or_derive_api_creds.return_value = {}
-        mock_instance.get_order.return_value = {"status": "LIVE"}
+        mock_instance = _fresh_clob()
+        mock_instance.get_order.return_value = _LIVE
         MockClob.return_value = mock_instance
 
         pm = PolymarketClient(polymarket_config)
         pm.connect()
         assert pm.get_order("order-1") == {"status": "LIVE"}
 
-    @patch("executor.client.ClobClient")
-    def test_get_order_exception(self, MockClob, polymarket_config):
-        from executor.client import PolymarketClient
-
-        mock_instance = MagicMock()
-        mock_instance.create_or_derive_api_creds.return_value = {}
-        mock_instance.get_order.side_effect = Exception("not found")
-        MockClob.return_value = mock_instance
-
-        pm = PolymarketClient(polymarket_config)
-        pm.connect()
-        assert pm.get_order("order-1") is None
-
 
 # ---------------------------------------------------------------------------
 # _as_float
@@ -401,35 +424,23 @@ class TestGetOrder:
 
 class TestAsFloat:
     def test_none_returns_default(self):
-        from executor.client import PolymarketClient
-
         assert PolymarketClient._as_float(None) == 0.0
         assert PolymarketClient._as_float(None, 5.0) == 5.0
 
     def test_valid_float_string(self):
-        from executor.client import PolymarketClient
-
         assert PolymarketClient._as_float("3.14") == 3.14
 
     def test_valid_int(self):
-        from executor.client import PolymarketClient
-
         assert PolymarketClient._as_float(42) == 42.0
 
     def test_invalid_returns_default(self):
-        from executor.client import PolymarketClient
-
         assert PolymarketClient._as_float("not-a-number") == 0.0
         assert PolymarketClient._as_float("not-a-number", 99.0) == 99.0
 
     def test_empty_string_returns_default(self):
-        from executor.client import PolymarketClient
-
         assert PolymarketClient._as_float("") == 0.0
 
     def test_zero(self):
-        from executor.client import PolymarketClient
-
         assert PolymarketClient._as_float(0) == 0.0
         assert PolymarketClient._as_float("0") == 0.0
 
@@ -440,105 +451,72 @@ class TestAsFloat:
 
 
 class TestExtractOrderExecutionMeta:
-    def _make_client(self, polymarket_config):
-        from executor.client import PolymarketClient
-
+    @pytest.mark.parametrize("order,expected", [
+        pytest.param(
+            {"status": "MATCHED", "size_matched": "10.5", "avg_fill_price": "0.55"},
+            {"status": "MATCHED", "size_matched": 10.5, "avg_fill_price": 0.55},
+            id="size_matched_first_key",
+        ),
+        pytest.param(
+            {"status": "live", "matched_size": 7.0, "avg_price": 0.60},
+            {"status": "LIVE", "size_matched": 7.0, "avg_fill_price": 0.60},
+            id="matched_size_key",
+        ),
+        pytest.param(
+            {"status": "MATCHED", "filled_size": "5.0", "fill_price": 0.70},
+            {"size_matched": 5.0, "avg_fill_price": 0.70},
+            id="filled_size_key",
+        ),
+        pytest.param(
+            {"status": "MATCHED", "size_matched": 10.0, "avg_fill_price": 0.55, "matched_notional": "5.50"},
+            {"notional_matched": 5.50},
+            id="notional_from_exchange_field",
+        ),
+        pytest.param(
+            {"status": "MATCHED", "size_matched": 10.0, "avg_fill_price": 0.55},
+            {"notional_matched": pytest.approx(5.50, abs=0.01)},
+            id="notional_computed_when_missing",
+        ),
+        pytest.param(
+            {"status": "MATCHED", "fees_paid": "0.12"},
+            {"fees_paid": 0.12},
+            id="fees_paid_key",
+        ),
+        pytest.param(
+            {"status": "MATCHED", "fee": "0.05"},
+            {"fees_paid": 0.05},
+            id="fees_alternative_key",
+        ),
+        pytest.param(
+            {},
+            {
+                "status": "UNKNOWN",
+                "size_matched": 0.0,
+                "avg_fill_price": None,
+                "notional_matched": None,
+                "fees_paid": 0.0,
+            },
+            id="empty_order",
+        ),
+        # avg_fill_price=0 is skipped, falls through to price=0.55
+        pytest.param(
+            {"status": "MATCHED", "avg_fill_price": "0", "price": "0.55"},
+            {"avg_fill_price": 0.55},
+            id="avg_fill_price_skips_zero_values",
+        ),
+    ])
+    def test_extract_meta(self, polymarket_config, order, expected):
         pm = PolymarketClient(polymarket_config)
-        return pm
-
-    def test_size_matched_first_key(self, polymarket_config):
-        pm = self._make_client(polymarket_config)
-        meta = pm._extract_order_execution_meta({
-            "status": "MATCHED",
-            "size_matched": "10.5",
-            "avg_fill_price": "0.55",
-        })
-        assert meta["status"] == "MATCHED"
-        assert meta["size_matched"] == 10.5
-        assert meta["avg_fill_price"] == 0.55
-
-    def test_matched_size_key(self, polymarket_config):
-        pm = self._make_client(polymarket_config)
-        meta = pm._extract_order_execution_meta({
-            "status": "live",
-            "matched_size": 7.0,
-            "avg_price": 0.60,
-        })
-        assert meta["status"] == "LIVE"
-        assert meta["size_matched"] == 7.0
-        assert meta["avg_fill_price"] == 0.60
-
-    def test_filled_size_key(self, polymarket_config):
-        pm = self._make_client(polymarket_config)
-        meta = pm._extract_order_execution_meta({
-            "status": "MATCHED",
-            "filled_size": "5.0",
-            "fill_price": 0.70,
-        })
-        assert meta["size_matched"] == 5.0
-        assert meta["avg_fill_price"] == 0.70
-
-    def test_notional_from_exchange_field(self, polymarket_config):
-        pm = self._make_client(polymarket_config)
-        meta = pm._extract_order_execution_meta({
-            "status": "MATCHED",
-            "size_matched": 10.0,
-            "avg_fill_price": 0.55,
-            "matched_notional": "5.50",
-        })
-        assert meta["notional_matched"] == 5.50
-
-    def test_notional_computed_when_missing(self, polymarket_config):
-        pm = self._make_client(polymarket_config)
-        meta = pm._extract_order_execution_meta({
-            "status": "MATCHED",
-            "size_matched": 10.0,
-            "avg_fill_price": 0.55,
-        })
-        assert meta["notional_matched"] == pytest.approx(5.50, abs=0.01)
-
-    def test_fees_paid_key(self, polymarket_config):
-        pm = self._make_client(polymarket_config)
-        meta = pm._extract_order_execution_meta({
-            "status": "MATCHED",
-            "fees_paid": "0.12",
-        })
-        assert meta["fees_paid"] == 0.12
-
-    def test_fees_alternative_key(self, polymarket_config):
-        pm = self._make_client(polymarket_config)
-        meta = pm._extract_order_execution_meta({
-            "status": "MATCHED",
-            "fee": "0.05",
-        })
-        assert meta["fees_paid"] == 0.05
-
-    def test_empty_order(self, polymarket_config):
-        pm = self._make_client(polymarket_config)
-        meta = pm._extract_order_execution_meta({})
-        assert meta["status"] == "UNKNOWN"
-        assert meta["size_matched"] == 0.0
-        assert meta["avg_fill_price"] is None
-        assert meta["notional_matched"] is None
-        assert meta["fees_paid"] == 0.0
+        meta = pm._extract_order_execution_meta(order)
+        for key, value in expected.items():
+            assert meta[key] == value
 
     def test_raw_preserved(self, polymarket_config):
-        pm = self._make_client(polymarket_config)
+        pm = PolymarketClient(polymarket_config)
         order = {"status": "MATCHED", "extra": "data"}
         meta = pm._extract_order_execution_meta(order)
         assert meta["raw"] is order
 
-    def test_avg_fill_price_skips_zero_values(self, polymarket_config):
-        """avg_fill_price should only be set if the value is > 0."""
-        pm = self._make_client(polymarket_config)
-        meta = pm._extract_order_execution_meta({
-            "status": "MATCHED",
-            "avg_fill_price": "0",
-            "price": "0.55",
-        })
-        # avg_fill_price=0 is skipped, falls through to price=0.55
-        assert meta["avg_fill_price"] == 0.55
-
 
 # ---------------------------------------------------------------------------
 # is_order_filled
@@ -546,137 +524,63 @@ class TestExtractOrderExecutionMeta:
 
 
 class TestIsOrderFilled:
-    @patch("executor.client.ClobClient")
-    def test_matched_status(self, MockClob, polymarket_config):
-        from executor.client import PolymarketClient
-
-        mock_instance = MagicMock()
-        mock_instance.create_or_derive_api_creds.return_value = {}
-        mock_instance.get_order.return_value = {
-            "status": "MATCHED",
-            "size_matched": "10.0",
-            "original_size": "10.0",
-            "avg_fill_price": "0.55",
-        }
-        MockClob.return_value = mock_instance
-
-        pm = PolymarketClient(polymarket_config)
-        pm.connect()
+    @pytest.mark.parametrize("order_payload,expected_filled,expected_status,expected_size", [
+        pytest.param(
+            {"status": "MATCHED", "size_matched": "10.0", "original_size": "10.0", "avg_fill_price": "0.55"},
+            True, "MATCHED", 10.0,
+            id="matched_status",
+        ),
+        pytest.param(
+            {"status": "LIVE", "size_matched": "0", "original_size": "10.0"},
+            False, "LIVE", 0.0,
+            id="live_status_not_filled",
+        ),
+        pytest.param(
+            {"status": "CANCELLED", "size_matched": "3.0", "original_size": "10.0"},
+            False, "CANCELLED", 3.0,
+            id="cancelled_status",
+        ),
+        # Even if status is not MATCHED, filled when size_matched >= original_size
+        pytest.param(
+            {"status": "LIVE", "size_matched": "10.0", "original_size": "10.0"},
+            True, "LIVE", 10.0,
+            id="filled_by_size_comparison",
+        ),
+    ])
+    def test_is_order_filled_cases(
+        self, connected_client, order_payload, expected_filled, expected_status, expected_size,
+    ):
+        pm, mock_instance = connected_client
+        mock_instance.get_order.return_value = order_payload
 
         is_filled, status, size_matched, meta = pm.is_order_filled("order-1")
-        assert is_filled is True
-        assert status == "MATCHED"
-        assert size_matched == 10.0
+        assert is_filled is expected_filled
+        assert status == expected_status
+        assert size_matched == expected_size
 
-    @patch("executor.client.ClobClient")
-    def test_live_status_not_filled(self, MockClob, polymarket_config):
-        from executor.client import PolymarketClient
-
-        mock_instance = MagicMock()
-        mock_instance.create_or_derive_api_creds.return_value = {}
-        mock_instance.get_order.return_value = {
-            "status": "LIVE",
-            "size_matched": "0",
-            "original_size": "10.0",
-        }
-        MockClob.return_value = mock_instance
-
-        pm = PolymarketClient(polymarket_config)
-        pm.connect()
-
-        is_filled, status, size_matched, meta = pm.is_order_filled("order-2")
-        assert is_filled is False
-        assert status == "LIVE"
-        assert size_matched == 0.0
-
-    @patch("executor.client.ClobClient")
-    def test_cancelled_status(self, MockClob, polymarket_config):
-        from executor.client import PolymarketClient
-
-        mock_instance = MagicMock()
-        mock_instance.create_or_derive_api_creds.return_value = {}
-        mock_instance.get_order.return_value = {
-            "status": "CANCELLED",
-            "size_matched": "3.0",
-            "original_size": "10.0",
-        }
-        MockClob.return_value = mock_instance
-
-        pm = PolymarketClient(polymarket_config)
-        pm.connect()
-
-        is_filled, status, size_matched, meta = pm.is_order_filled("order-3")
-        assert is_filled is False
-        assert status == "CANCELLED"
-        assert size_matched == 3.0
-
-    @patch("executor.client.ClobClient")
-    def test_get_order_returns_none(self, MockClob, polymarket_config):
-        from executor.client import PolymarketClient
-
-        mock_instance = MagicMock()
-        mock_instance.create_or_derive_api_creds.return_value = {}
+    def test_get_order_returns_none(self, connected_client):
+        pm, mock_instance = connected_client
         mock_instance.get_order.return_value = None
-        MockClob.return_value = mock_instance
-
-        pm = PolymarketClient(polymarket_config)
-        pm.connect()
 
         is_filled, status, size_matched, meta = pm.is_order_filled("order-nil")
         assert is_filled is False
         assert status == "UNKNOWN"
         assert meta == {}
 
-    @patch("executor.client.ClobClient")
-    def test_filled_by_size_comparison(self, MockClob, polymarket_config):
-        """Even if status is not MATCHED, filled when size_matched >= original_size."""
-        from executor.client import PolymarketClient
-
-        mock_instance = MagicMock()
-        mock_instance.create_or_derive_api_creds.return_value = {}
-        mock_instance.get_order.return_value = {
-            "status": "LIVE",
-            "size_matched": "10.0",
-            "original_size": "10.0",
-        }
-        MockClob.return_value = mock_instance
-
-        pm = PolymarketClient(polymarket_config)
-        pm.connect()
-
-        is_filled, status, size_matched, meta = pm.is_order_filled("order-full")
-        assert is_filled is True
-
-    @patch("executor.client.ClobClient")
-    def test_exception_in_get_order_returns_unknown(self, MockClob, polymarket_config):
+    def test_exception_in_get_order_returns_unknown(self, connected_client):
         """When get_order raises, it returns None, so is_order_filled sees UNKNOWN."""
-        from executor.client import PolymarketClient
-
-        mock_instance = MagicMock()
-        mock_instance.create_or_derive_api_creds.return_value = {}
+        pm, mock_instance = connected_client
         mock_instance.get_order.side_effect = Exception("boom")
-        MockClob.return_value = mock_instance
-
-        pm = PolymarketClient(polymarket_config)
-        pm.connect()
 
         is_filled, status, size_matched, meta = pm.is_order_filled("order-err")
         assert is_filled is False
         assert status == "UNKNOWN"
         assert meta == {}
 
-    @patch("executor.client.ClobClient")
-    def test_exception_in_meta_extraction_returns_error(self, MockClob, polymarket_config):
+    def test_exception_in_meta_extraction_returns_error(self, connected_client):
         """When _extract_order_execution_meta raises, the outer except catches it."""
-        from executor.client import PolymarketClient
-
-        mock_instance = MagicMock()
-        mock_instance.create_or_derive_api_creds.return_value = {}
+        pm, mock_instance = connected_client
         mock_instance.get_order.return_value = {"status": "MATCHED"}
-        MockClob.return_value = mock_instance
-
-        pm = PolymarketClient(polymarket_config)
-        pm.connect()
 
         # Force an exception after get_order succeeds
         with patch.object(pm, "_extract_order_execution_meta", side_effect=Exception("parse error")):
@@ -695,10 +599,7 @@ class TestIsOrderFilled:
 class TestOpenOrdersAndCancellation:
     @patch("executor.client.ClobClient")
     def test_get_open_orders_success(self, MockClob, polymarket_config):
-        from executor.client import PolymarketClient
-
-        mock_instance = MagicMock()
-        mock_instance.create_or_derive_api_creds.return_value = {}
+        mock_instance = _fresh_clob()
         mock_instance.get_orders.return_value = [{"id": "o1"}, {"id": "o2"}]
         MockClob.return_value = mock_instance
 
@@ -707,25 +608,9 @@ class TestOpenOrdersAndCancellation:
         result = pm.get_open_orders()
         assert len(result) == 2
 
-    @patch("executor.client.ClobClient")
-    def test_get_open_orders_exception_returns_empty(self, MockClob, polymarket_config):
-        from executor.client import PolymarketClient
-
-        mock_instance = MagicMock()
-        mock_instance.create_or_derive_api_creds.return_value = {}
-        mock_instance.get_orders.side_effect = Exception("err")
-        MockClob.return_value = mock_instance
-
-        pm = PolymarketClient(polymarket_config)
-        pm.connect()
-        assert pm.get_open_orders() == []
-
     @patch("executor.client.ClobClient")
     def test_cancel_order_success(self, MockClob, polymarket_config):
-        from executor.client import PolymarketClient
-
-        mock_instance = MagicMock()
-        mock_instance.create_or_derive_api_creds.return_value = {}
+        mock_instance = _fresh_clob()
         MockClob.return_value = mock_instance
 
         pm = PolymarketClient(polymarket_config)
@@ -733,25 +618,9 @@ class TestOpenOrdersAndCancellation:
         assert pm.cancel_order("order-1") is True
         mock_instance.cancel.assert_called_once_with("order-1")
 
-    @patch("executor.client.ClobClient")
-    def test_cancel_order_failure(self, MockClob, polymarket_config):
-        from executor.client import PolymarketClient
-
-        mock_instance = MagicMock()
-        mock_instance.create_or_derive_api_creds.return_value = {}
-        mock_instance.cancel.side_effect = Exception("fail")
-        MockClob.return_value = mock_instance
-
-        pm = PolymarketClient(polymarket_config)
-        pm.connect()
-        assert pm.cancel_order("order-1") is False
-
     @patch("executor.client.ClobClient")
     def test_cancel_all_orders_success(self, MockClob, polymarket_config):
-        from executor.client import PolymarketClient
-
-        mock_instance = MagicMock()
-        mock_instance.create_or_derive_api_creds.return_value = {}
+        mock_instance = _fresh_clob()
         MockClob.return_value = mock_instance
 
         pm = PolymarketClient(polymarket_config)
@@ -759,18 +628,23 @@ class TestOpenOrdersAndCancellation:
         assert pm.cancel_all_orders() is True
         mock_instance.cancel_all.assert_called_once()
 
-    @patch("executor.client.ClobClient")
-    def test_cancel_all_orders_failure(self, MockClob, polymarket_config):
-        from executor.client import PolymarketClient
 
-        mock_instance = MagicMock()
-        mock_instance.create_or_derive_api_creds.return_value = {}
-        mock_instance.cancel_all.side_effect = Exception("fail")
-        MockClob.return_value = mock_instance
+class TestWrapperExceptionHandling:
+    """CLOB wrappers swallow exceptions and return a neutral value."""
 
-        pm = PolymarketClient(polymarket_config)
-        pm.connect()
-        assert pm.cancel_all_orders() is False
+    @pytest.mark.parametrize("attr,call,expected", [
+        ("get_midpoint", lambda pm: pm.get_midpoint("tok-123"), None),
+        ("get_price", lambda pm: pm.get_price("tok-123"), None),
+        ("get_order_book", lambda pm: pm.get_order_book("tok-123"), None),
+        ("get_order", lambda pm: pm.get_order("order-1"), None),
+        ("get_orders", lambda pm: pm.get_open_orders(), []),
+        ("cancel", lambda pm: pm.cancel_order("order-1"), False),
+        ("cancel_all", lambda pm: pm.cancel_all_orders(), False),
+    ])
+    def test_wrapper_swallows_exception(self, connected_client, attr, call, expected):
+        pm, mock_instance = connected_client
+        getattr(mock_instance, attr).side_effect = Exception("boom")
+        assert call(pm) == expected
 
 
 # ---------------------------------------------------------------------------
@@ -779,64 +653,38 @@ class TestOpenOrdersAndCancellation:
 
 
 class TestGetOnchainBalance:
-    def test_no_funder_address_returns_none(self, polymarket_config):
-        from executor.client import PolymarketClient
-
-        polymarket_config.funder_address = ""
+    def test_no_funder_address_returns_none(self, polymarket_config, monkeypatch):
+        monkeypatch.setattr(polymarket_config, "funder_address", "")
         pm = PolymarketClient(polymarket_config)
         assert pm.get_onchain_balance() is None
 
-    @patch("executor.client.requests.post")
-    def test_parses_hex_result(self, mock_post, polymarket_config):
-        from executor.client import PolymarketClient
-
+    @pytest.mark.parametrize("hex_result,expected", [
         # 50 USDC.e = 50_000_000 = 0x2FAF080
-        mock_resp = MagicMock()
-        mock_resp.status_code = 200
-        mock_resp.json.return_value = {"result": "0x0000000000000000000000000000000000000000000000000000000002FAF080"}
-        mock_resp.raise_for_status = MagicMock()
-        mock_post.return_value = mock_resp
+        ("0x0000000000000000000000000000000000000000000000000000000002FAF080", 50.0),
+        ("0x0", 0.0),
+    ])
+    def test_parses_hex_result(self, _no_net, polymarket_config, hex_result, expected):
+        mock_post, _ = _no_net
+        mock_post.return_value = _rpc_resp(hex_result)
 
         pm = PolymarketClient(polymarket_config)
-        balance = pm.get_onchain_balance()
-        assert balance == pytest.approx(50.0)
-
-    @patch("executor.client.requests.post")
-    def test_zero_balance(self, mock_post, polymarket_config):
-        from executor.client import PolymarketClient
-
-        mock_resp = MagicMock()
-        mock_resp.json.return_value = {"result": "0x0"}
-        mock_resp.raise_for_status = MagicMock()
-        mock_post.return_value = mock_resp
-
-        pm = PolymarketClient(polymarket_config)
-        balance = pm.get_onchain_balance()
-        assert balance == 0.0
-
-    @patch("executor.client.requests.post")
-    def test_rpc_error_returns_none(self, mock_post, polymarket_config):
-        from executor.client import PolymarketClient
+        assert pm.get_onchain_balance() == expected
 
+    def test_rpc_error_returns_none(self, _no_net, polymarket_config):
+        mock_post, _ = _no_net
         mock_post.side_effect = Exception("connection refused")
 
         pm = PolymarketClient(polymarket_config)
         assert pm.get_onchain_balance() is None
 
-    @patch("executor.client.requests.post")
-    def test_uses_correct_rpc_url(self, mock_post, polymarket_config):
-        from executor.client import PolymarketClient
+    def test_uses_correct_rpc_url(self, recording_post, polymarket_config, monkeypatch):
+        recording_post.return_value = _rpc_resp("0x0")
 
-        mock_resp = MagicMock()
-        mock_resp.json.return_value = {"result": "0x0"}
-        mock_resp.raise_for_status = MagicMock()
-        mock_post.return_value = mock_resp
-
-        polymarket_config.rpc_url = "https://custom-rpc.example.com"
+        monkeypatch.setattr(polymarket_config, "rpc_url", "https://custom-rpc.example.com")
         pm = PolymarketClient(polymarket_config)
         pm.get_onchain_balance()
 
-        call_args = mock_post.call_args
+        call_args = recording_post.call_args
         assert call_args[0][0] == "https://custom-rpc.example.com"
 
 
@@ -846,107 +694,71 @@ class TestGetOnchainBalance:
 
 
 class TestCheckMarketResolved:
-    @patch("executor.client.requests.get")
-    def test_resolved_market_yes(self, mock_get, polymarket_config):
-        from executor.client import PolymarketClient
-
-        mock_resp = MagicMock()
-        mock_resp.status_code = 200
-        mock_resp.json.return_value = {
-            "closed": True,
-            "resolutionSource": "uma",
-            "outcomes": '["Yes", "No"]',
-            "outcomePrices": '["1.0", "0.0"]',
-        }
-        mock_resp.raise_for_status = MagicMock()
-        mock_get.return_value = mock_resp
+    @pytest.mark.parametrize("payload,expected", [
+        pytest.param(
+            {
+                "closed": True,
+                "resolutionSource": "uma",
+                "outcomes": '["Yes", "No"]',
+                "outcomePrices": '["1.0", "0.0"]',
+            },
+            {"resolved": True, "outcome": "Yes", "resolution_source": "uma"},
+            id="resolved_market_yes",
+        ),
+        pytest.param(
+            {
+                "closed": False,
+                "outcomes": ["Yes", "No"],
+                "outcomePrices": ["0.55", "0.45"],
+            },
+            {"resolved": False, "outcome": None},
+            id="not_closed_market",
+        ),
+        # Closed but no outcome reaches 0.99 => resolved=False
+        pytest.param(
+            {
+                "closed": True,
+                "resolutionSource": "uma",
+                "outcomes": ["Yes", "No"],
+                "outcomePrices": ["0.50", "0.50"],
+            },
+            {"resolved": False, "outcome": None},
+            id="resolved_no_winner",
+        ),
+        # Handles outcomes as native lists (not JSON strings)
+        pytest.param(
+            {
+                "closed": True,
+                "resolutionSource": "uma",
+                "outcomes": ["Yes", "No"],
+                "outcomePrices": ["0.01", "0.99"],
+            },
+            {"resolved": True, "outcome": "No"},
+            id="outcomes_as_list",
+        ),
+    ])
+    def test_market_resolution(self, _no_net, polymarket_config, payload, expected):
+        _, mock_get = _no_net
+        mock_get.return_value = _rpc_resp(json_body=payload)
 
         pm = PolymarketClient(polymarket_config)
         result = pm.check_market_resolved("market-1")
-        assert result["resolved"] is True
-        assert result["outcome"] == "Yes"
-        assert result["resolution_source"] == "uma"
-
-    @patch("executor.client.requests.get")
-    def test_not_closed_market(self, mock_get, polymarket_config):
-        from executor.client import PolymarketClient
-
-        mock_resp = MagicMock()
-        mock_resp.status_code = 200
-        mock_resp.json.return_value = {
-            "closed": False,
-            "outcomes": ["Yes", "No"],
-            "outcomePrices": ["0.55", "0.45"],
-        }
-        mock_resp.raise_for_status = MagicMock()
-        mock_get.return_value = mock_resp
+        for key, value in expected.items():
+            assert result[key] == value
 
-        pm = PolymarketClient(polymarket_config)
-        result = pm.check_market_resolved("market-2")
-        assert result["resolved"] is False
-        assert result["outcome"] is None
-
-    @patch("executor.client.requests.get")
-    def test_404_returns_none(self, mock_get, polymarket_config):
-        from executor.client import PolymarketClient
-
-        mock_resp = MagicMock()
-        mock_resp.status_code = 404
-        mock_get.return_value = mock_resp
+    def test_404_returns_none(self, _no_net, polymarket_config):
+        _, mock_get = _no_net
+        mock_get.return_value = _rpc_resp(status=404)
 
         pm = PolymarketClient(polymarket_config)
         assert pm.check_market_resolved("market-deleted") is None
 
-    @patch("executor.client.requests.get")
-    def test_exception_returns_none(self, mock_get, polymarket_config):
-        from executor.client import PolymarketClient
-
+    def test_exception_returns_none(self, _no_net, polymarket_config):
+        _, mock_get = _no_net
         mock_get.side_effect = Exception("network")
         pm = PolymarketClient(polymarket_config)
         assert pm.check_market_resolved("market-err") is None
 
-    @patch("executor.client.requests.get")
-    def test_resolved_no_winner(self, mock_get, polymarket_config):
-        """Closed but no outcome reaches 0.99 => resolved=False."""
-        from executor.client import PolymarketClient
-
-        mock_resp = MagicMock()
-        mock_resp.status_code = 200
-        mock_resp.json.return_value = {
-            "closed": True,
-            "resolutionSource": "uma",
-            "outcomes": ["Yes", "No"],
-            "outcomePrices": ["0.50", "0.50"],
-        }
-        mock_resp.raise_for_status = MagicMock()
-        mock_get.return_value = mock_resp
-
-        pm = PolymarketClient(polymarket_config)
-        result = pm.check_market_resolved("market-3")
-        assert result["resolved"] is False
-        assert result["outcome"] is None
-
-    @patch("executor.client.requests.get")
-    def test_outcomes_as_list(self, mock_get, polymarket_config):
-        """Handles outcomes as native lists (not JSON strings)."""
-        from executor.client import PolymarketClient
-
-        mock_resp = MagicMock()
-        mock_resp.status_code = 200
-        mock_resp.json.return_value = {
-            "closed": True,
-            "resolutionSource": "uma",
-            "outcomes": ["Yes", "No"],
-            "outcomePrices": ["0.01", "0.99"],
-        }
-        mock_resp.raise_for_status = MagicMock()
-        mock_get.return_value = mock_resp
-
-        pm = PolymarketClient(polymarket_config)
-        result = pm.check_market_resolved("market-4")
-        assert result["resolved"] is True
-        assert result["outcome"] == "No"
-
 
 # ---------------------------------------------------------------------------
 # Split / Merge operations
@@ -954,91 +766,36 @@ class TestCheckMarketResolved:
 
 
 class TestSplitPosition:
-    @patch("executor.client.requests.post")
-    @patch("executor.client.ClobClient")
-    def test_split_success(self, MockClob, mock_post, polymarket_config):
-        from executor.client import PolymarketClient
-
-        mock_instance = MagicMock()
-        mock_instance.create_or_derive_api_creds.return_value = {}
-        MockClob.return_value = mock_instance
-
-        # RPC responses: allowance check, nonce, gas price, send tx, receipt
-        allowance_resp = MagicMock()
-        allowance_resp.json.return_value = {"result": "0x" + "f" * 64}  # large allowance
-        nonce_resp = MagicMock()
-        nonce_resp.json.return_value = {"result": "0x5"}
-        gas_resp = MagicMock()
-        gas_resp.json.return_value = {"result": "0x3B9ACA00"}  # 1 gwei
-        send_resp = MagicMock()
-        send_resp.json.return_value = {"result": "0x" + "ab" * 32}
-        receipt_resp = MagicMock()
-        receipt_resp.json.return_value = {"result": {"status": "0x1"}}
+    def test_split_success(self, connected_client, _no_net):
+        mock_post, _ = _no_net
+        pm, mock_instance = connected_client
 
-        mock_post.side_effect = [allowance_resp, nonce_resp, gas_resp, send_resp, receipt_resp]
-
-        pm = PolymarketClient(polymarket_config)
-        pm.connect()
-        condition_id = "ab" * 32
-        result = pm.split_position(condition_id, 10.0)
+        mock_post.side_effect = _rpc_router
+        result = pm.split_position(_FAKE_CONDITION_ID, 10.0)
         assert result is True
 
-    @patch("executor.client.ClobClient")
-    def test_split_failure_returns_false(self, MockClob, polymarket_config):
-        from executor.client import PolymarketClient
-
-        mock_instance = MagicMock()
-        mock_instance.create_or_derive_api_creds.return_value = {}
-        MockClob.return_value = mock_instance
-
-        pm = PolymarketClient(polymarket_config)
-        pm.connect()
+    def test_split_failure_returns_false(self, connected_client):
+        pm, mock_instance = connected_client
 
         with patch.object(pm, "_ensure_usdc_approval", side_effect=Exception("approval failed")):
-            result = pm.split_position("ab" * 32, 10.0)
+            result = pm.split_position(_FAKE_CONDITION_ID, 10.0)
         assert result is False
 
 
 class TestMergePositions:
-    @patch("executor.client.requests.post")
-    @patch("executor.client.ClobClient")
-    def test_merge_success(self, MockClob, mock_post, polymarket_config):
-        from executor.client import PolymarketClient
-
-        mock_instance = MagicMock()
-        mock_instance.create_or_derive_api_creds.return_value = {}
-        MockClob.return_value = mock_instance
+    def test_merge_success(self, connected_client, _no_net):
+        mock_post, _ = _no_net
+        pm, mock_instance = connected_client
 
-        # RPC responses: nonce, gas price, send tx, receipt
-        nonce_resp = MagicMock()
-        nonce_resp.json.return_value = {"result": "0x5"}
-        gas_resp = MagicMock()
-        gas_resp.json.return_value = {"result": "0x3B9ACA00"}
-        send_resp = MagicMock()
-        send_resp.json.return_value = {"result": "0x" + "cd" * 32}
-        receipt_resp = MagicMock()
-        receipt_resp.json.return_value = {"result": {"status": "0x1"}}
-
-        mock_post.side_effect = [nonce_resp, gas_resp, send_resp, receipt_resp]
-
-        pm = PolymarketClient(polymarket_config)
-        pm.connect()
-        result = pm.merge_positions("ab" * 32, 5.0)
+        mock_post.side_effect = _rpc_router
+        result = pm.merge_positions(_FAKE_CONDITION_ID, 5.0)
         assert result is True
 
-    @patch("executor.client.ClobClient")
-    def test_merge_failure_returns_false(self, MockClob, polymarket_config):
-        from executor.client import PolymarketClient
-
-        mock_instance = MagicMock()
-        mock_instance.create_or_derive_api_creds.return_value = {}
-        MockClob.return_value = mock_instance
-
-        pm = PolymarketClient(polymarket_config)
-        pm.connect()
+    def test_merge_failure_returns_false(self, connected_client):
+        pm, mock_instance = connected_client
 
         with patch.object(pm, "_send_transaction", return_value=None):
-            result = pm.merge_positions("ab" * 32, 5.0)
+            result = pm.merge_positions(_FAKE_CONDITION_ID, 5.0)
         assert result is False
 
 
@@ -1048,44 +805,25 @@ class TestMergePositions:
 
 
 class TestGetTokenBalance:
-    @patch("executor.client.requests.post")
-    def test_token_balance_success(self, mock_post, polymarket_config):
-        from executor.client import PolymarketClient
-
+    @pytest.mark.parametrize("hex_result,expected", [
         # 25 tokens = 25_000_000 = 0x17D7840
-        mock_resp = MagicMock()
-        mock_resp.json.return_value = {
-            "result": "0x00000000000000000000000000000000000000000000000000000000017D7840"
-        }
-        mock_post.return_value = mock_resp
-
-        pm = PolymarketClient(polymarket_config)
-        balance = pm.get_token_balance("12345")
-        assert balance == pytest.approx(25.0)
-
-    @patch("executor.client.requests.post")
-    def test_token_balance_zero(self, mock_post, polymarket_config):
-        from executor.client import PolymarketClient
-
-        mock_resp = MagicMock()
-        mock_resp.json.return_value = {"result": "0x0"}
-        mock_post.return_value = mock_resp
+        ("0x00000000000000000000000000000000000000000000000000000000017D7840", 25.0),
+        ("0x0", 0.0),
+    ])
+    def test_token_balance(self, _no_net, polymarket_config, hex_result, expected):
+        mock_post, _ = _no_net
+        mock_post.return_value = _rpc_resp(hex_result)
 
         pm = PolymarketClient(polymarket_config)
-        balance = pm.get_token_balance("12345")
-        assert balance == 0.0
+        assert pm.get_token_balance("12345") == expected
 
-    def test_token_balance_no_funder_returns_none(self, polymarket_config):
-        from executor.client import PolymarketClient
-
-        polymarket_config.funder_address = ""
+    def test_token_balance_no_funder_returns_none(self, polymarket_config, monkeypatch):
+        monkeypatch.setattr(polymarket_config, "funder_address", "")
         pm = PolymarketClient(polymarket_config)
         assert pm.get_token_balance("12345") is None
 
-    @patch("executor.client.requests.post")
-    def test_token_balance_error_returns_none(self, mock_post, polymarket_config):
-        from executor.client import PolymarketClient
-
+    def test_token_balance_error_returns_none(self, _no_net, polymarket_config):
+        mock_post, _ = _no_net
         mock_post.side_effect = Exception("rpc error")
         pm = PolymarketClient(polymarket_config)
         assert pm.get_token_balance("12345") is None
@@ -1097,19 +835,11 @@ class TestGetTokenBalance:
 
 
 class TestKnownBalance:
-    @patch("executor.client.ClobClient")
-    def test_known_balance_skips_rpc_call(self, MockClob, polymarket_config):
+    def test_known_balance_skips_rpc_call(self, connected_client):
         """When known_balance is provided, get_onchain_balance should not be called."""
-        from executor.client import PolymarketClient
-
-        mock_instance = MagicMock()
-        mock_instance.create_or_derive_api_creds.return_value = {}
+        pm, mock_instance = connected_client
         mock_instance.create_order.return_value = "signed"
-        mock_instance.post_order.return_value = {"orderID": "abc"}
-        MockClob.return_value = mock_instance
-
-        pm = PolymarketClient(polymarket_config)
-        pm.connect()
+        mock_instance.post_order.return_value = _ORDER_ABC
 
         with patch.object(pm, "get_onchain_balance") as mock_balance:
             result = pm.place_limit_order(
@@ -1119,17 +849,9 @@ class TestKnownBalance:
         assert result == {"orderID": "abc"}
         mock_balance.assert_not_called()
 
-    @patch("executor.client.ClobClient")
-    def test_known_balance_insufficient_rejects(self, MockClob, polymarket_config):
+    def test_known_balance_insufficient_rejects(self, connected_client):
         """When known_balance is below required, order should be rejected."""
-        from executor.client import PolymarketClient
-
-        mock_instance = MagicMock()
-        mock_instance.create_or_derive_api_creds.return_value = {}
-        MockClob.return_value = mock_instance
-
-        pm = PolymarketClient(polymarket_config)
-        pm.connect()
+        pm, mock_instance = connected_client
 
         result = pm.place_limit_order(
             "tok-123", price=0.50, size=10.0, side="BUY", known_balance=1.0
@@ -1137,19 +859,11 @@ class TestKnownBalance:
         assert result is None
         mock_instance.create_order.assert_not_called()
 
-    @patch("executor.client.ClobClient")
-    def test_sell_uses_token_balance_not_known_balance(self, MockClob, polymarket_config):
+    def test_sell_uses_token_balance_not_known_balance(self, connected_client):
         """SELL pre-flight uses get_token_balance, ignores known_balance."""
-        from executor.client import PolymarketClient
-
-        mock_instance = MagicMock()
-        mock_instance.create_or_derive_api_creds.return_value = {}
+        pm, mock_instance = connected_client
         mock_instance.create_order.return_value = "signed"
         mock_instance.post_order.return_value = {"orderID": "sell-1"}
-        MockClob.return_value = mock_instance
-
-        pm = PolymarketClient(polymarket_config)
-        pm.connect()
 
         # SELL checks token balance, not USDC known_balance
         with patch.object(pm, "get_token_balance", return_value=10.0) as mock_token:
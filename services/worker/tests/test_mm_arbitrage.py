@@ -1,8 +1,9 @@
 """Tests for mm/arbitrage.py — complete-set arbitrage detection and execution."""
 
-import asyncio
+import dataclasses
+from collections import deque
 from datetime import datetime, timezone
-from unittest.mock import MagicMock, patch
+from types import MappingProxyType
 
 import pytest
 
@@ -12,13 +13,14 @@ from mm.arbitrage import (
     MIN_ARB_SIZE,
     _ask_depth_shares,
     _bid_depth_shares,
+    _execute_buy_merge,
+    _execute_split_sell,
     _extract_order_id,
     execute_arbitrage,
     scan_for_arbitrage,
 )
 from mm.inventory import InventoryManager
 
-
 # ═══════════════════════════════════════════════════════════════════════════════
 # Fixtures
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -28,32 +30,85 @@ CONDITION_ID = "cond-arb-001"
 YES_TOKEN = "tok-yes-arb"
 NO_TOKEN = "tok-no-arb"
 
+# Shared client responses; the code under test only reads them.
+ORDER_YES = {"orderID": "yes-order-1"}
+ORDER_NO = {"orderID": "no-order-1"}
+FILL_20 = (True, "MATCHED", 20.0, {})   # fully filled 20-share order
+FILL_10 = (False, "LIVE", 10.0, {})     # half-filled 20-share order
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def mm_cfg():
-    cfg = MarketMakingConfig()
-    cfg.mm_arb_enabled = True
-    cfg.mm_arb_min_profit_pct = 0.5
-    cfg.mm_arb_max_size_usd = 50.0
-    cfg.mm_arb_gas_cost_usd = 0.005
-    return cfg
+    return MarketMakingConfig()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def inv_mgr():
     return InventoryManager(MarketMakingConfig())
 
 
+@pytest.fixture(autouse=True)
+def _reset(inv_mgr, mm_cfg):
+    """Restore the session-scoped config and inventory before each test."""
+    inv_mgr.reset()
+    mm_cfg.mm_arb_enabled = True
+    mm_cfg.mm_arb_min_profit_pct = 0.5
+    mm_cfg.mm_arb_max_size_usd = 50.0
+    mm_cfg.mm_arb_gas_cost_usd = 0.005
+    yield
+
+
+class FakeClient:
+    """Minimal stand-in for PolymarketClient recording calls in plain lists.
+
+    Responses queued in ``place_queue``/``filled_queue`` are returned in order;
+    once drained, ``place_ret``/``filled_ret`` are returned instead.
+    """
+
+    __slots__ = (
+        "place_calls", "place_queue", "place_ret",
+        "filled_queue", "filled_ret",
+        "cancel_calls",
+        "merge_calls", "merge_ret",
+        "split_calls", "split_ret",
+    )
+
+    def __init__(self, orders=(), fills=(), merge_ret=True):
+        self.place_calls = []
+        self.place_queue = deque(orders)
+        self.place_ret = {"orderID": "order-123"}
+        self.filled_queue = deque(fills)
+        self.filled_ret = FILL_20
+        self.cancel_calls = []
+        self.merge_calls = []
+        self.merge_ret = merge_ret
+        self.split_calls = []
+        self.split_ret = True
+
+    def place_limit_order(self, *args, **kwargs):
+        self.place_calls.append(args)
+        return self.place_queue.popleft() if self.place_queue else self.place_ret
+
+    def is_order_filled(self, order_id):
+        return self.filled_queue.popleft() if self.filled_queue else self.filled_ret
+
+    def cancel_order(self, order_id):
+        self.cancel_calls.append(order_id)
+        return True
+
+    def merge_positions(self, condition_id, amount):
+        self.merge_calls.append((condition_id, amount))
+        return self.merge_ret
+
+    def split_position(self, condition_id, amount):
+        self.split_calls.append((condition_id, amount))
+        return self.split_ret
+
+
 @pytest.fixture
 def mock_client():
-    """Return a MagicMock mimicking PolymarketClient for arb tests."""
-    client = MagicMock()
-    client.place_limit_order = MagicMock(return_value={"orderID": "order-123"})
-    client.is_order_filled = MagicMock(return_value=(True, "MATCHED", 20.0, {}))
-    client.cancel_order = MagicMock(return_value=True)
-    client.merge_positions = MagicMock(return_value=True)
-    client.split_position = MagicMock(return_value=True)
-    return client
+    """Return a FakeClient mimicking PolymarketClient for arb tests."""
+    return FakeClient()
 
 
 def _make_book(best_bid=0.0, best_ask=1.0, bid_depth_5=0, ask_depth_5=0):
@@ -66,26 +121,45 @@ def _make_book(best_bid=0.0, best_ask=1.0, bid_depth_5=0, ask_depth_5=0):
     }
 
 
+# Shared, read-only book summaries; MappingProxyType guards against a test
+# (or scan_for_arbitrage) mutating one and leaking into the next.
+# Buy-merge: YES ask 0.45 + NO ask 0.48 = 0.93 < 1.0
+# Split-sell: YES bid 0.55 + NO bid 0.52 = 1.07 > 1.0
+BOOK_BUY_MERGE_YES = MappingProxyType({"best_bid": 0.43, "best_ask": 0.45, "bid_depth_5": 50, "ask_depth_5": 50})
+BOOK_BUY_MERGE_NO = MappingProxyType({"best_bid": 0.46, "best_ask": 0.48, "bid_depth_5": 50, "ask_depth_5": 50})
+BOOK_SPLIT_SELL_YES = MappingProxyType({"best_bid": 0.55, "best_ask": 0.57, "bid_depth_5": 50, "ask_depth_5": 50})
+BOOK_SPLIT_SELL_NO = MappingProxyType({"best_bid": 0.52, "best_ask": 0.54, "bid_depth_5": 50, "ask_depth_5": 50})
+
+
+_OPP_TEMPLATE = ArbOpportunity(
+    market_id=MARKET_ID,
+    condition_id=CONDITION_ID,
+    yes_token_id=YES_TOKEN,
+    no_token_id=NO_TOKEN,
+    arb_type="buy_merge",
+    yes_price=0.45,
+    no_price=0.48,
+    gross_profit_pct=0.0,
+    net_profit_pct=0.0,
+    max_size=20.0,
+)
+
+
 def _make_opp(arb_type="buy_merge", yes_price=0.45, no_price=0.48, max_size=20.0):
-    """Helper to create an ArbOpportunity."""
+    """Helper to create an ArbOpportunity from the shared template."""
     if arb_type == "buy_merge":
         buy_cost = yes_price + no_price
         gross_profit_pct = ((1.0 - buy_cost) / buy_cost) * 100
-        net_profit_pct = gross_profit_pct - 0.01  # approximate
     else:
         sell_revenue = yes_price + no_price
         gross_profit_pct = (sell_revenue - 1.0) * 100
-        net_profit_pct = gross_profit_pct - 0.01
-    return ArbOpportunity(
-        market_id=MARKET_ID,
-        condition_id=CONDITION_ID,
-        yes_token_id=YES_TOKEN,
-        no_token_id=NO_TOKEN,
+    return dataclasses.replace(
+        _OPP_TEMPLATE,
         arb_type=arb_type,
         yes_price=yes_price,
         no_price=no_price,
         gross_profit_pct=gross_profit_pct,
-        net_profit_pct=net_profit_pct,
+        net_profit_pct=gross_profit_pct - 0.01,  # approximate
         max_size=max_size,
     )
 
@@ -98,7 +172,7 @@ def _make_opp(arb_type="buy_merge", yes_price=0.45, no_price=0.48, max_size=20.0
 class TestAskDepthShares:
     def test_normal_depth(self):
         book = _make_book(best_ask=0.50, ask_depth_5=100)
-        assert _ask_depth_shares(book) == pytest.approx(200.0)
+        assert abs(_ask_depth_shares(book) - 200.0) < 1e-9
 
     def test_zero_ask_depth(self):
         book = _make_book(best_ask=0.50, ask_depth_5=0)
@@ -110,7 +184,7 @@ class TestAskDepthShares:
 
     def test_high_price(self):
         book = _make_book(best_ask=0.95, ask_depth_5=95)
-        assert _ask_depth_shares(book) == pytest.approx(100.0)
+        assert abs(_ask_depth_shares(book) - 100.0) < 1e-9
 
     def test_missing_keys_returns_zero(self):
         book = {}
@@ -125,7 +199,7 @@ class TestAskDepthShares:
 class TestBidDepthShares:
     def test_normal_depth(self):
         book = _make_book(best_bid=0.50, bid_depth_5=100)
-        assert _bid_depth_shares(book) == pytest.approx(200.0)
+        assert abs(_bid_depth_shares(book) - 200.0) < 1e-9
 
     def test_zero_bid_depth(self):
         book = _make_book(best_bid=0.50, bid_depth_5=0)
@@ -145,6 +219,16 @@ class TestBidDepthShares:
         assert _bid_depth_shares(book) == 0.0
 
 
+class _FakeOrderIDObj:
+    """Object-style CLOB response exposing ``orderID``."""
+    orderID = "obj-order-1"
+
+
+class _FakeIDObj:
+    """Object-style CLOB response exposing only ``id``."""
+    id = "obj-id-1"
+
+
 class TestExtractOrderId:
     def test_none_input(self):
         assert _extract_order_id(None) is None
@@ -162,14 +246,10 @@ class TestExtractOrderId:
         assert _extract_order_id({}) is None
 
     def test_object_with_orderID_attribute(self):
-        class FakeResponse:
-            orderID = "obj-order-1"
-        assert _extract_order_id(FakeResponse()) == "obj-order-1"
+        assert _extract_order_id(_FakeOrderIDObj()) == "obj-order-1"
 
     def test_object_with_id_attribute(self):
-        class FakeResponse:
-            id = "obj-id-1"
-        assert _extract_order_id(FakeResponse()) == "obj-id-1"
+        assert _extract_order_id(_FakeIDObj()) == "obj-id-1"
 
     def test_dict_with_empty_orderID_falls_to_id(self):
         # Empty string is falsy, should fall through to 'id'
@@ -184,12 +264,37 @@ class TestExtractOrderId:
 class TestScanForArbitrageNoOpportunity:
     """Cases where scan should return None."""
 
-    def test_no_opportunity_fair_prices(self):
-        """YES_ask + NO_ask >= 1.0 and YES_bid + NO_bid <= 1.0 => no arb."""
-        yes_book = _make_book(best_bid=0.48, best_ask=0.52, bid_depth_5=100, ask_depth_5=100)
-        no_book = _make_book(best_bid=0.45, best_ask=0.50, bid_depth_5=100, ask_depth_5=100)
-        # YES_ask + NO_ask = 0.52 + 0.50 = 1.02 > 1.0 => no buy-merge
-        # YES_bid + NO_bid = 0.48 + 0.45 = 0.93 < 1.0 => no split-sell
+    @pytest.mark.parametrize("yes_book, no_book", [
+        # YES_ask + NO_ask = 1.02 > 1.0 => no buy-merge
+        # YES_bid + NO_bid = 0.93 < 1.0 => no split-sell
+        pytest.param(
+            _make_book(best_bid=0.48, best_ask=0.52, bid_depth_5=100, ask_depth_5=100),
+            _make_book(best_bid=0.45, best_ask=0.50, bid_depth_5=100, ask_depth_5=100),
+            id="fair_prices",
+        ),
+        # Empty dicts: best_ask defaults to 1.0, best_bid to 0.0, and the
+        # zero bids fail the price validation
+        pytest.param({}, {}, id="empty_books"),
+        # Prices <= 0 are rejected by the validation
+        pytest.param(
+            _make_book(best_bid=0.0, best_ask=0.0, bid_depth_5=100, ask_depth_5=100),
+            _make_book(best_bid=0.50, best_ask=0.50, bid_depth_5=100, ask_depth_5=100),
+            id="zero_prices_rejected",
+        ),
+        # cost = 0.50 + 0.50 = 1.00, NOT < 1.0 (buy_cost < 1.0 is strict)
+        pytest.param(
+            _make_book(best_bid=0.49, best_ask=0.50, bid_depth_5=100, ask_depth_5=100),
+            _make_book(best_bid=0.49, best_ask=0.50, bid_depth_5=100, ask_depth_5=100),
+            id="buy_merge_exactly_at_threshold",
+        ),
+        # revenue = 0.50 + 0.50 = 1.00, NOT > 1.0 (sell_revenue > 1.0 is strict)
+        pytest.param(
+            _make_book(best_bid=0.50, best_ask=0.52, bid_depth_5=100, ask_depth_5=100),
+            _make_book(best_bid=0.50, best_ask=0.52, bid_depth_5=100, ask_depth_5=100),
+            id="split_sell_exactly_at_threshold",
+        ),
+    ])
+    def test_no_arb(self, yes_book, no_book):
         result = scan_for_arbitrage(
             yes_book, no_book, MARKET_ID, CONDITION_ID, YES_TOKEN, NO_TOKEN,
         )
@@ -215,25 +320,6 @@ class TestScanForArbitrageNoOpportunity:
         )
         assert result is None
 
-    def test_empty_books(self):
-        # Empty dicts: best_ask defaults to 1.0, best_bid to 0.0
-        # 1.0 + 1.0 = 2.0 > 1.0 => buy_cost not < 1.0
-        # 0.0 + 0.0 = 0.0 < 1.0 => sell_revenue not > 1.0
-        # Also both bids are 0, which fails the price validation
-        result = scan_for_arbitrage(
-            {}, {}, MARKET_ID, CONDITION_ID, YES_TOKEN, NO_TOKEN,
-        )
-        assert result is None
-
-    def test_zero_prices_rejected(self):
-        """Prices <= 0 should be rejected by the validation."""
-        yes_book = _make_book(best_bid=0.0, best_ask=0.0, bid_depth_5=100, ask_depth_5=100)
-        no_book = _make_book(best_bid=0.50, best_ask=0.50, bid_depth_5=100, ask_depth_5=100)
-        result = scan_for_arbitrage(
-            yes_book, no_book, MARKET_ID, CONDITION_ID, YES_TOKEN, NO_TOKEN,
-        )
-        assert result is None
-
 
 class TestScanForArbitrageBuyMerge:
     """Detect buy-merge opportunities: YES_ask + NO_ask < 1.0."""
@@ -241,8 +327,8 @@ class TestScanForArbitrageBuyMerge:
     def test_buy_merge_detected(self):
         """Clear buy-merge opportunity with sufficient depth."""
         # YES ask=0.45, NO ask=0.48 => cost=0.93 < 1.0
-        yes_book = _make_book(best_bid=0.43, best_ask=0.45, bid_depth_5=50, ask_depth_5=50)
-        no_book = _make_book(best_bid=0.46, best_ask=0.48, bid_depth_5=50, ask_depth_5=50)
+        yes_book = BOOK_BUY_MERGE_YES
+        no_book = BOOK_BUY_MERGE_NO
         # YES ask_depth_shares = 50 / 0.45 = 111.1
         # NO ask_depth_shares = 50 / 0.48 = 104.2
         # max_size = min(111.1, 104.2) = 104.2 > MIN_ARB_SIZE
@@ -288,16 +374,6 @@ class TestScanForArbitrageBuyMerge:
         )
         assert result is None
 
-    def test_buy_merge_exactly_at_threshold(self):
-        """Cost exactly 1.0 => no opportunity (buy_cost < 1.0 is strict)."""
-        yes_book = _make_book(best_bid=0.49, best_ask=0.50, bid_depth_5=100, ask_depth_5=100)
-        no_book = _make_book(best_bid=0.49, best_ask=0.50, bid_depth_5=100, ask_depth_5=100)
-        # cost = 0.50 + 0.50 = 1.00, NOT < 1.0
-        result = scan_for_arbitrage(
-            yes_book, no_book, MARKET_ID, CONDITION_ID, YES_TOKEN, NO_TOKEN,
-        )
-        assert result is None
-
     def test_buy_merge_max_size_limited_by_weaker_side(self):
         """max_size should be the minimum of both sides' depth."""
         # YES has large depth, NO has small depth
@@ -310,7 +386,7 @@ class TestScanForArbitrageBuyMerge:
             yes_book, no_book, MARKET_ID, CONDITION_ID, YES_TOKEN, NO_TOKEN,
         )
         assert result is not None
-        assert result.max_size == pytest.approx(10.0 / 0.48, abs=0.1)
+        assert abs(result.max_size - 10.0 / 0.48) < 0.1
 
 
 class TestScanForArbitrageSplitSell:
@@ -319,8 +395,8 @@ class TestScanForArbitrageSplitSell:
     def test_split_sell_detected(self):
         """Clear split-sell opportunity with sufficient depth."""
         # YES bid=0.55, NO bid=0.52 => revenue=1.07 > 1.0
-        yes_book = _make_book(best_bid=0.55, best_ask=0.57, bid_depth_5=50, ask_depth_5=50)
-        no_book = _make_book(best_bid=0.52, best_ask=0.54, bid_depth_5=50, ask_depth_5=50)
+        yes_book = BOOK_SPLIT_SELL_YES
+        no_book = BOOK_SPLIT_SELL_NO
         # YES bid_depth_shares = 50 / 0.55 = 90.9
         # NO bid_depth_shares = 50 / 0.52 = 96.2
         # max_size = min(90.9, 96.2) = 90.9 > MIN_ARB_SIZE
@@ -360,16 +436,6 @@ class TestScanForArbitrageSplitSell:
         )
         assert result is None
 
-    def test_split_sell_exactly_at_threshold(self):
-        """Revenue exactly 1.0 => no opportunity (sell_revenue > 1.0 is strict)."""
-        yes_book = _make_book(best_bid=0.50, best_ask=0.52, bid_depth_5=100, ask_depth_5=100)
-        no_book = _make_book(best_bid=0.50, best_ask=0.52, bid_depth_5=100, ask_depth_5=100)
-        # revenue = 0.50 + 0.50 = 1.00, NOT > 1.0
-        result = scan_for_arbitrage(
-            yes_book, no_book, MARKET_ID, CONDITION_ID, YES_TOKEN, NO_TOKEN,
-        )
-        assert result is None
-
 
 class TestScanForArbitrageEdgeCases:
     """Edge cases and parameter variations."""
@@ -430,8 +496,8 @@ class TestScanForArbitrageEdgeCases:
 
     def test_arb_opportunity_has_detected_at(self):
         """Verify detected_at is populated."""
-        yes_book = _make_book(best_bid=0.43, best_ask=0.45, bid_depth_5=50, ask_depth_5=50)
-        no_book = _make_book(best_bid=0.46, best_ask=0.48, bid_depth_5=50, ask_depth_5=50)
+        yes_book = BOOK_BUY_MERGE_YES
+        no_book = BOOK_BUY_MERGE_NO
         result = scan_for_arbitrage(
             yes_book, no_book, MARKET_ID, CONDITION_ID, YES_TOKEN, NO_TOKEN,
         )
@@ -440,6 +506,52 @@ class TestScanForArbitrageEdgeCases:
         assert result.detected_at.tzinfo is not None
 
 
+class TestScanForArbitrageWorkedExamples:
+    """Fixed books with hand-computed opportunities (depth is the same on both sides)."""
+
+    @pytest.mark.parametrize(
+        "yes_bid, yes_ask, no_bid, no_ask, depth, gas, min_pct, arb_type, size, net_pct", [
+            # cost 0.93; shares min(9/0.45, 9/0.48) = 18.75
+            # net (0.07 * 18.75 - 0.005) / (0.93 * 18.75) = 7.4982%
+            pytest.param(0.44, 0.45, 0.47, 0.48, 9.0, 0.005, 0.5, "buy_merge", 18.75, 7.4982,
+                         id="buy_merge"),
+            # revenue 1.05; shares min(11/0.55, 11/0.50) = 20
+            # net (0.05 * 20 - 0.005) / 20 = 4.975%
+            pytest.param(0.55, 0.56, 0.50, 0.51, 11.0, 0.005, 0.5, "split_sell", 20.0, 4.975,
+                         id="split_sell"),
+            # cost 1.04, revenue 0.96: neither side crosses $1
+            pytest.param(0.48, 0.52, 0.48, 0.52, 50.0, 0.005, 0.5, None, None, None,
+                         id="no_arb"),
+            # shares min(2/0.45, 2/0.48) = 4.17 < MIN_ARB_SIZE
+            pytest.param(0.44, 0.45, 0.47, 0.48, 2.0, 0.005, 0.5, None, None, None,
+                         id="too_thin"),
+            # cost 0.997; shares min(5/0.497, 5/0.50) = 10
+            # net (0.003 * 10 - 0.005) / 9.97 = 0.2508% < 0.5%
+            pytest.param(0.495, 0.497, 0.495, 0.50, 5.0, 0.005, 0.5, None, None, None,
+                         id="gas_eats_edge"),
+            # same book, free gas and no threshold: 0.03 / 9.97 = 0.3009%
+            pytest.param(0.495, 0.497, 0.495, 0.50, 5.0, 0.0, 0.0, "buy_merge", 10.0, 0.3009,
+                         id="free_gas"),
+        ],
+    )
+    def test_expected_opportunity(self, yes_bid, yes_ask, no_bid, no_ask, depth, gas,
+                                  min_pct, arb_type, size, net_pct):
+        result = scan_for_arbitrage(
+            _make_book(yes_bid, yes_ask, depth, depth),
+            _make_book(no_bid, no_ask, depth, depth),
+            MARKET_ID, CONDITION_ID, YES_TOKEN, NO_TOKEN,
+            gas_cost_usd=gas,
+            min_profit_pct=min_pct,
+        )
+        if arb_type is None:
+            assert result is None
+        else:
+            assert result.arb_type == arb_type
+            assert result.max_size == pytest.approx(size)
+            assert result.max_size >= MIN_ARB_SIZE
+            assert result.net_profit_pct == pytest.approx(net_pct, abs=1e-4)
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # execute_arbitrage
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -448,63 +560,70 @@ class TestScanForArbitrageEdgeCases:
 class TestExecuteArbitrage:
     """Tests for the execute_arbitrage orchestrator."""
 
-    @pytest.mark.asyncio
-    async def test_dispatches_buy_merge(self, mock_client, inv_mgr, mm_cfg):
+    @staticmethod
+    def _stub_executor(monkeypatch, name):
+        """Replace mm.arbitrage.<name> with a coroutine recording its args."""
+        calls = []
+
+        async def fake(*args, **kwargs):
+            calls.append(args)
+            return {"success": True}
+
+        monkeypatch.setattr(f"mm.arbitrage.{name}", fake)
+        return calls
+
+    def test_dispatches_buy_merge(self, runner, monkeypatch, mock_client, inv_mgr, mm_cfg):
         """Should call _execute_buy_merge for buy_merge type."""
         opp = _make_opp(arb_type="buy_merge", max_size=20.0)
 
-        with patch("mm.arbitrage._execute_buy_merge", return_value={"success": True}) as mock_bm:
-            result = await execute_arbitrage(opp, mock_client, inv_mgr, mm_cfg)
+        buy_merge_calls = self._stub_executor(monkeypatch, "_execute_buy_merge")
+        result = runner.run(execute_arbitrage(opp, mock_client, inv_mgr, mm_cfg))
 
-        mock_bm.assert_called_once()
+        assert len(buy_merge_calls) == 1
         assert result["arb_type"] == "buy_merge"
         assert result["success"] is True
 
-    @pytest.mark.asyncio
-    async def test_dispatches_split_sell(self, mock_client, inv_mgr, mm_cfg):
+    def test_dispatches_split_sell(self, runner, monkeypatch, mock_client, inv_mgr, mm_cfg):
         """Should call _execute_split_sell for split_sell type."""
         opp = _make_opp(arb_type="split_sell", yes_price=0.55, no_price=0.52, max_size=20.0)
 
-        with patch("mm.arbitrage._execute_split_sell", return_value={"success": True}) as mock_ss:
-            result = await execute_arbitrage(opp, mock_client, inv_mgr, mm_cfg)
+        split_sell_calls = self._stub_executor(monkeypatch, "_execute_split_sell")
+        result = runner.run(execute_arbitrage(opp, mock_client, inv_mgr, mm_cfg))
 
-        mock_ss.assert_called_once()
+        assert len(split_sell_calls) == 1
         assert result["arb_type"] == "split_sell"
         assert result["success"] is True
 
-    @pytest.mark.asyncio
-    async def test_size_capped_at_max(self, mock_client, inv_mgr, mm_cfg):
+    def test_size_capped_at_max(self, runner, monkeypatch, mock_client, inv_mgr, mm_cfg):
         """Size should be capped at mm_arb_max_size_usd."""
         mm_cfg.mm_arb_max_size_usd = 10.0
         opp = _make_opp(arb_type="buy_merge", max_size=100.0)
 
-        with patch("mm.arbitrage._execute_buy_merge", return_value={"success": True}) as mock_bm:
-            result = await execute_arbitrage(opp, mock_client, inv_mgr, mm_cfg)
+        buy_merge_calls = self._stub_executor(monkeypatch, "_execute_buy_merge")
+        result = runner.run(execute_arbitrage(opp, mock_client, inv_mgr, mm_cfg))
 
         # Verify size was capped
         assert result["size"] == 10.0
         # The capped size should be passed to _execute_buy_merge
-        call_args = mock_bm.call_args
-        assert call_args[0][3] == 10.0  # size arg
+        assert buy_merge_calls[0][3] == 10.0  # size arg
 
-    @pytest.mark.asyncio
-    async def test_size_uses_max_size_when_smaller(self, mock_client, inv_mgr, mm_cfg):
+    def test_size_uses_max_size_when_smaller(self, runner, monkeypatch, mock_client, inv_mgr, mm_cfg):
         """When max_size < mm_arb_max_size_usd, use max_size."""
         mm_cfg.mm_arb_max_size_usd = 50.0
         opp = _make_opp(arb_type="buy_merge", max_size=15.0)
 
-        with patch("mm.arbitrage._execute_buy_merge", return_value={"success": True}) as mock_bm:
-            result = await execute_arbitrage(opp, mock_client, inv_mgr, mm_cfg)
+        buy_merge_calls = self._stub_executor(monkeypatch, "_execute_buy_merge")
+        result = runner.run(execute_arbitrage(opp, mock_client, inv_mgr, mm_cfg))
 
         assert result["size"] == 15.0
+        assert buy_merge_calls[0][3] == 15.0  # size arg
 
-    @pytest.mark.asyncio
-    async def test_result_includes_metadata(self, mock_client, inv_mgr, mm_cfg):
+    def test_result_includes_metadata(self, runner, monkeypatch, mock_client, inv_mgr, mm_cfg):
         """Result should include market_id, prices, profit info."""
         opp = _make_opp(arb_type="buy_merge")
 
-        with patch("mm.arbitrage._execute_buy_merge", return_value={"success": True}):
-            result = await execute_arbitrage(opp, mock_client, inv_mgr, mm_cfg)
+        self._stub_executor(monkeypatch, "_execute_buy_merge")
+        result = runner.run(execute_arbitrage(opp, mock_client, inv_mgr, mm_cfg))
 
         assert result["market_id"] == MARKET_ID
         assert result["yes_price"] == opp.yes_price
@@ -519,202 +638,122 @@ class TestExecuteArbitrage:
 # ═══════════════════════════════════════════════════════════════════════════════
 
 
-class TestExecuteBuyMerge:
-    """Tests for the buy-merge execution flow."""
-
-    @pytest.mark.asyncio
-    async def test_successful_buy_merge(self, mock_client, inv_mgr):
-        """Happy path: both buys fill, merge succeeds."""
-        opp = _make_opp(arb_type="buy_merge", yes_price=0.45, no_price=0.48, max_size=20.0)
-
-        # Both orders fill completely
-        mock_client.place_limit_order.side_effect = [
-            {"orderID": "yes-order-1"},
-            {"orderID": "no-order-1"},
-        ]
-        mock_client.is_order_filled.side_effect = [
-            (True, "MATCHED", 20.0, {}),   # YES order
-            (True, "MATCHED", 20.0, {}),   # NO order
-        ]
-        mock_client.merge_positions.return_value = True
-
-        from mm.arbitrage import _execute_buy_merge
-        result = await _execute_buy_merge(opp, mock_client, inv_mgr, 20.0)
-
-        assert result["success"] is True
-        assert result["merged"] == 20.0
-        expected_profit = (1.0 - 0.45 - 0.48) * 20.0
-        assert result["profit_usd"] == pytest.approx(expected_profit, abs=0.01)
-
-        # Verify merge was called
-        mock_client.merge_positions.assert_called_once_with(CONDITION_ID, 20.0)
-
-        # Verify inventory was updated (process_fill for YES and NO, then process_merge)
-        inv = inv_mgr.get(MARKET_ID)
+# Each case queues the two buy responses and the two fill checks, then states
+# the expected result subset, merge calls, cancel count and resulting
+# (YES, NO) inventory. Defaults: size=20.0, merge_ret=True, no merges,
+# no cancels, flat inventory.
+_BUY_MERGE_CASES = [
+    dict(
+        # Happy path: both buys fill, merge succeeds
+        name="successful_buy_merge",
+        orders=[ORDER_YES, ORDER_NO],
+        fills=[FILL_20, FILL_20],
+        expected={
+            "success": True,
+            "merged": 20.0,
+            "profit_usd": pytest.approx((1.0 - 0.45 - 0.48) * 20.0, abs=0.01),
+        },
         # After merge, positions should be 0 (bought 20, merged 20)
-        assert inv.net_position == 0.0
-        assert inv.no_position == 0.0
-
-    @pytest.mark.asyncio
-    async def test_yes_buy_fails(self, mock_client, inv_mgr):
-        """YES buy fails => return error immediately."""
-        opp = _make_opp(arb_type="buy_merge")
+        merges=[(CONDITION_ID, 20.0)],
+    ),
+    dict(
+        # YES buy fails => return error immediately, nothing to cancel
+        name="yes_buy_fails",
+        orders=[None],
+        fills=[],
+        expected={"success": False, "error": "yes_buy_failed"},
+    ),
+    dict(
+        # NO buy fails => cancel YES order and return error
+        name="no_buy_fails_cancels_yes",
+        orders=[ORDER_YES, None],
+        fills=[],
+        expected={"success": False, "error": "no_buy_failed"},
+        cancels=1,
+    ),
+    dict(
+        # Both partial (below MIN_ARB_SIZE) => cancel remainder, track inventory
+        name="partial_fills_below_min",
+        orders=[ORDER_YES, ORDER_NO],
+        fills=[(False, "LIVE", 3.0, {}), (False, "LIVE", 3.0, {})],
+        expected={
+            "success": False,
+            "error": "insufficient_fills",
+            "yes_filled": 3.0,
+            "no_filled": 3.0,
+        },
+        cancels=2,
+        inventory=(3.0, 3.0),
+    ),
+    dict(
+        # YES fills fully, NO barely => merge_amount = min(20, 2) < MIN_ARB_SIZE
+        name="asymmetric_partial_fills",
+        orders=[ORDER_YES, ORDER_NO],
+        fills=[FILL_20, (False, "LIVE", 2.0, {})],
+        expected={"success": False, "error": "insufficient_fills"},
+        cancels=1,
+        inventory=(20.0, 2.0),
+    ),
+    dict(
+        # Both buys succeed but merge fails => tokens held in inventory
+        name="merge_fails_after_buys",
+        orders=[ORDER_YES, ORDER_NO],
+        fills=[FILL_20, FILL_20],
+        merge_ret=False,
+        expected={"success": False, "error": "merge_failed", "tokens_held": 20.0},
+        merges=[(CONDITION_ID, 20.0)],
+        inventory=(20.0, 20.0),
+    ),
+    dict(
+        # Non-round size is rounded to 1 decimal before placing orders
+        name="size_rounding",
+        size=15.567,
+        orders=[ORDER_YES, ORDER_NO],
+        fills=[(True, "MATCHED", 15.6, {}), (True, "MATCHED", 15.6, {})],
+        expected={"success": True},
+        merges=[(CONDITION_ID, 15.6)],
+    ),
+    dict(
+        # YES fill is 0, NO partial => only NO is tracked in inventory
+        name="zero_filled_yes",
+        orders=[ORDER_YES, ORDER_NO],
+        fills=[(False, "LIVE", 0.0, {}), FILL_10],
+        expected={
+            "success": False,
+            "error": "insufficient_fills",
+            "yes_filled": 0.0,
+            "no_filled": 10.0,
+        },
+        cancels=2,
+        inventory=(0.0, 10.0),
+    ),
+]
 
-        mock_client.place_limit_order.return_value = None
 
-        from mm.arbitrage import _execute_buy_merge
-        result = await _execute_buy_merge(opp, mock_client, inv_mgr, 20.0)
-
-        assert result["success"] is False
-        assert result["error"] == "yes_buy_failed"
-        # No cancel should be called since there's nothing to cancel
-        mock_client.cancel_order.assert_not_called()
-
-    @pytest.mark.asyncio
-    async def test_no_buy_fails_cancels_yes(self, mock_client, inv_mgr):
-        """NO buy fails => cancel YES order and return error."""
-        opp = _make_opp(arb_type="buy_merge")
-
-        mock_client.place_limit_order.side_effect = [
-            {"orderID": "yes-order-1"},  # YES succeeds
-            None,                         # NO fails
-        ]
-
-        from mm.arbitrage import _execute_buy_merge
-        result = await _execute_buy_merge(opp, mock_client, inv_mgr, 20.0)
-
-        assert result["success"] is False
-        assert result["error"] == "no_buy_failed"
-
-    @pytest.mark.asyncio
-    async def test_partial_fills_below_min(self, mock_client, inv_mgr):
-        """Both orders fill partially (below MIN_ARB_SIZE) => cancel remainder, track inventory."""
-        opp = _make_opp(arb_type="buy_merge", yes_price=0.45, no_price=0.48, max_size=20.0)
-
-        mock_client.place_limit_order.side_effect = [
-            {"orderID": "yes-order-1"},
-            {"orderID": "no-order-1"},
-        ]
-        # Partial fills: 3 shares each (below MIN_ARB_SIZE=5)
-        mock_client.is_order_filled.side_effect = [
-            (False, "LIVE", 3.0, {}),  # YES partial
-            (False, "LIVE", 3.0, {}),  # NO partial
-        ]
-
-        from mm.arbitrage import _execute_buy_merge
-        result = await _execute_buy_merge(opp, mock_client, inv_mgr, 20.0)
-
-        assert result["success"] is False
-        assert result["error"] == "insufficient_fills"
-        assert result["yes_filled"] == 3.0
-        assert result["no_filled"] == 3.0
-
-        # Cancels should have been called for both unfilled orders
-        assert mock_client.cancel_order.call_count == 2
-
-        # Partial fills should be tracked in inventory
-        inv = inv_mgr.get(MARKET_ID)
-        assert inv.net_position == 3.0
-        assert inv.no_position == 3.0
-
-    @pytest.mark.asyncio
-    async def test_asymmetric_partial_fills(self, mock_client, inv_mgr):
-        """YES fills fully, NO fills partially => merge_amount limited to min."""
-        opp = _make_opp(arb_type="buy_merge", yes_price=0.45, no_price=0.48, max_size=20.0)
+class TestExecuteBuyMerge:
+    """Tests for the buy-merge execution flow."""
 
-        mock_client.place_limit_order.side_effect = [
-            {"orderID": "yes-order-1"},
-            {"orderID": "no-order-1"},
-        ]
-        mock_client.is_order_filled.side_effect = [
-            (True, "MATCHED", 20.0, {}),  # YES fully filled
-            (False, "LIVE", 2.0, {}),      # NO barely filled (< MIN_ARB_SIZE)
-        ]
-
-        from mm.arbitrage import _execute_buy_merge
-        result = await _execute_buy_merge(opp, mock_client, inv_mgr, 20.0)
-
-        # merge_amount = min(20, 2) = 2 < MIN_ARB_SIZE => insufficient
-        assert result["success"] is False
-        assert result["error"] == "insufficient_fills"
-
-    @pytest.mark.asyncio
-    async def test_merge_fails_after_buys(self, mock_client, inv_mgr):
-        """Both buys succeed but merge fails => tokens held in inventory."""
+    def test_buy_merge_scenarios(self, runner, subtests, inv_mgr):
         opp = _make_opp(arb_type="buy_merge", yes_price=0.45, no_price=0.48, max_size=20.0)
-
-        mock_client.place_limit_order.side_effect = [
-            {"orderID": "yes-order-1"},
-            {"orderID": "no-order-1"},
-        ]
-        mock_client.is_order_filled.side_effect = [
-            (True, "MATCHED", 20.0, {}),
-            (True, "MATCHED", 20.0, {}),
-        ]
-        mock_client.merge_positions.return_value = False  # Merge fails
-
-        from mm.arbitrage import _execute_buy_merge
-        result = await _execute_buy_merge(opp, mock_client, inv_mgr, 20.0)
-
-        assert result["success"] is False
-        assert result["error"] == "merge_failed"
-        assert result["tokens_held"] == 20.0
-
-        # Tokens should still be tracked in inventory
-        inv = inv_mgr.get(MARKET_ID)
-        assert inv.net_position == 20.0
-        assert inv.no_position == 20.0
-
-    @pytest.mark.asyncio
-    async def test_size_rounding(self, mock_client, inv_mgr):
-        """Size should be rounded to 1 decimal."""
-        opp = _make_opp(arb_type="buy_merge", max_size=20.0)
-
-        mock_client.place_limit_order.side_effect = [
-            {"orderID": "yes-order-1"},
-            {"orderID": "no-order-1"},
-        ]
-        mock_client.is_order_filled.side_effect = [
-            (True, "MATCHED", 15.6, {}),
-            (True, "MATCHED", 15.6, {}),
-        ]
-        mock_client.merge_positions.return_value = True
-
-        from mm.arbitrage import _execute_buy_merge
-        # Pass a non-round size
-        result = await _execute_buy_merge(opp, mock_client, inv_mgr, 15.567)
-
-        assert result["success"] is True
-        # The shares arg should have been rounded
-        call_args = mock_client.place_limit_order.call_args_list[0]
-        assert call_args[0][2] == 15.6  # size arg rounded to 1 decimal
-
-    @pytest.mark.asyncio
-    async def test_zero_filled_yes(self, mock_client, inv_mgr):
-        """YES fill is 0, NO fill > 0 => merge_amount = 0 < MIN_ARB_SIZE."""
-        opp = _make_opp(arb_type="buy_merge", max_size=20.0)
-
-        mock_client.place_limit_order.side_effect = [
-            {"orderID": "yes-order-1"},
-            {"orderID": "no-order-1"},
-        ]
-        mock_client.is_order_filled.side_effect = [
-            (False, "LIVE", 0.0, {}),   # YES: no fill
-            (False, "LIVE", 10.0, {}),   # NO: partial
-        ]
-
-        from mm.arbitrage import _execute_buy_merge
-        result = await _execute_buy_merge(opp, mock_client, inv_mgr, 20.0)
-
-        assert result["success"] is False
-        assert result["error"] == "insufficient_fills"
-        assert result["yes_filled"] == 0.0
-        assert result["no_filled"] == 10.0
-
-        # Only NO partial should be in inventory (YES was 0)
-        inv = inv_mgr.get(MARKET_ID)
-        assert inv.net_position == 0.0
-        assert inv.no_position == 10.0
+        for case in _BUY_MERGE_CASES:
+            with subtests.test(msg=case["name"]):
+                inv_mgr.reset()
+                client = FakeClient(
+                    orders=case["orders"],
+                    fills=case["fills"],
+                    merge_ret=case.get("merge_ret", True),
+                )
+                size = case.get("size", 20.0)
+
+                result = runner.run(_execute_buy_merge(opp, client, inv_mgr, size))
+
+                expected = case["expected"]
+                assert {k: result.get(k) for k in expected} == expected
+                assert client.place_calls[0][2] == round(size, 1)
+                assert client.merge_calls == case.get("merges", [])
+                assert len(client.cancel_calls) == case.get("cancels", 0)
+                inv = inv_mgr.get(MARKET_ID)
+                assert (inv.net_position, inv.no_position) == case.get("inventory", (0.0, 0.0))
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -725,180 +764,86 @@ class TestExecuteBuyMerge:
 class TestExecuteSplitSell:
     """Tests for the split-sell execution flow."""
 
-    @pytest.mark.asyncio
-    async def test_successful_split_sell(self, mock_client, inv_mgr):
-        """Happy path: split succeeds, both sells fill fully."""
-        opp = _make_opp(
-            arb_type="split_sell", yes_price=0.55, no_price=0.52, max_size=20.0,
-        )
-
-        mock_client.split_position.return_value = True
-        mock_client.place_limit_order.side_effect = [
-            {"orderID": "yes-sell-1"},
-            {"orderID": "no-sell-1"},
-        ]
-        mock_client.is_order_filled.side_effect = [
-            (True, "MATCHED", 20.0, {}),  # YES sell
-            (True, "MATCHED", 20.0, {}),  # NO sell
-        ]
-
-        from mm.arbitrage import _execute_split_sell
-        result = await _execute_split_sell(opp, mock_client, inv_mgr, 20.0)
-
-        assert result["success"] is True
-        assert result["yes_sold"] == 20.0
-        assert result["no_sold"] == 20.0
-        revenue = 20.0 * 0.55 + 20.0 * 0.52
-        cost = 20.0
-        expected_profit = revenue - cost
-        assert result["profit_usd"] == pytest.approx(expected_profit, abs=0.01)
-
-        # Verify split was called
-        mock_client.split_position.assert_called_once_with(CONDITION_ID, 20.0)
-
-    @pytest.mark.asyncio
-    async def test_split_fails(self, mock_client, inv_mgr):
-        """Split fails => return error immediately."""
-        opp = _make_opp(arb_type="split_sell", yes_price=0.55, no_price=0.52)
-
-        mock_client.split_position.return_value = False
-
-        from mm.arbitrage import _execute_split_sell
-        result = await _execute_split_sell(opp, mock_client, inv_mgr, 20.0)
-
-        assert result["success"] is False
-        assert result["error"] == "split_failed"
-        # No orders should have been placed
-        mock_client.place_limit_order.assert_not_called()
-
-    @pytest.mark.asyncio
-    async def test_partial_sells(self, mock_client, inv_mgr):
-        """Split succeeds but sells are partial => partial_fills error."""
-        opp = _make_opp(arb_type="split_sell", yes_price=0.55, no_price=0.52, max_size=20.0)
-
-        mock_client.split_position.return_value = True
-        mock_client.place_limit_order.side_effect = [
-            {"orderID": "yes-sell-1"},
-            {"orderID": "no-sell-1"},
-        ]
-        # Only 50% filled each (below 90% threshold for success)
-        mock_client.is_order_filled.side_effect = [
-            (False, "LIVE", 10.0, {}),  # YES: 50% fill
-            (False, "LIVE", 10.0, {}),  # NO: 50% fill
-        ]
-
-        from mm.arbitrage import _execute_split_sell
-        result = await _execute_split_sell(opp, mock_client, inv_mgr, 20.0)
-
-        assert result["success"] is False
-        assert result["error"] == "partial_fills"
-        assert result["yes_sold"] == 10.0
-        assert result["no_sold"] == 10.0
-        # Profit still calculated
-        assert "profit_usd" in result
-
-    @pytest.mark.asyncio
-    async def test_yes_sell_order_fails(self, mock_client, inv_mgr):
-        """YES sell order returns None but NO sell succeeds."""
-        opp = _make_opp(arb_type="split_sell", yes_price=0.55, no_price=0.52, max_size=20.0)
-
-        mock_client.split_position.return_value = True
-        mock_client.place_limit_order.side_effect = [
-            None,                         # YES sell fails
-            {"orderID": "no-sell-1"},    # NO sell succeeds
-        ]
-        mock_client.is_order_filled.side_effect = [
-            (True, "MATCHED", 20.0, {}),  # NO sell fills
-        ]
-
-        from mm.arbitrage import _execute_split_sell
-        result = await _execute_split_sell(opp, mock_client, inv_mgr, 20.0)
-
-        # YES sold 0, NO sold 20 => partial
-        assert result["success"] is False
-        assert result["error"] == "partial_fills"
-        assert result["yes_sold"] == 0.0
-
-    @pytest.mark.asyncio
-    async def test_both_sell_orders_fail(self, mock_client, inv_mgr):
-        """Both sell orders fail — tokens stuck from split."""
-        opp = _make_opp(arb_type="split_sell", yes_price=0.55, no_price=0.52, max_size=20.0)
-
-        mock_client.split_position.return_value = True
-        mock_client.place_limit_order.side_effect = [None, None]
-
-        from mm.arbitrage import _execute_split_sell
-        result = await _execute_split_sell(opp, mock_client, inv_mgr, 20.0)
-
-        assert result["success"] is False
-        assert result["error"] == "partial_fills"
-        assert result["yes_sold"] == 0.0
-        assert result["no_sold"] == 0.0
-
-    @pytest.mark.asyncio
-    async def test_split_sell_nearly_full_fills_succeeds(self, mock_client, inv_mgr):
-        """Fills at >= 90% of amount should count as success."""
-        opp = _make_opp(arb_type="split_sell", yes_price=0.55, no_price=0.52, max_size=20.0)
-
-        mock_client.split_position.return_value = True
-        mock_client.place_limit_order.side_effect = [
-            {"orderID": "yes-sell-1"},
-            {"orderID": "no-sell-1"},
-        ]
-        # 95% fill — above the 90% threshold
-        mock_client.is_order_filled.side_effect = [
-            (True, "MATCHED", 19.0, {}),   # YES: 95%
-            (True, "MATCHED", 18.5, {}),   # NO: 92.5%
-        ]
-
-        from mm.arbitrage import _execute_split_sell
-        result = await _execute_split_sell(opp, mock_client, inv_mgr, 20.0)
-
-        assert result["success"] is True
-
-    @pytest.mark.asyncio
-    async def test_split_sell_inventory_tracking(self, mock_client, inv_mgr):
-        """Verify inventory is updated with split and sell fills."""
-        opp = _make_opp(arb_type="split_sell", yes_price=0.55, no_price=0.52, max_size=20.0)
-
-        mock_client.split_position.return_value = True
-        mock_client.place_limit_order.side_effect = [
-            {"orderID": "yes-sell-1"},
-            {"orderID": "no-sell-1"},
-        ]
-        mock_client.is_order_filled.side_effect = [
-            (True, "MATCHED", 20.0, {}),
-            (True, "MATCHED", 20.0, {}),
-        ]
-
-        from mm.arbitrage import _execute_split_sell
-        await _execute_split_sell(opp, mock_client, inv_mgr, 20.0)
-
+    @pytest.fixture(scope="class")
+    def split_sell_opp(self):
+        """YES bid 0.55 + NO bid 0.52; read-only, so shared across the class."""
+        return _make_opp(arb_type="split_sell", yes_price=0.55, no_price=0.52, max_size=20.0)
+
+    # Fills at >= 90% of the split amount on both sides count as success.
+    # Inventory is (YES, NO) after the split adds `amount` to both sides
+    # and the sells remove what filled.
+    @pytest.mark.parametrize("split_ret, orders, fills, size, expected, inventory", [
+        pytest.param(
+            True, [ORDER_YES, ORDER_NO], [FILL_20, FILL_20], 20.0,
+            {
+                "success": True,
+                "yes_sold": 20.0,
+                "no_sold": 20.0,
+                "profit_usd": pytest.approx(20.0 * 0.55 + 20.0 * 0.52 - 20.0, abs=0.01),
+            },
+            (0.0, 0.0),
+            id="successful_split_sell",
+        ),
+        pytest.param(
+            False, [], [], 20.0,
+            {"success": False, "error": "split_failed"},
+            (0.0, 0.0),
+            id="split_fails",
+        ),
+        pytest.param(
+            True, [ORDER_YES, ORDER_NO], [FILL_10, FILL_10], 20.0,
+            {"success": False, "error": "partial_fills", "yes_sold": 10.0, "no_sold": 10.0},
+            (10.0, 10.0),
+            id="partial_sells",
+        ),
+        pytest.param(
+            True, [None, ORDER_NO], [FILL_20], 20.0,
+            {"success": False, "error": "partial_fills", "yes_sold": 0.0, "no_sold": 20.0},
+            (20.0, 0.0),
+            id="yes_sell_order_fails",
+        ),
+        pytest.param(
+            True, [None, None], [], 20.0,
+            {"success": False, "error": "partial_fills", "yes_sold": 0.0, "no_sold": 0.0},
+            (20.0, 20.0),
+            id="both_sell_orders_fail",
+        ),
+        pytest.param(
+            True, [ORDER_YES, ORDER_NO],
+            [(True, "MATCHED", 19.0, {}), (True, "MATCHED", 18.5, {})],  # 95% / 92.5%
+            20.0,
+            {"success": True},
+            (1.0, 1.5),
+            id="nearly_full_fills_succeeds",
+        ),
+        pytest.param(
+            True, [ORDER_YES, ORDER_NO],
+            [(True, "MATCHED", 12.3, {}), (True, "MATCHED", 12.3, {})],
+            12.345,
+            {"success": True},
+            (0.0, 0.0),
+            id="size_rounding",
+        ),
+    ])
+    def test_split_sell(
+        self, runner, split_sell_opp, mock_client, inv_mgr,
+        split_ret, orders, fills, size, expected, inventory,
+    ):
+        mock_client.split_ret = split_ret
+        mock_client.place_queue = deque(orders)
+        mock_client.filled_queue = deque(fills)
+
+        result = runner.run(_execute_split_sell(split_sell_opp, mock_client, inv_mgr, size))
+
+        assert {k: result.get(k) for k in expected} == expected
+        # Once the split succeeds a profit figure is reported, even on partial fills
+        assert ("profit_usd" in result) == split_ret
+        # Amount is rounded to 1 decimal before splitting
+        assert mock_client.split_calls == [(CONDITION_ID, round(size, 1))]
+        # No sell orders are placed when the split fails
+        assert len(mock_client.place_calls) == (2 if split_ret else 0)
         inv = inv_mgr.get(MARKET_ID)
-        # Split adds 20 to both sides, sells remove 20 from both sides
-        assert inv.net_position == 0.0
-        assert inv.no_position == 0.0
-
-    @pytest.mark.asyncio
-    async def test_split_sell_size_rounding(self, mock_client, inv_mgr):
-        """Amount should be rounded to 1 decimal."""
-        opp = _make_opp(arb_type="split_sell", yes_price=0.55, no_price=0.52, max_size=20.0)
-
-        mock_client.split_position.return_value = True
-        mock_client.place_limit_order.side_effect = [
-            {"orderID": "yes-sell-1"},
-            {"orderID": "no-sell-1"},
-        ]
-        mock_client.is_order_filled.side_effect = [
-            (True, "MATCHED", 12.3, {}),
-            (True, "MATCHED", 12.3, {}),
-        ]
-
-        from mm.arbitrage import _execute_split_sell
-        result = await _execute_split_sell(opp, mock_client, inv_mgr, 12.345)
-
-        # Split should have been called with rounded amount
-        mock_client.split_position.assert_called_once_with(CONDITION_ID, 12.3)
+        assert (inv.net_position, inv.no_position) == inventory
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -909,11 +854,10 @@ class TestExecuteSplitSell:
 class TestScanAndExecuteIntegration:
     """Verify scan + execute work together correctly."""
 
-    @pytest.mark.asyncio
-    async def test_scan_and_execute_buy_merge(self, mock_client, inv_mgr, mm_cfg):
+    def test_scan_and_execute_buy_merge(self, runner, mock_client, inv_mgr, mm_cfg):
         """Full flow: scan finds buy-merge, execute completes it."""
-        yes_book = _make_book(best_bid=0.43, best_ask=0.45, bid_depth_5=50, ask_depth_5=50)
-        no_book = _make_book(best_bid=0.46, best_ask=0.48, bid_depth_5=50, ask_depth_5=50)
+        yes_book = BOOK_BUY_MERGE_YES
+        no_book = BOOK_BUY_MERGE_NO
 
         opp = scan_for_arbitrage(
             yes_book, no_book, MARKET_ID, CONDITION_ID, YES_TOKEN, NO_TOKEN,
@@ -921,25 +865,21 @@ class TestScanAndExecuteIntegration:
         assert opp is not None
         assert opp.arb_type == "buy_merge"
 
-        mock_client.place_limit_order.side_effect = [
-            {"orderID": "yes-order-1"},
-            {"orderID": "no-order-1"},
-        ]
-        mock_client.is_order_filled.side_effect = [
+        mock_client.place_queue = deque([ORDER_YES, ORDER_NO])
+        mock_client.filled_queue = deque([
             (True, "MATCHED", 50.0, {}),
             (True, "MATCHED", 50.0, {}),
-        ]
-        mock_client.merge_positions.return_value = True
+        ])
+        mock_client.merge_ret = True
 
-        result = await execute_arbitrage(opp, mock_client, inv_mgr, mm_cfg)
+        result = runner.run(execute_arbitrage(opp, mock_client, inv_mgr, mm_cfg))
         assert result["success"] is True
         assert result["arb_type"] == "buy_merge"
 
-    @pytest.mark.asyncio
-    async def test_scan_and_execute_split_sell(self, mock_client, inv_mgr, mm_cfg):
+    def test_scan_and_execute_split_sell(self, runner, mock_client, inv_mgr, mm_cfg):
         """Full flow: scan finds split-sell, execute completes it."""
-        yes_book = _make_book(best_bid=0.55, best_ask=0.57, bid_depth_5=50, ask_depth_5=50)
-        no_book = _make_book(best_bid=0.52, best_ask=0.54, bid_depth_5=50, ask_depth_5=50)
+        yes_book = BOOK_SPLIT_SELL_YES
+        no_book = BOOK_SPLIT_SELL_NO
 
         opp = scan_for_arbitrage(
             yes_book, no_book, MARKET_ID, CONDITION_ID, YES_TOKEN, NO_TOKEN,
@@ -947,22 +887,18 @@ class TestScanAndExecuteIntegration:
         assert opp is not None
         assert opp.arb_type == "split_sell"
 
-        mock_client.split_position.return_value = True
-        mock_client.place_limit_order.side_effect = [
-            {"orderID": "yes-sell-1"},
-            {"orderID": "no-sell-1"},
-        ]
-        mock_client.is_order_filled.side_effect = [
+        mock_client.split_ret = True
+        mock_client.place_queue = deque([ORDER_YES, ORDER_NO])
+        mock_client.filled_queue = deque([
             (True, "MATCHED", 50.0, {}),
             (True, "MATCHED", 50.0, {}),
-        ]
+        ])
 
-        result = await execute_arbitrage(opp, mock_client, inv_mgr, mm_cfg)
+        result = runner.run(execute_arbitrage(opp, mock_client, inv_mgr, mm_cfg))
         assert result["success"] is True
         assert result["arb_type"] == "split_sell"
 
-    @pytest.mark.asyncio
-    async def test_no_opportunity_means_no_execution(self, mock_client, inv_mgr, mm_cfg):
+    def test_no_opportunity_means_no_execution(self, mock_client, inv_mgr, mm_cfg):
         """When scan returns None, there is nothing to execute."""
         yes_book = _make_book(best_bid=0.48, best_ask=0.52, bid_depth_5=100, ask_depth_5=100)
         no_book = _make_book(best_bid=0.45, best_ask=0.50, bid_depth_5=100, ask_depth_5=100)
@@ -1013,3 +949,9 @@ class TestArbOpportunityDataclass:
         # detected_at should be auto-populated with UTC datetime
         assert isinstance(opp.detected_at, datetime)
         assert opp.detected_at.tzinfo is not None
+
+    def test_frozen(self):
+        opp = _make_opp()
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            opp.max_size = 1.0
+        assert not hasattr(opp, "__dict__")
@@ -1,6 +1,6 @@
 """Tests for mm/engine.py — pricing, skew, VolTracker, StaleTracker."""
 
-import time
+from math import isclose
 
 import pytest
 from mm.engine import (
@@ -8,11 +8,17 @@ from mm.engine import (
     compute_dynamic_delta,
     compute_bid_ask,
     compute_quote_size,
+    compute_weighted_mid,
     round_to_tick,
+    StaleTracker,
     VolTracker,
 )
 
 
+def _close(a, b, abs_=1e-9, rel=1e-9):
+    assert isclose(a, b, abs_tol=abs_, rel_tol=rel), (a, b)
+
+
 class TestComputeSkewNonLinear:
     """Tests for non-linear skew with quadratic component."""
 
@@ -160,38 +166,47 @@ class TestStaleTracker:
     """Tests for mm.engine.StaleTracker."""
 
     @pytest.fixture
-    def tracker(self):
-        from mm.engine import StaleTracker
-        return StaleTracker(threshold_seconds=60.0)
+    def clock(self):
+        """Frozen monotonic clock; tests advance clock[0] explicitly."""
+        return [1000.0]
+
+    @pytest.fixture
+    def tracker(self, clock):
+        return StaleTracker(threshold_seconds=60.0, time_fn=lambda: clock[0])
 
     def test_fresh_after_update(self, tracker):
         tracker.update_if_changed("m1", 0.50)
-        assert tracker.get_staleness("m1") == pytest.approx(0.0, abs=0.05)
+        assert tracker.get_staleness("m1") == 0.0
 
-    def test_stale_after_threshold(self, tracker):
+    def test_stale_after_threshold(self, tracker, clock):
         tracker.update_if_changed("m1", 0.50)
-        # Simulate time passing by manipulating internal state
-        tracker._last_change["m1"] = time.monotonic() - 60.0
-        assert tracker.get_staleness("m1") == pytest.approx(1.0, abs=0.05)
+        clock[0] += 60.0
+        assert tracker.get_staleness("m1") == 1.0
 
-    def test_half_stale(self, tracker):
+    def test_half_stale(self, tracker, clock):
         tracker.update_if_changed("m1", 0.50)
-        tracker._last_change["m1"] = time.monotonic() - 30.0
-        staleness = tracker.get_staleness("m1")
-        assert 0.4 <= staleness <= 0.6
+        clock[0] += 30.0
+        assert tracker.get_staleness("m1") == 0.5
 
     def test_reset_clears(self, tracker):
         tracker.update_if_changed("m1", 0.50)
         tracker.reset("m1")
         assert tracker.get_staleness("m1") == 0.0
 
-    def test_price_change_resets_staleness(self, tracker):
+    def test_unchanged_mid_keeps_aging(self, tracker, clock):
         tracker.update_if_changed("m1", 0.50)
-        tracker._last_change["m1"] = time.monotonic() - 60.0
-        assert tracker.get_staleness("m1") >= 0.9
+        clock[0] += 30.0
+        tracker.update_if_changed("m1", 0.50)
+        clock[0] += 15.0
+        assert tracker.get_staleness("m1") == 0.75
+
+    def test_price_change_resets_staleness(self, tracker, clock):
+        tracker.update_if_changed("m1", 0.50)
+        clock[0] += 60.0
+        assert tracker.get_staleness("m1") == 1.0
         # Price changes -> should reset to fresh
         tracker.update_if_changed("m1", 0.55)
-        assert tracker.get_staleness("m1") == pytest.approx(0.0, abs=0.05)
+        assert tracker.get_staleness("m1") == 0.0
 
     def test_unknown_market(self, tracker):
         assert tracker.get_staleness("unknown") == 0.0
@@ -205,13 +220,11 @@ class TestVWAPMid:
     """Tests for compute_weighted_mid."""
 
     def test_balanced_book(self):
-        from mm.engine import compute_weighted_mid
         book = {"best_bid": 0.50, "best_ask": 0.52, "bid_depth_5": 100, "ask_depth_5": 100}
         mid = compute_weighted_mid(book)
-        assert mid == pytest.approx(0.51)
+        _close(mid, 0.51)
 
     def test_heavier_bid_side(self):
-        from mm.engine import compute_weighted_mid
         book = {"best_bid": 0.50, "best_ask": 0.52, "bid_depth_5": 200, "ask_depth_5": 100}
         mid = compute_weighted_mid(book)
         # More bid depth -> mid closer to ask
@@ -219,18 +232,15 @@ class TestVWAPMid:
         assert mid > 0.51
 
     def test_no_depth_returns_simple_mid(self):
-        from mm.engine import compute_weighted_mid
         book = {"best_bid": 0.50, "best_ask": 0.52, "bid_depth_5": 0, "ask_depth_5": 0}
         mid = compute_weighted_mid(book)
-        assert mid == pytest.approx(0.51)
+        _close(mid, 0.51)
 
     def test_invalid_prices_returns_none(self):
-        from mm.engine import compute_weighted_mid
         book = {"best_bid": 0, "best_ask": 0, "bid_depth_5": 100, "ask_depth_5": 100}
         assert compute_weighted_mid(book) is None
 
     def test_crossed_book_returns_none(self):
-        from mm.engine import compute_weighted_mid
         book = {"best_bid": 0.55, "best_ask": 0.50, "bid_depth_5": 100, "ask_depth_5": 100}
         assert compute_weighted_mid(book) is None
 
@@ -243,19 +253,16 @@ class TestVolTrackerAdditional:
     """Additional VolTracker tests for 5A coverage."""
 
     def test_first_observation_returns_zero(self):
-        from mm.engine import VolTracker
         vt = VolTracker(halflife=20)
         assert vt.update("m1", 0.50) == 0.0
 
     def test_second_observation_returns_positive(self):
-        from mm.engine import VolTracker
         vt = VolTracker(halflife=20)
         vt.update("m1", 0.50)
         vol = vt.update("m1", 0.52)
         assert vol > 0
 
     def test_reset_clears(self):
-        from mm.engine import VolTracker
         vt = VolTracker(halflife=20)
         vt.update("m1", 0.50)
         vt.update("m1", 0.55)
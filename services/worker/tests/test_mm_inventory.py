@@ -1,10 +1,19 @@
 """Tests for mm/inventory.py — YES + NO inventory tracking."""
 
+import datetime
+import sys
+import time
+from math import isclose
+
 import pytest
 from mm.inventory import InventoryManager, MarketInventory
 from config import MarketMakingConfig
 
 
+def _aeq(a, b, rel=1e-6, abs_=1e-9):
+    assert isclose(a, b, rel_tol=rel, abs_tol=abs_), (a, b)
+
+
 @pytest.fixture
 def inv_mgr():
     return InventoryManager(MarketMakingConfig())
@@ -23,6 +32,12 @@ class TestMarketInventory:
         inv = MarketInventory(market_id="m1", token_id="t1")
         assert inv.mergeable_pairs == 0.0
 
+    def test_no_instance_dict(self):
+        inv = MarketInventory(market_id="m1", token_id="t1")
+        assert not hasattr(inv, "__dict__")
+        with pytest.raises(AttributeError):
+            inv.unknown_field = 1.0
+
 
 class TestInventoryManagerGet:
     def test_creates_new_inventory(self, inv_mgr):
@@ -31,6 +46,12 @@ class TestInventoryManagerGet:
         assert inv.net_position == 0.0
         assert inv.no_position == 0.0
 
+    def test_interns_new_market_ids(self, inv_mgr):
+        market_id = "".join(["0xabc", "def"])  # built at runtime, not a literal
+        inv = inv_mgr.get(market_id)
+        assert inv.market_id is sys.intern("0xabcdef")
+        assert inv_mgr.get("0xabcdef") is inv
+
     def test_returns_existing_inventory(self, inv_mgr):
         inv1 = inv_mgr.get("m1")
         inv1.net_position = 5.0
@@ -61,7 +82,7 @@ class TestProcessFill:
         inv = inv_mgr.get("m1")
         assert inv.net_position == 5.0
         # PnL: 5 * (0.60 - 0.50) = 0.50
-        assert inv.realized_pnl == pytest.approx(0.50)
+        _aeq(inv.realized_pnl, 0.50)
 
     def test_sell_no_computes_pnl(self, inv_mgr):
         inv_mgr.process_fill("m1", "tok-no", "BUY", 0.40, 10.0, is_no_token=True)
@@ -69,7 +90,7 @@ class TestProcessFill:
         inv = inv_mgr.get("m1")
         assert inv.no_position == 6.0
         # PnL: 4 * (0.55 - 0.40) = 0.60
-        assert inv.no_realized_pnl == pytest.approx(0.60)
+        _aeq(inv.no_realized_pnl, 0.60)
 
     def test_multiple_buys_average_price(self, inv_mgr):
         inv_mgr.process_fill("m1", "tok-yes", "BUY", 0.50, 10.0)
@@ -77,7 +98,7 @@ class TestProcessFill:
         inv = inv_mgr.get("m1")
         assert inv.net_position == 20.0
         # Avg: (0.50*10 + 0.60*10) / 20 = 0.55
-        assert inv.avg_entry_price == pytest.approx(0.55)
+        _aeq(inv.avg_entry_price, 0.55)
 
 
 class TestProcessMerge:
@@ -121,7 +142,7 @@ class TestExposureAndPnl:
     def test_total_exposure_yes_and_no(self, inv_mgr):
         inv_mgr.process_split("m1", 10.0, "yes-tok", "no-tok")
         # YES: 10 * 0.50 = 5.0, NO: 10 * 0.50 = 5.0 -> total = 10.0
-        assert inv_mgr.get_total_exposure() == pytest.approx(10.0)
+        _aeq(inv_mgr.get_total_exposure(), 10.0)
 
     def test_total_realized_pnl(self, inv_mgr):
         inv_mgr.process_fill("m1", "yes", "BUY", 0.50, 10.0)
@@ -130,7 +151,50 @@ class TestExposureAndPnl:
         inv_mgr.process_fill("m1", "no", "SELL", 0.50, 10.0, is_no_token=True)
         # YES PnL: 10 * (0.60 - 0.50) = 1.0
         # NO PnL: 10 * (0.50 - 0.40) = 1.0
-        assert inv_mgr.get_total_realized_pnl() == pytest.approx(2.0)
+        _aeq(inv_mgr.get_total_realized_pnl(), 2.0)
+
+    def test_total_realized_pnl_after_load_and_fill(self, inv_mgr):
+        inv_mgr.load_from_db([
+            {"market_id": "m1", "token_id": "yes", "net_position": 10.0,
+             "avg_entry_price": 0.50, "realized_pnl": 1.5},
+            {"market_id": "m2", "token_id": "t2", "net_position": 0.0,
+             "avg_entry_price": 0.0, "realized_pnl": -0.5},
+        ])
+        _aeq(inv_mgr.get_total_realized_pnl(), 1.0)
+        inv_mgr.process_fill("m1", "yes", "SELL", 0.60, 10.0)
+        # + 10 * (0.60 - 0.50) = 1.0
+        _aeq(inv_mgr.get_total_realized_pnl(), 2.0)
+
+    def test_running_total_matches_fresh_sum(self, inv_mgr):
+        """Fills, merge, split and reconcile keep the running total in sync."""
+        inv_mgr.process_fill("m1", "yes", "BUY", 0.50, 10.0)
+        inv_mgr.process_fill("m1", "no", "BUY", 0.40, 10.0, is_no_token=True)
+        inv_mgr.process_merge("m1", 4.0)
+        inv_mgr.process_fill("m1", "yes", "SELL", 0.65, 3.0)
+        inv_mgr.process_split("m2", 8.0, "yes2", "no2")
+        inv_mgr.process_fill("m2", "no2", "SELL", 0.45, 5.0, is_no_token=True)
+        inv_mgr.reconcile_with_clob([
+            {"market_id": "m1", "token_id": "yes", "net_position": 1.0,
+             "avg_entry_price": 0.50, "realized_pnl": 0.0},
+            {"market_id": "m3", "token_id": "yes3", "net_position": 6.0,
+             "avg_entry_price": 0.30, "realized_pnl": 0.75},
+        ])
+        inv_mgr.process_fill("m3", "yes3", "SELL", 0.35, 6.0)
+        inv_mgr.process_fill("m1", "no", "SELL", 0.30, 2.0, is_no_token=True)
+
+        fresh = sum(
+            inv.realized_pnl + inv.no_realized_pnl for inv in inv_mgr._inventory.values()
+        )
+        _aeq(inv_mgr.get_total_realized_pnl(), fresh)
+        # 3*(0.65-0.50) + 5*(0.45-0.50) + 0.75 + 6*(0.35-0.30) + 2*(0.30-0.40)
+        _aeq(fresh, 0.45 - 0.25 + 0.75 + 0.30 - 0.20)
+
+    def test_reset_clears_positions_and_pnl(self, inv_mgr):
+        inv_mgr.process_fill("m1", "yes", "BUY", 0.50, 10.0)
+        inv_mgr.process_fill("m1", "yes", "SELL", 0.60, 5.0)
+        inv_mgr.reset()
+        assert inv_mgr.get_all_positions() == []
+        assert inv_mgr.get_total_realized_pnl() == 0.0
 
 
 class TestCapacityAndSkew:
@@ -156,7 +220,7 @@ class TestCapacityAndSkew:
         inv.no_position = 2.0
         inv.no_avg_entry_price = 0.50
         # skew = (10*0.50 - 2*0.50) / 10 = 0.40
-        assert inv_mgr.get_skew_direction("m1", 10.0) == pytest.approx(0.40)
+        _aeq(inv_mgr.get_skew_direction("m1", 10.0), 0.40)
 
     def test_skew_direction_long_no(self, inv_mgr):
         inv = inv_mgr.get("m1")
@@ -165,7 +229,7 @@ class TestCapacityAndSkew:
         inv.no_position = 10.0
         inv.no_avg_entry_price = 0.50
         # skew = (2*0.50 - 10*0.50) / 10 = -0.40
-        assert inv_mgr.get_skew_direction("m1", 10.0) == pytest.approx(-0.40)
+        _aeq(inv_mgr.get_skew_direction("m1", 10.0), -0.40)
 
 
 class TestGetMergeAmount:
@@ -226,8 +290,10 @@ class TestPositionAge:
     def test_opened_at_reset_on_full_close(self, inv_mgr):
         inv_mgr.process_fill("m1", "tok", "BUY", 0.50, 10.0)
         assert inv_mgr.get("m1").opened_at is not None
+        assert inv_mgr.get("m1").opened_at_mono is not None
         inv_mgr.process_fill("m1", "tok", "SELL", 0.60, 10.0)
         assert inv_mgr.get("m1").opened_at is None
+        assert inv_mgr.get("m1").opened_at_mono is None
 
     def test_opened_at_persists_on_partial_close(self, inv_mgr):
         inv_mgr.process_fill("m1", "tok", "BUY", 0.50, 10.0)
@@ -249,7 +315,6 @@ class TestUnwindUrgency:
         assert inv_mgr.get_unwind_urgency("m1") < 0.01
 
     def test_urgency_capped_at_one(self, inv_mgr):
-        import datetime
         inv = inv_mgr.get("m1")
         inv.net_position = 10.0
         inv.opened_at = datetime.datetime(2020, 1, 1, tzinfo=datetime.timezone.utc)
@@ -257,14 +322,21 @@ class TestUnwindUrgency:
         assert inv_mgr.get_unwind_urgency("m1", max_hours=24.0) == 1.0
 
     def test_urgency_scales_linearly(self, inv_mgr):
-        import datetime
         inv = inv_mgr.get("m1")
         inv.net_position = 10.0
-        # Set opened_at to 12 hours ago
-        inv.opened_at = datetime.datetime.now(datetime.timezone.utc) - datetime.timedelta(hours=12)
+        # Set the monotonic open stamp to 12 hours ago
+        inv.opened_at_mono = time.monotonic_ns() - int(12 * 3.6e12)
         urgency = inv_mgr.get_unwind_urgency("m1", max_hours=24.0)
         assert 0.45 <= urgency <= 0.55  # Should be ~0.5
 
+    def test_urgency_falls_back_to_opened_at(self, inv_mgr):
+        inv = inv_mgr.get("m1")
+        inv.net_position = 10.0
+        # No monotonic stamp (e.g. restored position): wall-clock open time is used
+        inv.opened_at = datetime.datetime.now(datetime.timezone.utc) - datetime.timedelta(hours=12)
+        urgency = inv_mgr.get_unwind_urgency("m1", max_hours=24.0)
+        assert 0.45 <= urgency <= 0.55
+
 
 # ═══════════════════════════════════════════════════════════════════════
 # load_from_db YES+NO grouping (5A)
@@ -273,25 +345,20 @@ class TestUnwindUrgency:
 class TestLoadFromDB:
     """Tests for InventoryManager.load_from_db."""
 
-    @pytest.fixture
-    def manager(self, mm_config):
-        from mm.inventory import InventoryManager
-        return InventoryManager(mm_config)
-
-    def test_load_single_record(self, manager):
+    def test_load_single_record(self, inv_mgr):
         """Single record per market -> YES only."""
         db_inv = [
             {"market_id": "m1", "token_id": "yes_tok", "net_position": 10.0,
              "avg_entry_price": 0.50, "realized_pnl": 0.5},
         ]
-        manager.load_from_db(db_inv)
-        inv = manager.get("m1")
+        inv_mgr.load_from_db(db_inv)
+        inv = inv_mgr.get("m1")
         assert inv.net_position == 10.0
         assert inv.token_id == "yes_tok"
         assert inv.avg_entry_price == 0.50
         assert inv.no_position == 0.0
 
-    def test_load_yes_and_no(self, manager):
+    def test_load_yes_and_no(self, inv_mgr):
         """Two records for same market -> YES + NO restored."""
         db_inv = [
             {"market_id": "m1", "token_id": "yes_tok", "net_position": 10.0,
@@ -299,15 +366,15 @@ class TestLoadFromDB:
             {"market_id": "m1", "token_id": "no_tok", "net_position": 8.0,
              "avg_entry_price": 0.45, "realized_pnl": 0.2},
         ]
-        manager.load_from_db(db_inv)
-        inv = manager.get("m1")
+        inv_mgr.load_from_db(db_inv)
+        inv = inv_mgr.get("m1")
         assert inv.net_position == 10.0
         assert inv.token_id == "yes_tok"
         assert inv.no_position == 8.0
         assert inv.no_token_id == "no_tok"
         assert inv.no_avg_entry_price == 0.45
 
-    def test_load_multiple_markets(self, manager):
+    def test_load_multiple_markets(self, inv_mgr):
         """Multiple markets each with single record."""
         db_inv = [
             {"market_id": "m1", "token_id": "t1", "net_position": 5.0,
@@ -315,9 +382,9 @@ class TestLoadFromDB:
             {"market_id": "m2", "token_id": "t2", "net_position": 3.0,
              "avg_entry_price": 0.60, "realized_pnl": 1.0},
         ]
-        manager.load_from_db(db_inv)
-        assert manager.get("m1").net_position == 5.0
-        assert manager.get("m2").net_position == 3.0
+        inv_mgr.load_from_db(db_inv)
+        assert inv_mgr.get("m1").net_position == 5.0
+        assert inv_mgr.get("m2").net_position == 3.0
 
 
 # ═══════════════════════════════════════════════════════════════════════
@@ -327,14 +394,9 @@ class TestLoadFromDB:
 class TestReconcileWithCLOB:
     """Tests for InventoryManager.reconcile_with_clob."""
 
-    @pytest.fixture
-    def manager(self, mm_config):
-        from mm.inventory import InventoryManager
-        return InventoryManager(mm_config)
-
-    def test_no_divergence(self, manager):
+    def test_no_divergence(self, inv_mgr):
         """Matching positions should return no divergences."""
-        manager.load_from_db([
+        inv_mgr.load_from_db([
             {"market_id": "m1", "token_id": "t1", "net_position": 10.0,
              "avg_entry_price": 0.50, "realized_pnl": 0.0},
         ])
@@ -342,12 +404,12 @@ class TestReconcileWithCLOB:
             {"market_id": "m1", "token_id": "t1", "net_position": 10.0,
              "avg_entry_price": 0.50, "realized_pnl": 0.0},
         ]
-        divs = manager.reconcile_with_clob(db_inv)
+        divs = inv_mgr.reconcile_with_clob(db_inv)
         assert len(divs) == 0
 
-    def test_yes_divergence_corrected(self, manager):
+    def test_yes_divergence_corrected(self, inv_mgr):
         """YES position divergence should be auto-corrected."""
-        manager.load_from_db([
+        inv_mgr.load_from_db([
             {"market_id": "m1", "token_id": "t1", "net_position": 10.0,
              "avg_entry_price": 0.50, "realized_pnl": 0.0},
         ])
@@ -355,14 +417,14 @@ class TestReconcileWithCLOB:
             {"market_id": "m1", "token_id": "t1", "net_position": 15.0,
              "avg_entry_price": 0.50, "realized_pnl": 0.0},
         ]
-        divs = manager.reconcile_with_clob(db_inv)
+        divs = inv_mgr.reconcile_with_clob(db_inv)
         assert len(divs) == 1
         assert divs[0]["side"] == "YES"
-        assert manager.get("m1").net_position == 15.0
+        assert inv_mgr.get("m1").net_position == 15.0
 
-    def test_no_divergence_corrected(self, manager):
+    def test_no_divergence_corrected(self, inv_mgr):
         """NO position divergence should be auto-corrected."""
-        manager.load_from_db([
+        inv_mgr.load_from_db([
             {"market_id": "m1", "token_id": "yes_tok", "net_position": 10.0,
              "avg_entry_price": 0.50, "realized_pnl": 0.0},
             {"market_id": "m1", "token_id": "no_tok", "net_position": 5.0,
@@ -374,7 +436,7 @@ class TestReconcileWithCLOB:
             {"market_id": "m1", "token_id": "no_tok", "net_position": 8.0,
              "avg_entry_price": 0.45, "realized_pnl": 0.0},
         ]
-        divs = manager.reconcile_with_clob(db_inv)
+        divs = inv_mgr.reconcile_with_clob(db_inv)
         assert len(divs) == 1
         assert divs[0]["side"] == "NO"
-        assert manager.get("m1").no_position == 8.0
+        assert inv_mgr.get("m1").no_position == 8.0
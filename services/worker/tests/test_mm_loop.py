@@ -1,10 +1,32 @@
 """Tests for MM loop helper logic (cooldown + cross-reject detection + capital budgeting)."""
 
-from unittest.mock import MagicMock
-from mm.loop import _cooldown_seconds_for_streak, _is_cross_reject_failure, _compute_locked_capital, _should_cancel_for_requote
+import datetime
+from dataclasses import dataclass
+from math import isclose
+
+import pytest
+
+from mm.loop import (
+    _cooldown_seconds_for_streak, _is_cross_reject_failure, _compute_locked_capital,
+    _should_cancel_for_requote, build_locked_capital_fn, _rebuild_active_quotes_from_clob,
+    _locked_capital_generic, _UNROLL_MAX_QUOTES,
+)
+from mm.inventory import InventoryManager
 from mm.state import QuotePair, OrderState
 
 
+@pytest.fixture
+def manager(mm_config):
+    return InventoryManager(mm_config)
+
+
+@dataclass(slots=True, frozen=True)
+class _MMCfgStub:
+    """The two MarketMakingConfig fields read by _should_cancel_for_requote."""
+    mm_min_quote_lifetime_seconds: int
+    mm_requote_threshold: float
+
+
 def test_is_cross_reject_failure_detects_bid_error():
     failure = {"bid_error": {"code": "post_only_cross"}, "ask_error": None}
     assert _is_cross_reject_failure(failure) is True
@@ -58,7 +80,7 @@ def test_locked_capital_bid_only():
     pair = _make_pair(ask_order_id=None, ask_state=OrderState.CANCELLED)
     result = _compute_locked_capital({"m1": pair})
     # BID: 100 * 0.40 = 40.0
-    assert abs(result - 40.0) < 0.01
+    assert isclose(result, 40.0, abs_tol=0.01)
 
 
 def test_locked_capital_ask_only():
@@ -72,7 +94,7 @@ def test_locked_capital_bid_and_ask():
     pair = _make_pair()
     result = _compute_locked_capital({"m1": pair})
     # Only BID locks USDC: 100 * 0.40 = 40.0 (ASK sells tokens, no USDC locked)
-    assert abs(result - 40.0) < 0.01
+    assert isclose(result, 40.0, abs_tol=0.01)
 
 
 def test_locked_capital_multiple_markets():
@@ -80,7 +102,7 @@ def test_locked_capital_multiple_markets():
     pair2 = _make_pair(market_id="m2", bid_price=0.50, ask_price=0.60, size=100.0)
     result = _compute_locked_capital({"m1": pair1, "m2": pair2})
     # Only BIDs lock USDC: m1 BID: 50*0.30=15, m2 BID: 100*0.50=50 -> total 65
-    assert abs(result - 65.0) < 0.01
+    assert isclose(result, 65.0, abs_tol=0.01)
 
 
 def test_locked_capital_ignores_filled_and_cancelled():
@@ -93,14 +115,14 @@ def test_locked_capital_counts_partial_orders():
     pair = _make_pair(bid_state=OrderState.PARTIAL, ask_state=OrderState.PARTIAL)
     result = _compute_locked_capital({"m1": pair})
     # Only BID locks USDC: 100 * 0.40 = 40.0
-    assert abs(result - 40.0) < 0.01
+    assert isclose(result, 40.0, abs_tol=0.01)
 
 
 def test_locked_capital_counts_new_orders():
     pair = _make_pair(bid_state=OrderState.NEW, ask_state=OrderState.NEW)
     result = _compute_locked_capital({"m1": pair})
     # Only BID locks USDC: 100 * 0.40 = 40.0
-    assert abs(result - 40.0) < 0.01
+    assert isclose(result, 40.0, abs_tol=0.01)
 
 
 def test_locked_capital_no_order_id_means_no_lock():
@@ -127,7 +149,47 @@ def test_locked_capital_asymmetric_bid_ask_sizes():
     )
     result = _compute_locked_capital({"m1": pair})
     # Only BID locks USDC: 80 * 0.40 = 32.0 (ASK sells tokens, no USDC locked)
-    assert abs(result - 32.0) < 0.01
+    assert isclose(result, 32.0, abs_tol=0.01)
+
+
+def test_locked_capital_many_markets_mixed_states():
+    states = [OrderState.LIVE, OrderState.PARTIAL, OrderState.NEW, OrderState.FILLED, OrderState.CANCELLED]
+    quotes = {
+        f"m{i}": _make_pair(market_id=f"m{i}", bid_price=0.01 * (i % 90 + 5), size=10.0 + i,
+                            bid_state=states[i % len(states)])
+        for i in range(200)
+    }
+    expected = sum(
+        (10.0 + i) * 0.01 * (i % 90 + 5) for i in range(200) if i % len(states) < 3
+    )
+    assert isclose(_compute_locked_capital(quotes), expected, rel_tol=1e-9)
+
+
+# (bid_order_id, bid_state) legs cycled through the unrolled-vs-generic parity books
+_PARITY_LEGS = [
+    ("b", OrderState.LIVE),
+    (None, OrderState.LIVE),
+    ("b", OrderState.UNKNOWN),
+    ("b", OrderState.FILLED),
+    ("b", OrderState.NEW),
+    ("b", OrderState.CANCELLED),
+    ("b", OrderState.PARTIAL),
+]
+
+
+@pytest.mark.parametrize("n", range(_UNROLL_MAX_QUOTES + 1))
+def test_build_locked_capital_fn_matches_generic_path(n):
+    quotes = {}
+    for i in range(n):
+        order_id, state = _PARITY_LEGS[i % len(_PARITY_LEGS)]
+        quotes[f"m{i}"] = _make_pair(
+            market_id=f"m{i}", bid_price=0.10 + 0.05 * (i % 15), size=5.0 * (i + 1),
+            bid_order_id=order_id and f"{order_id}{i}", bid_state=state,
+        )
+    fn = build_locked_capital_fn(n)
+    assert fn is build_locked_capital_fn(n)
+    assert isclose(fn(quotes), _locked_capital_generic(quotes), rel_tol=1e-12)
+    assert _compute_locked_capital(quotes) == fn(quotes)
 
 
 # ─── _should_cancel_for_requote tests ───
@@ -136,22 +198,17 @@ def test_locked_capital_asymmetric_bid_ask_sizes():
 def test_should_cancel_for_requote_too_young():
     """Quotes younger than mm_min_quote_lifetime_seconds should not be requoted."""
     pair = _make_pair()
-    mm_cfg = MagicMock()
-    mm_cfg.mm_min_quote_lifetime_seconds = 10
-    mm_cfg.mm_requote_threshold = 0.01
+    mm_cfg = _MMCfgStub(10, 0.01)
     # Pair was just created, age ~0s
     assert _should_cancel_for_requote(pair, 0.55, mm_cfg) is False
 
 
 def test_should_cancel_for_requote_old_enough_and_moved():
     """Old enough quote with moved mid should be requoted."""
-    import datetime
     pair = _make_pair(bid_price=0.40, ask_price=0.60)
     # Make pair old enough
     pair.created_at = datetime.datetime(2020, 1, 1, tzinfo=datetime.timezone.utc)
-    mm_cfg = MagicMock()
-    mm_cfg.mm_min_quote_lifetime_seconds = 10
-    mm_cfg.mm_requote_threshold = 0.01
+    mm_cfg = _MMCfgStub(10, 0.01)
     # Mid moved significantly from 0.50
     assert _should_cancel_for_requote(pair, 0.55, mm_cfg) is True
 
@@ -160,66 +217,59 @@ def test_should_cancel_for_requote_old_enough_and_moved():
 # _rebuild_active_quotes_from_clob (5A)
 # ═══════════════════════════════════════════════════════════════════════
 
-import asyncio
-from unittest.mock import AsyncMock, patch
-import pytest
+class _ClientStub:
+    """Just the two PolymarketClient calls _rebuild_active_quotes_from_clob makes."""
+
+    __slots__ = ("_open", "cancel_calls")
+
+    def __init__(self, open_orders=()):
+        self._open = list(open_orders)
+        self.cancel_calls: list[str] = []
 
+    def get_open_orders(self):
+        return self._open
 
-def run(coro):
-    return asyncio.run(coro)
+    def cancel_order(self, order_id):
+        self.cancel_calls.append(order_id)
+        return True
+
+
+def _stub_db_quotes(monkeypatch, quotes):
+    async def get_active_mm_quotes():
+        return quotes
+    monkeypatch.setattr("mm.loop.store.get_active_mm_quotes", get_active_mm_quotes)
 
 
 class TestRebuildActiveQuotesFromCLOB:
     """Tests for _rebuild_active_quotes_from_clob."""
 
-    @pytest.fixture
-    def mock_client(self):
-        client = MagicMock()
-        client.get_open_orders = MagicMock(return_value=[])
-        client.cancel_order = MagicMock(return_value=True)
-        return client
-
-    @pytest.fixture
-    def manager(self, mm_config):
-        from mm.inventory import InventoryManager
-        return InventoryManager(mm_config)
-
-    @patch("mm.loop.store")
-    def test_empty_clob(self, mock_store, mock_client, manager):
-        from mm.loop import _rebuild_active_quotes_from_clob
-        mock_client.get_open_orders = MagicMock(return_value=[])
-        mock_store.get_active_mm_quotes = AsyncMock(return_value=[])
-        result = run(_rebuild_active_quotes_from_clob(mock_client, manager))
+    def test_empty_clob(self, monkeypatch, manager, runner):
+        _stub_db_quotes(monkeypatch, [])
+        result = runner.run(_rebuild_active_quotes_from_clob(_ClientStub(), manager))
         assert result == {}
 
-    @patch("mm.loop.store")
-    def test_recovers_known_orders(self, mock_store, mock_client, manager):
-        from mm.loop import _rebuild_active_quotes_from_clob
-        mock_client.get_open_orders = MagicMock(return_value=[
+    def test_recovers_known_orders(self, monkeypatch, manager, runner):
+        client = _ClientStub([
             {"id": "bid-123", "asset_id": "tok1"},
             {"id": "ask-456", "asset_id": "tok1"},
         ])
-        mock_store.get_active_mm_quotes = AsyncMock(return_value=[
+        _stub_db_quotes(monkeypatch, [
             {"market_id": "m1", "token_id": "tok1", "bid_order_id": "bid-123",
              "ask_order_id": "ask-456", "bid_price": 0.48, "ask_price": 0.52,
              "size": 10.0, "id": 1},
         ])
-        result = run(_rebuild_active_quotes_from_clob(mock_client, manager))
+        result = runner.run(_rebuild_active_quotes_from_clob(client, manager))
         assert "m1" in result
         pair = result["m1"]
         assert pair.bid_order_id == "bid-123"
         assert pair.ask_order_id == "ask-456"
 
-    @patch("mm.loop.store")
-    def test_cancels_orphan_orders(self, mock_store, mock_client, manager):
-        from mm.loop import _rebuild_active_quotes_from_clob
-        mock_client.get_open_orders = MagicMock(return_value=[
-            {"id": "orphan-789", "asset_id": "tok_unknown"},
-        ])
-        mock_store.get_active_mm_quotes = AsyncMock(return_value=[])
-        result = run(_rebuild_active_quotes_from_clob(mock_client, manager))
+    def test_cancels_orphan_orders(self, monkeypatch, manager, runner):
+        client = _ClientStub([{"id": "orphan-789", "asset_id": "tok_unknown"}])
+        _stub_db_quotes(monkeypatch, [])
+        result = runner.run(_rebuild_active_quotes_from_clob(client, manager))
         assert result == {}
-        mock_client.cancel_order.assert_called_once_with("orphan-789")
+        assert client.cancel_calls == ["orphan-789"]
 
 
 # ═══════════════════════════════════════════════════════════════════════
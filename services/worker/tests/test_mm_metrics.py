@@ -1,15 +1,21 @@
 """Tests for mm.metrics module — Phase 5D additions."""
 
 import sys
+from math import isclose, sqrt
 from pathlib import Path
 
-import pytest
-
 WORKER_DIR = Path(__file__).resolve().parents[1]
 if str(WORKER_DIR) not in sys.path:
     sys.path.insert(0, str(WORKER_DIR))
 
-from mm.metrics import profit_factor_from_round_trips
+import pytest
+
+from mm import metrics
+from mm.metrics import profit_factor_from_round_trips, sharpe_ratio
+
+
+def _aeq(a, b, rel=1e-6, abs_=1e-9):
+    assert isclose(a, b, rel_tol=rel, abs_tol=abs_), (a, b)
 
 
 class TestProfitFactorFromRoundTrips:
@@ -21,7 +27,7 @@ class TestProfitFactorFromRoundTrips:
             {"net_pnl": -1.0},
         ]
         pf = profit_factor_from_round_trips(rts)
-        assert pf == pytest.approx(8.0 / 3.0)
+        _aeq(pf, 8.0 / 3.0)
 
     def test_all_gains(self):
         rts = [{"net_pnl": 5.0}, {"net_pnl": 3.0}]
@@ -35,3 +41,47 @@ class TestProfitFactorFromRoundTrips:
 
     def test_empty(self):
         assert profit_factor_from_round_trips([]) == 0.0
+
+    def test_missing_and_zero_pnl_ignored(self):
+        rts = [{"net_pnl": 4.0}, {}, {"net_pnl": 0.0}, {"net_pnl": "-2.0"}]
+        _aeq(profit_factor_from_round_trips(rts), 2.0)
+
+    def test_nan_pnl_ignored(self):
+        rts = [{"net_pnl": 1.0}, {"net_pnl": float("nan")}, {"net_pnl": -0.5}]
+        _aeq(profit_factor_from_round_trips(rts), 2.0)
+
+
+class TestSharpeRatio:
+    def test_insufficient_data(self):
+        assert sharpe_ratio([]) == 0.0
+        assert sharpe_ratio([0.05]) == 0.0
+
+    def test_sample_std_annualized(self):
+        # mean 0.02, sample std sqrt(0.0002)
+        _aeq(sharpe_ratio([0.01, 0.03]), 0.02 / sqrt(0.0002) * sqrt(365))
+
+    def test_risk_free_rate_is_daily(self):
+        _aeq(sharpe_ratio([0.01, 0.03], risk_free_rate=3.65),
+             (0.02 - 0.01) / sqrt(0.0002) * sqrt(365))
+
+
+class TestNumbaKernels:
+    """Compiled kernels must agree with their pure-Python definitions."""
+
+    def test_sharpe_kernel_matches_python(self):
+        pytest.importorskip("numba")
+        import numpy as np
+
+        returns = np.array([0.012, -0.004, 0.031, 0.0, -0.017, 0.008], dtype=np.float64)
+        _aeq(metrics._sharpe_kernel(returns, 0.0001),
+             metrics._sharpe_kernel.py_func(returns, 0.0001))
+
+    def test_pf_kernel_matches_python(self):
+        pytest.importorskip("numba")
+        import numpy as np
+
+        pnl = np.array([5.0, -2.0, 0.0, 3.0, -1.0, 1e-12, -1e-12], dtype=np.float64)
+        gains, losses = metrics._pf_kernel(pnl)
+        py_gains, py_losses = metrics._pf_kernel.py_func(pnl)
+        assert gains == py_gains
+        assert losses == py_losses
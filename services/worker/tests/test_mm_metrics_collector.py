@@ -1,6 +1,7 @@
 """Tests for mm/metrics_collector.py — adverse selection + daily metrics."""
 
 import sys
+import threading
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
 from unittest.mock import MagicMock, patch, AsyncMock
@@ -11,9 +12,27 @@ WORKER_DIR = Path(__file__).resolve().parents[1]
 if str(WORKER_DIR) not in sys.path:
     sys.path.insert(0, str(WORKER_DIR))
 
+import mm.metrics_collector as mc
 from mm.metrics_collector import MetricsCollector
 
 
+# Every key MetricsCollector reads from an mm_fills row; _make_fill overrides.
+_FILL_TEMPLATE = {
+    "id": 1,
+    "quote_id": 1,
+    "order_id": "order-1",
+    "side": "BUY",
+    "price": 0.50,
+    "size": 10.0,
+    "fee": 0.0,
+    "mid_at_fill": 0.52,
+    "mid_at_30s": None,
+    "mid_at_120s": None,
+    "adverse_selection": None,
+    "created_at": None,
+}
+
+
 def _make_fill(
     fill_id: int = 1,
     quote_id: int = 1,
@@ -28,25 +47,35 @@ def _make_fill(
 ) -> dict:
     """Create a fake fill dict matching the schema used by MetricsCollector."""
     created_at = (datetime.now(timezone.utc) - timedelta(seconds=age_seconds)).isoformat()
-    return {
-        "id": fill_id,
-        "quote_id": quote_id,
-        "order_id": f"order-{fill_id}",
-        "side": side,
-        "price": price,
-        "size": size,
-        "fee": 0.0,
-        "mid_at_fill": mid_at_fill,
-        "mid_at_30s": mid_at_30s,
-        "mid_at_120s": mid_at_120s,
-        "adverse_selection": adverse_selection,
-        "created_at": created_at,
-    }
+    out = _FILL_TEMPLATE.copy()
+    out.update(
+        id=fill_id,
+        quote_id=quote_id,
+        order_id=f"order-{fill_id}",
+        side=side,
+        price=price,
+        size=size,
+        mid_at_fill=mid_at_fill,
+        mid_at_30s=mid_at_30s,
+        mid_at_120s=mid_at_120s,
+        adverse_selection=adverse_selection,
+        created_at=created_at,
+    )
+    return out
+
+
+@pytest.fixture(scope="session")
+def _client_prototype():
+    return MagicMock()
 
 
 @pytest.fixture
-def mock_client():
-    client = MagicMock()
+def mock_client(_client_prototype):
+    """One client mock for the session, wiped back to defaults per test."""
+    client = _client_prototype
+    # Reset the child only: return_value=True on the parent would also wipe
+    # its magic methods (__bool__ would stop returning True)
+    client.get_book_summary.reset_mock(return_value=True, side_effect=True)
     client.get_book_summary.return_value = {"mid": 0.55, "spread": 0.04}
     return client
 
@@ -56,6 +85,82 @@ def collector(mock_client):
     return MetricsCollector(client=mock_client)
 
 
+class _FakeCursor:
+    """Just the aiosqlite cursor surface the collector touches."""
+
+    __slots__ = ("fetchall", "fetchone")
+
+    def __init__(self, fetchall=None, fetchone=None):
+        self.fetchall = AsyncMock(return_value=fetchall if fetchall is not None else [])
+        self.fetchone = AsyncMock(return_value=fetchone)
+
+
+class _FakeDB:
+    """Just the aiosqlite connection surface the collector touches."""
+
+    __slots__ = ("cursor", "execute", "commit")
+
+    def __init__(self, cursor: _FakeCursor | None = None):
+        self.cursor = cursor or _FakeCursor()
+        self.execute = AsyncMock(return_value=self.cursor)
+        self.commit = AsyncMock()
+
+
+def _set_rows(mock_store, rows=None, row=None) -> _FakeDB:
+    """Swap in a DB whose cursor returns the given fetchall/fetchone results."""
+    db = _FakeDB(_FakeCursor(fetchall=rows, fetchone=row))
+    mock_store._get_db.return_value = db
+    return db
+
+
+def _stream(rows):
+    """Stand-in for store.get_pending_adverse_selection_fills yielding ``rows``."""
+    async def gen(*args, **kwargs):
+        for row in rows:
+            yield row
+    return gen
+
+
+# Store coroutines whose default result is "no rows"
+_EMPTY_LIST_CALLS = (
+    "get_recent_mm_fills",
+    "get_mm_fills_today",
+    "get_recent_mm_quotes",
+    "get_mm_inventory",
+)
+_STORE_CALLS = _EMPTY_LIST_CALLS + (
+    "bulk_update_mm_fill_adverse_selection",
+    "upsert_mm_daily_metrics",
+    "_get_db",
+)
+
+
+@pytest.fixture(scope="session")
+def _store_prototype():
+    s = MagicMock()
+    for name in _STORE_CALLS:
+        setattr(s, name, AsyncMock())
+    return s
+
+
+@pytest.fixture
+def mock_store(_store_prototype, monkeypatch):
+    """``mm.metrics_collector.store`` replaced by a mock with empty-result defaults.
+
+    The mock is built once per session and reset here, so tests override
+    only the coroutines whose behaviour they exercise.
+    """
+    s = _store_prototype
+    for name in _STORE_CALLS:
+        getattr(s, name).reset_mock(return_value=True, side_effect=True)
+    for name in _EMPTY_LIST_CALLS:
+        getattr(s, name).return_value = []
+    s.get_pending_adverse_selection_fills = _stream([])
+    s._get_db.return_value = _FakeDB()
+    monkeypatch.setattr(mc, "store", s)
+    return s
+
+
 # ────────────────────────────────────────────────────────────
 # measure_adverse_selection
 # ────────────────────────────────────────────────────────────
@@ -63,246 +168,235 @@ def collector(mock_client):
 class TestMeasureAdverseSelection:
     """Tests for measure_adverse_selection()."""
 
-    @pytest.mark.asyncio
     async def test_skips_when_no_client(self):
         """No client => early return, no crash."""
         collector = MetricsCollector(client=None)
         await collector.measure_adverse_selection()  # Should not raise
 
-    @pytest.mark.asyncio
-    async def test_skips_when_no_pending(self, collector):
+    async def test_skips_when_no_pending(self, collector, mock_store):
         """Empty pending list => no update calls."""
-        with patch("mm.metrics_collector.store") as mock_store:
-            mock_store.get_pending_adverse_selection_fills = AsyncMock(return_value=[])
-            await collector.measure_adverse_selection()
-            mock_store.update_mm_fill_adverse_selection.assert_not_called()
+        await collector.measure_adverse_selection()
+        mock_store.bulk_update_mm_fill_adverse_selection.assert_not_called()
 
-    @pytest.mark.asyncio
-    async def test_skips_when_get_pending_raises(self, collector):
+    async def test_skips_when_get_pending_raises(self, collector, mock_store):
         """Exception in get_pending_adverse_selection_fills => graceful return."""
-        with patch("mm.metrics_collector.store") as mock_store:
-            mock_store.get_pending_adverse_selection_fills = AsyncMock(
-                side_effect=Exception("db error")
-            )
-            await collector.measure_adverse_selection()  # Should not raise
-
-    @pytest.mark.asyncio
-    async def test_skips_fill_with_no_created_at(self, collector):
+        mock_store.get_pending_adverse_selection_fills = MagicMock(
+            side_effect=Exception("db error")
+        )
+        await collector.measure_adverse_selection()  # Should not raise
+
+    async def test_skips_fill_with_no_created_at(self, collector, mock_store):
         """Fill missing created_at => skip it."""
         fill = _make_fill(age_seconds=45, mid_at_30s=None)
         fill["created_at"] = ""
 
-        with patch("mm.metrics_collector.store") as mock_store:
-            mock_store.get_pending_adverse_selection_fills = AsyncMock(return_value=[fill])
-            mock_store.update_mm_fill_adverse_selection = AsyncMock()
-            await collector.measure_adverse_selection()
-            mock_store.update_mm_fill_adverse_selection.assert_not_called()
+        mock_store.get_pending_adverse_selection_fills = _stream([fill])
+        await collector.measure_adverse_selection()
+        mock_store.bulk_update_mm_fill_adverse_selection.assert_not_called()
 
-    @pytest.mark.asyncio
-    async def test_skips_fill_too_young_for_30s(self, collector):
+    async def test_skips_fill_too_young_for_30s(self, collector, mock_store):
         """Fill only 20s old, needs 30s => no measurement."""
         fill = _make_fill(age_seconds=20, mid_at_30s=None)
 
-        with patch("mm.metrics_collector.store") as mock_store:
-            mock_store.get_pending_adverse_selection_fills = AsyncMock(return_value=[fill])
-            mock_store.update_mm_fill_adverse_selection = AsyncMock()
+        mock_store.get_pending_adverse_selection_fills = _stream([fill])
+        # Token lookup mock (needed even if not reached for this fill)
+        _set_rows(mock_store, [{"id": 1, "token_id": "tok-1"}])
+
+        await collector.measure_adverse_selection()
+        mock_store.bulk_update_mm_fill_adverse_selection.assert_not_called()
 
-            # Token lookup mock (needed even if not reached for this fill)
-            mock_db = MagicMock()
-            mock_cursor = MagicMock()
-            mock_cursor.fetchone = AsyncMock(return_value={"token_id": "tok-1"})
-            mock_db.execute = AsyncMock(return_value=mock_cursor)
-            mock_store._get_db = AsyncMock(return_value=mock_db)
+    async def test_skips_parse_when_both_mids_set(self, collector, mock_store):
+        """Fill with both windows measured => created_at is never parsed."""
+        class _CountingDatetime(datetime):
+            parses = 0
 
+            @classmethod
+            def fromisoformat(cls, s):
+                cls.parses += 1
+                return super().fromisoformat(s)
+
+        fill = _make_fill(age_seconds=150, mid_at_30s=0.51, mid_at_120s=0.53)
+
+        mock_store.get_pending_adverse_selection_fills = _stream([fill])
+        with patch("mm.metrics_collector.datetime", _CountingDatetime):
             await collector.measure_adverse_selection()
-            mock_store.update_mm_fill_adverse_selection.assert_not_called()
 
-    @pytest.mark.asyncio
-    async def test_measures_mid_at_30s(self, collector, mock_client):
+        assert _CountingDatetime.parses == 0
+        mock_store.bulk_update_mm_fill_adverse_selection.assert_not_called()
+
+    async def test_measures_mid_at_30s(self, collector, mock_client, mock_store):
         """Fill 45s old, mid_at_30s=None => should measure mid_at_30s."""
         fill = _make_fill(age_seconds=45, mid_at_30s=None)
 
-        with patch("mm.metrics_collector.store") as mock_store:
-            mock_store.get_pending_adverse_selection_fills = AsyncMock(return_value=[fill])
-            mock_store.update_mm_fill_adverse_selection = AsyncMock()
+        mock_store.get_pending_adverse_selection_fills = _stream([fill])
+        _set_rows(mock_store, [{"id": 1, "token_id": "tok-1"}])
 
-            mock_db = MagicMock()
-            mock_cursor = MagicMock()
-            mock_cursor.fetchone = AsyncMock(return_value={"token_id": "tok-1"})
-            mock_db.execute = AsyncMock(return_value=mock_cursor)
-            mock_store._get_db = AsyncMock(return_value=mock_db)
+        await collector.measure_adverse_selection()
 
-            await collector.measure_adverse_selection()
-
-            mock_store.update_mm_fill_adverse_selection.assert_called_once()
-            call_kwargs = mock_store.update_mm_fill_adverse_selection.call_args
-            # Called as: update_mm_fill_adverse_selection(fill_id, mid_at_30s=mid)
-            assert call_kwargs[0][0] == 1  # fill_id
-            assert call_kwargs[1]["mid_at_30s"] == 0.55  # mid from mock_client
+        # One batched write: (mid, fill_id) for mid_at_30s, nothing else
+        mock_store.bulk_update_mm_fill_adverse_selection.assert_awaited_once_with(
+            [(0.55, 1)], []
+        )
 
-    @pytest.mark.asyncio
-    async def test_measures_mid_at_120s_and_computes_as(self, collector, mock_client):
+    async def test_measures_mid_at_120s_and_computes_as(self, collector, mock_client, mock_store):
         """Fill 150s old, mid_at_30s already set, mid_at_120s=None => measure + compute AS."""
         fill = _make_fill(
             age_seconds=150, side="BUY", price=0.50, mid_at_fill=0.52,
             mid_at_30s=0.51, mid_at_120s=None,
         )
 
-        with patch("mm.metrics_collector.store") as mock_store, \
-             patch("mm.metrics_collector.mm_metrics") as mock_mm_metrics:
-            mock_store.get_pending_adverse_selection_fills = AsyncMock(return_value=[fill])
-            mock_store.update_mm_fill_adverse_selection = AsyncMock()
-
-            mock_db = MagicMock()
-            mock_cursor = MagicMock()
-            mock_cursor.fetchone = AsyncMock(return_value={"token_id": "tok-1"})
-            mock_db.execute = AsyncMock(return_value=mock_cursor)
-            mock_db.commit = AsyncMock()
-            mock_store._get_db = AsyncMock(return_value=mock_db)
+        mock_store.get_pending_adverse_selection_fills = _stream([fill])
+        _set_rows(mock_store, [{"id": 1, "token_id": "tok-1"}])
 
+        with patch("mm.metrics_collector.mm_metrics") as mock_mm_metrics:
             mock_mm_metrics.adverse_selection.return_value = 12.5
-
             await collector.measure_adverse_selection()
 
-            # Should update mid_at_120s
-            mock_store.update_mm_fill_adverse_selection.assert_called_once_with(
-                1, mid_at_120s=0.55
-            )
-            # Should compute AS via mm_metrics.adverse_selection
-            mock_mm_metrics.adverse_selection.assert_called_once_with(
-                fill_price=0.50,
-                mid_at_fill=0.52,
-                mid_at_later=0.55,
-                side="BUY",
-            )
-            # Should store AS value via _update_as_value (direct DB update)
-            # Check the db.execute call for the AS UPDATE statement
-            update_calls = [
-                c for c in mock_db.execute.await_args_list
-                if "adverse_selection" in str(c)
-            ]
-            assert len(update_calls) == 1
-
-    @pytest.mark.asyncio
-    async def test_skips_fill_with_no_quote_id(self, collector):
-        """Fill with quote_id=None => _get_token_id returns None => skip."""
+        # mid_at_120s and the AS value go out as one fused row
+        mock_store.bulk_update_mm_fill_adverse_selection.assert_awaited_once_with(
+            [], [(0.55, 12.5, 1)]
+        )
+        # Should compute AS via mm_metrics.adverse_selection
+        mock_mm_metrics.adverse_selection.assert_called_once_with(
+            fill_price=0.50,
+            mid_at_fill=0.52,
+            mid_at_later=0.55,
+            side="BUY",
+        )
+
+    async def test_skips_fill_with_no_quote_id(self, collector, mock_store):
+        """Fill with quote_id=None => no token id resolved => skip."""
         fill = _make_fill(age_seconds=45, mid_at_30s=None)
         fill["quote_id"] = None
 
-        with patch("mm.metrics_collector.store") as mock_store:
-            mock_store.get_pending_adverse_selection_fills = AsyncMock(return_value=[fill])
-            mock_store.update_mm_fill_adverse_selection = AsyncMock()
-            await collector.measure_adverse_selection()
-            mock_store.update_mm_fill_adverse_selection.assert_not_called()
+        mock_store.get_pending_adverse_selection_fills = _stream([fill])
+        await collector.measure_adverse_selection()
+        mock_store.bulk_update_mm_fill_adverse_selection.assert_not_called()
 
-    @pytest.mark.asyncio
-    async def test_skips_when_token_id_not_found(self, collector):
+    async def test_skips_when_token_id_not_found(self, collector, mock_store):
         """Token lookup returns no row => skip fill."""
         fill = _make_fill(age_seconds=45, mid_at_30s=None)
 
-        with patch("mm.metrics_collector.store") as mock_store:
-            mock_store.get_pending_adverse_selection_fills = AsyncMock(return_value=[fill])
-            mock_store.update_mm_fill_adverse_selection = AsyncMock()
-
-            mock_db = MagicMock()
-            mock_cursor = MagicMock()
-            mock_cursor.fetchone = AsyncMock(return_value=None)  # No row
-            mock_db.execute = AsyncMock(return_value=mock_cursor)
-            mock_store._get_db = AsyncMock(return_value=mock_db)
+        mock_store.get_pending_adverse_selection_fills = _stream([fill])  # DB has no rows
+        await collector.measure_adverse_selection()
+        mock_store.bulk_update_mm_fill_adverse_selection.assert_not_called()
 
-            await collector.measure_adverse_selection()
-            mock_store.update_mm_fill_adverse_selection.assert_not_called()
-
-    @pytest.mark.asyncio
-    async def test_skips_when_book_summary_returns_none(self, collector, mock_client):
+    async def test_skips_when_book_summary_returns_none(self, collector, mock_client, mock_store):
         """get_book_summary returns None => mid is None => skip update."""
         mock_client.get_book_summary.return_value = None
         fill = _make_fill(age_seconds=45, mid_at_30s=None)
 
-        with patch("mm.metrics_collector.store") as mock_store:
-            mock_store.get_pending_adverse_selection_fills = AsyncMock(return_value=[fill])
-            mock_store.update_mm_fill_adverse_selection = AsyncMock()
-
-            mock_db = MagicMock()
-            mock_cursor = MagicMock()
-            mock_cursor.fetchone = AsyncMock(return_value={"token_id": "tok-1"})
-            mock_db.execute = AsyncMock(return_value=mock_cursor)
-            mock_store._get_db = AsyncMock(return_value=mock_db)
+        mock_store.get_pending_adverse_selection_fills = _stream([fill])
+        _set_rows(mock_store, [{"id": 1, "token_id": "tok-1"}])
 
-            await collector.measure_adverse_selection()
-            mock_store.update_mm_fill_adverse_selection.assert_not_called()
+        await collector.measure_adverse_selection()
+        mock_store.bulk_update_mm_fill_adverse_selection.assert_not_called()
 
-    @pytest.mark.asyncio
-    async def test_token_id_cache(self, collector, mock_client):
+    async def test_token_id_cache(self, collector, mock_client, mock_store):
         """Token ID should be cached after first lookup — DB hit only once per quote_id."""
         fill1 = _make_fill(fill_id=1, age_seconds=45, mid_at_30s=None, quote_id=1)
         fill2 = _make_fill(fill_id=2, age_seconds=60, mid_at_30s=None, quote_id=1)
 
-        with patch("mm.metrics_collector.store") as mock_store:
-            mock_store.get_pending_adverse_selection_fills = AsyncMock(
-                return_value=[fill1, fill2]
-            )
-            mock_store.update_mm_fill_adverse_selection = AsyncMock()
+        mock_store.get_pending_adverse_selection_fills = _stream([fill1, fill2])
+        mock_db = _set_rows(mock_store, [{"id": 1, "token_id": "tok-1"}])
 
-            mock_db = MagicMock()
-            mock_cursor = MagicMock()
-            mock_cursor.fetchone = AsyncMock(return_value={"token_id": "tok-1"})
-            mock_db.execute = AsyncMock(return_value=mock_cursor)
-            mock_store._get_db = AsyncMock(return_value=mock_db)
+        await collector.measure_adverse_selection()
 
-            await collector.measure_adverse_selection()
+        # DB execute for token lookup should be called only once (cached second time)
+        assert mock_db.execute.call_count == 1
+        # Both fills flushed together
+        assert mock_store.bulk_update_mm_fill_adverse_selection.await_count == 1
 
-            # DB execute for token lookup should be called only once (cached second time)
-            assert mock_db.execute.call_count == 1
-
-    @pytest.mark.asyncio
-    async def test_multiple_fills_different_quote_ids(self, collector, mock_client):
-        """Different quote_ids => separate DB lookups, separate cache entries."""
+    async def test_multiple_fills_different_quote_ids(self, collector, mock_client, mock_store):
+        """Different quote_ids => one batched DB lookup, separate cache entries."""
         fill1 = _make_fill(fill_id=1, age_seconds=45, mid_at_30s=None, quote_id=10)
         fill2 = _make_fill(fill_id=2, age_seconds=60, mid_at_30s=None, quote_id=20)
 
-        with patch("mm.metrics_collector.store") as mock_store:
-            mock_store.get_pending_adverse_selection_fills = AsyncMock(
-                return_value=[fill1, fill2]
-            )
-            mock_store.update_mm_fill_adverse_selection = AsyncMock()
-
-            mock_db = MagicMock()
-            mock_cursor = MagicMock()
-            mock_cursor.fetchone = AsyncMock(return_value={"token_id": "tok-1"})
-            mock_db.execute = AsyncMock(return_value=mock_cursor)
-            mock_store._get_db = AsyncMock(return_value=mock_db)
+        mock_store.get_pending_adverse_selection_fills = _stream([fill1, fill2])
+        mock_db = _set_rows(mock_store, [
+            {"id": 10, "token_id": "tok-1"}, {"id": 20, "token_id": "tok-1"},
+        ])
 
-            await collector.measure_adverse_selection()
+        await collector.measure_adverse_selection()
 
-            # Two distinct quote_ids => two DB lookups
-            assert mock_db.execute.call_count == 2
-            # Both fills should have been updated
-            assert mock_store.update_mm_fill_adverse_selection.call_count == 2
+        # Two distinct quote_ids => resolved together in one IN-list query
+        assert mock_db.execute.call_count == 1
+        assert sorted(mock_db.execute.call_args[0][1]) == [10, 20]
+        # Both fills written in a single batch
+        mock_store.bulk_update_mm_fill_adverse_selection.assert_awaited_once_with(
+            [(0.55, 1), (0.55, 2)], []
+        )
 
-    @pytest.mark.asyncio
-    async def test_fill_old_enough_for_both_30s_and_120s(self, collector, mock_client):
+    async def test_fill_old_enough_for_both_30s_and_120s(self, collector, mock_client, mock_store):
         """Fill 150s old with mid_at_30s=None and mid_at_120s=None => measures both."""
         fill = _make_fill(age_seconds=150, mid_at_30s=None, mid_at_120s=None)
 
-        with patch("mm.metrics_collector.store") as mock_store, \
-             patch("mm.metrics_collector.mm_metrics") as mock_mm_metrics:
-            mock_store.get_pending_adverse_selection_fills = AsyncMock(return_value=[fill])
-            mock_store.update_mm_fill_adverse_selection = AsyncMock()
-
-            mock_db = MagicMock()
-            mock_cursor = MagicMock()
-            mock_cursor.fetchone = AsyncMock(return_value={"token_id": "tok-1"})
-            mock_db.execute = AsyncMock(return_value=mock_cursor)
-            mock_db.commit = AsyncMock()
-            mock_store._get_db = AsyncMock(return_value=mock_db)
+        mock_store.get_pending_adverse_selection_fills = _stream([fill])
+        _set_rows(mock_store, [{"id": 1, "token_id": "tok-1"}])
 
+        with patch("mm.metrics_collector.mm_metrics") as mock_mm_metrics:
             mock_mm_metrics.adverse_selection.return_value = 5.0
+            await collector.measure_adverse_selection()
+
+        # mid_at_30s and mid_at_120s (+ AS) land in the same batched write
+        mock_store.bulk_update_mm_fill_adverse_selection.assert_awaited_once_with(
+            [(0.55, 1)], [(0.55, 5.0, 1)]
+        )
+
 
+    async def test_book_summary_fetched_concurrently(self, collector, mock_client, mock_store):
+        """Distinct tokens are fetched in parallel: both calls must be in flight at once."""
+        fill1 = _make_fill(fill_id=1, age_seconds=45, quote_id=10)
+        fill2 = _make_fill(fill_id=2, age_seconds=45, quote_id=20)
+        barrier = threading.Barrier(2, timeout=2)
+
+        def book_summary(token_id):
+            barrier.wait()  # raises BrokenBarrierError if calls are serialized
+            return {"mid": 0.55}
+
+        mock_client.get_book_summary.side_effect = book_summary
+        collector._token_cache.update({10: "tok-a", 20: "tok-b"})
+
+        mock_store.get_pending_adverse_selection_fills = _stream([fill1, fill2])
+        await collector.measure_adverse_selection()
+
+        mock_store.bulk_update_mm_fill_adverse_selection.assert_awaited_once_with(
+            [(0.55, 1), (0.55, 2)], []
+        )
+
+    async def test_book_summary_fetched_once_per_token(self, collector, mock_client, mock_store):
+        """Fills sharing a token (and a fill needing both windows) reuse one fetch."""
+        fill1 = _make_fill(fill_id=1, age_seconds=150, quote_id=1)
+        fill2 = _make_fill(fill_id=2, age_seconds=45, quote_id=2)
+        collector._token_cache.update({1: "tok-1", 2: "tok-1"})
+
+        mock_store.get_pending_adverse_selection_fills = _stream([fill1, fill2])
+        await collector.measure_adverse_selection()
+
+        mock_client.get_book_summary.assert_called_once_with("tok-1")
+
+
+    async def test_now_snapshotted_once(self, collector, mock_store):
+        """Fill ages are all measured against a single clock read."""
+        class _CountingDatetime(datetime):
+            calls = 0
+
+            @classmethod
+            def now(cls, tz=None):
+                cls.calls += 1
+                return super().now(tz)
+
+        fills = [_make_fill(fill_id=i, age_seconds=45, quote_id=1) for i in range(1, 4)]
+        collector._token_cache[1] = "tok-1"
+
+        mock_store.get_pending_adverse_selection_fills = _stream(fills)
+        with patch("mm.metrics_collector.datetime", _CountingDatetime):
             await collector.measure_adverse_selection()
 
-            # Should be called twice: once for mid_at_30s, once for mid_at_120s
-            assert mock_store.update_mm_fill_adverse_selection.call_count == 2
+        assert _CountingDatetime.calls == 1
+        assert mock_store.bulk_update_mm_fill_adverse_selection.await_args[0][0] == [
+            (0.55, 1), (0.55, 2), (0.55, 3),
+        ]
 
 
 # ────────────────────────────────────────────────────────────
@@ -312,38 +406,25 @@ class TestMeasureAdverseSelection:
 class TestComputeDailyMetrics:
     """Tests for compute_daily_metrics()."""
 
-    @pytest.mark.asyncio
-    async def test_returns_empty_when_no_fills(self, collector):
-        """No fills at all => empty dict."""
-        with patch("mm.metrics_collector.store") as mock_store:
-            mock_store.get_recent_mm_fills = AsyncMock(return_value=[])
-            result = await collector.compute_daily_metrics()
-            assert result == {}
-
-    @pytest.mark.asyncio
-    async def test_returns_empty_when_get_fills_raises(self, collector):
-        """Exception in get_recent_mm_fills => empty dict."""
-        with patch("mm.metrics_collector.store") as mock_store:
-            mock_store.get_recent_mm_fills = AsyncMock(
-                side_effect=Exception("db error")
-            )
-            result = await collector.compute_daily_metrics()
-            assert result == {}
-
-    @pytest.mark.asyncio
-    async def test_returns_empty_when_no_today_fills(self, collector):
-        """Fills exist but none from today => empty dict."""
-        yesterday = (datetime.now(timezone.utc) - timedelta(days=1)).strftime("%Y-%m-%d")
-        fill = _make_fill(age_seconds=100)
-        fill["created_at"] = f"{yesterday}T12:00:00+00:00"
-
-        with patch("mm.metrics_collector.store") as mock_store:
-            mock_store.get_recent_mm_fills = AsyncMock(return_value=[fill])
-            result = await collector.compute_daily_metrics()
-            assert result == {}
-
-    @pytest.mark.asyncio
-    async def test_computes_basic_metrics(self, collector):
+    async def test_returns_empty_when_store_returns_nothing(self, collector, mock_store):
+        """No fills today => empty dict."""
+        result = await collector.compute_daily_metrics()
+        assert result == {}
+
+    async def test_returns_empty_when_get_fills_raises(self, collector, mock_store):
+        """Exception in get_mm_fills_today => empty dict."""
+        mock_store.get_mm_fills_today.side_effect = Exception("db error")
+        result = await collector.compute_daily_metrics()
+        assert result == {}
+
+    async def test_queries_store_for_today_only(self, collector, mock_store):
+        """The date filter is delegated to the store with today's UTC date."""
+        today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+        await collector.compute_daily_metrics()
+        mock_store.get_mm_fills_today.assert_awaited_once_with(today, limit=2000)
+        mock_store.get_recent_mm_fills.assert_not_called()
+
+    async def test_computes_basic_metrics(self, collector, mock_store):
         """Two fills today => fills_count, pnl, fill_quality, AS avg, etc."""
         today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
         fills = [
@@ -359,43 +440,31 @@ class TestComputeDailyMetrics:
         for f in fills:
             f["created_at"] = f"{today}T12:00:00+00:00"
 
-        with patch("mm.metrics_collector.store") as mock_store:
-            mock_store.get_recent_mm_fills = AsyncMock(return_value=fills)
-            mock_store.get_recent_mm_quotes = AsyncMock(return_value=[])
-            mock_store.get_mm_inventory = AsyncMock(return_value=[])
-            mock_store.upsert_mm_daily_metrics = AsyncMock()
-
-            # Mock for _compute_rolling_sharpe
-            mock_db = MagicMock()
-            mock_cursor = MagicMock()
-            mock_cursor.fetchall = AsyncMock(return_value=[])
-            mock_db.execute = AsyncMock(return_value=mock_cursor)
-            mock_store._get_db = AsyncMock(return_value=mock_db)
-
-            result = await collector.compute_daily_metrics()
-
-            assert result["fills_count"] == 2
-            assert "pnl_gross" in result
-            assert "pnl_net" in result
-            assert "fill_quality_avg" in result
-            assert "adverse_selection_avg" in result
-            assert "spread_capture_rate" in result
-            assert "profit_factor" in result
-            assert "max_inventory" in result
-            assert "inventory_turns" in result
-            assert "sharpe_7d" in result
-
-            # AS avg: (10.0 + -5.0) / 2 = 2.5
-            assert result["adverse_selection_avg"] == 2.5
-
-            # Should persist metrics
-            mock_store.upsert_mm_daily_metrics.assert_called_once()
-            persist_args = mock_store.upsert_mm_daily_metrics.call_args[0]
-            assert persist_args[0] == today  # date
-            assert persist_args[1] == result  # metrics dict
-
-    @pytest.mark.asyncio
-    async def test_as_avg_ignores_none_values(self, collector):
+        mock_store.get_mm_fills_today.return_value = fills
+
+        result = await collector.compute_daily_metrics()
+
+        assert result["fills_count"] == 2
+        assert "pnl_gross" in result
+        assert "pnl_net" in result
+        assert "fill_quality_avg" in result
+        assert "adverse_selection_avg" in result
+        assert "spread_capture_rate" in result
+        assert "profit_factor" in result
+        assert "max_inventory" in result
+        assert "inventory_turns" in result
+        assert "sharpe_7d" in result
+
+        # AS avg: (10.0 + -5.0) / 2 = 2.5
+        assert result["adverse_selection_avg"] == 2.5
+
+        # Should persist metrics
+        mock_store.upsert_mm_daily_metrics.assert_called_once()
+        persist_args = mock_store.upsert_mm_daily_metrics.call_args[0]
+        assert persist_args[0] == today  # date
+        assert persist_args[1] == result  # metrics dict
+
+    async def test_as_avg_ignores_none_values(self, collector, mock_store):
         """AS avg should skip fills where adverse_selection is None."""
         today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
         fills = [
@@ -406,25 +475,13 @@ class TestComputeDailyMetrics:
         for f in fills:
             f["created_at"] = f"{today}T12:00:00+00:00"
 
-        with patch("mm.metrics_collector.store") as mock_store:
-            mock_store.get_recent_mm_fills = AsyncMock(return_value=fills)
-            mock_store.get_recent_mm_quotes = AsyncMock(return_value=[])
-            mock_store.get_mm_inventory = AsyncMock(return_value=[])
-            mock_store.upsert_mm_daily_metrics = AsyncMock()
-
-            mock_db = MagicMock()
-            mock_cursor = MagicMock()
-            mock_cursor.fetchall = AsyncMock(return_value=[])
-            mock_db.execute = AsyncMock(return_value=mock_cursor)
-            mock_store._get_db = AsyncMock(return_value=mock_db)
+        mock_store.get_mm_fills_today.return_value = fills
+        result = await collector.compute_daily_metrics()
 
-            result = await collector.compute_daily_metrics()
+        # Only fills 1 and 3 have AS: (20 + 10) / 2 = 15.0
+        assert result["adverse_selection_avg"] == 15.0
 
-            # Only fills 1 and 3 have AS: (20 + 10) / 2 = 15.0
-            assert result["adverse_selection_avg"] == 15.0
-
-    @pytest.mark.asyncio
-    async def test_fill_quality_skips_zero_mid(self, collector):
+    async def test_fill_quality_skips_zero_mid(self, collector, mock_store):
         """fill_quality avg should skip fills where mid_at_fill is 0 or None."""
         today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
         fills = [
@@ -435,109 +492,60 @@ class TestComputeDailyMetrics:
         for f in fills:
             f["created_at"] = f"{today}T12:00:00+00:00"
 
-        with patch("mm.metrics_collector.store") as mock_store:
-            mock_store.get_recent_mm_fills = AsyncMock(return_value=fills)
-            mock_store.get_recent_mm_quotes = AsyncMock(return_value=[])
-            mock_store.get_mm_inventory = AsyncMock(return_value=[])
-            mock_store.upsert_mm_daily_metrics = AsyncMock()
-
-            mock_db = MagicMock()
-            mock_cursor = MagicMock()
-            mock_cursor.fetchall = AsyncMock(return_value=[])
-            mock_db.execute = AsyncMock(return_value=mock_cursor)
-            mock_store._get_db = AsyncMock(return_value=mock_db)
-
-            result = await collector.compute_daily_metrics()
+        mock_store.get_mm_fills_today.return_value = fills
+        result = await collector.compute_daily_metrics()
 
-            # Only fill_id=1 has valid mid_at_fill
-            # fill_quality for BUY at 0.48 with mid 0.50 => (0.50 - 0.48) / 0.50 * 10000 = 400 bps
-            assert result["fill_quality_avg"] == 400.0
+        # Only fill_id=1 has valid mid_at_fill
+        # fill_quality for BUY at 0.48 with mid 0.50 => (0.50 - 0.48) / 0.50 * 10000 = 400 bps
+        assert result["fill_quality_avg"] == 400.0
 
-    @pytest.mark.asyncio
-    async def test_inventory_stats(self, collector):
+    async def test_inventory_stats(self, collector, mock_store):
         """max_inventory picks the largest absolute net_position across markets."""
         today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
         fills = [_make_fill(fill_id=1)]
         fills[0]["created_at"] = f"{today}T12:00:00+00:00"
 
-        inventory = [
+        mock_store.get_mm_fills_today.return_value = fills
+        mock_store.get_mm_inventory.return_value = [
             {"market_id": "m1", "net_position": "5.0"},
             {"market_id": "m2", "net_position": "-8.0"},
             {"market_id": "m3", "net_position": "3.0"},
         ]
+        result = await collector.compute_daily_metrics()
 
-        with patch("mm.metrics_collector.store") as mock_store:
-            mock_store.get_recent_mm_fills = AsyncMock(return_value=fills)
-            mock_store.get_recent_mm_quotes = AsyncMock(return_value=[])
-            mock_store.get_mm_inventory = AsyncMock(return_value=inventory)
-            mock_store.upsert_mm_daily_metrics = AsyncMock()
+        # max(abs(5), abs(-8), abs(3)) = 8.0
+        assert result["max_inventory"] == 8.0
 
-            mock_db = MagicMock()
-            mock_cursor = MagicMock()
-            mock_cursor.fetchall = AsyncMock(return_value=[])
-            mock_db.execute = AsyncMock(return_value=mock_cursor)
-            mock_store._get_db = AsyncMock(return_value=mock_db)
-
-            result = await collector.compute_daily_metrics()
-
-            # max(abs(5), abs(-8), abs(3)) = 8.0
-            assert result["max_inventory"] == 8.0
-
-    @pytest.mark.asyncio
-    async def test_sharpe_with_historical_data(self, collector):
+    async def test_sharpe_with_historical_data(self, collector, mock_store):
         """Rolling Sharpe uses historical daily metrics from DB."""
         today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
         fills = [_make_fill(fill_id=1)]
         fills[0]["created_at"] = f"{today}T12:00:00+00:00"
 
-        daily_returns = [
+        mock_store.get_mm_fills_today.return_value = fills
+        _set_rows(mock_store, [
             {"pnl_net": 0.10, "portfolio_value": 100.0},
             {"pnl_net": -0.05, "portfolio_value": 100.0},
             {"pnl_net": 0.08, "portfolio_value": 100.0},
-        ]
-
-        with patch("mm.metrics_collector.store") as mock_store:
-            mock_store.get_recent_mm_fills = AsyncMock(return_value=fills)
-            mock_store.get_recent_mm_quotes = AsyncMock(return_value=[])
-            mock_store.get_mm_inventory = AsyncMock(return_value=[])
-            mock_store.upsert_mm_daily_metrics = AsyncMock()
-
-            mock_db = MagicMock()
-            mock_cursor = MagicMock()
-            mock_cursor.fetchall = AsyncMock(return_value=daily_returns)
-            mock_db.execute = AsyncMock(return_value=mock_cursor)
-            mock_store._get_db = AsyncMock(return_value=mock_db)
-
-            result = await collector.compute_daily_metrics()
+        ])
+        result = await collector.compute_daily_metrics()
 
-            # With 3 daily returns, sharpe should be non-zero
-            assert result["sharpe_7d"] != 0.0
+        # With 3 daily returns, sharpe should be non-zero
+        assert result["sharpe_7d"] != 0.0
 
-    @pytest.mark.asyncio
-    async def test_sharpe_zero_with_insufficient_data(self, collector):
+    async def test_sharpe_zero_with_insufficient_data(self, collector, mock_store):
         """< 2 daily returns => Sharpe = 0.0."""
         today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
         fills = [_make_fill(fill_id=1)]
         fills[0]["created_at"] = f"{today}T12:00:00+00:00"
 
-        with patch("mm.metrics_collector.store") as mock_store:
-            mock_store.get_recent_mm_fills = AsyncMock(return_value=fills)
-            mock_store.get_recent_mm_quotes = AsyncMock(return_value=[])
-            mock_store.get_mm_inventory = AsyncMock(return_value=[])
-            mock_store.upsert_mm_daily_metrics = AsyncMock()
+        mock_store.get_mm_fills_today.return_value = fills
+        _set_rows(mock_store, [{"pnl_net": 0.10}])  # Only 1 row
+        result = await collector.compute_daily_metrics()
 
-            mock_db = MagicMock()
-            mock_cursor = MagicMock()
-            mock_cursor.fetchall = AsyncMock(return_value=[{"pnl_net": 0.10}])  # Only 1 row
-            mock_db.execute = AsyncMock(return_value=mock_cursor)
-            mock_store._get_db = AsyncMock(return_value=mock_db)
+        assert result["sharpe_7d"] == 0.0
 
-            result = await collector.compute_daily_metrics()
-
-            assert result["sharpe_7d"] == 0.0
-
-    @pytest.mark.asyncio
-    async def test_profit_factor_infinity_clamped(self, collector):
+    async def test_profit_factor_infinity_clamped(self, collector, mock_store):
         """All winning trades => profit_factor=inf clamped to 999.9."""
         today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
         fills = [
@@ -547,98 +555,82 @@ class TestComputeDailyMetrics:
         for f in fills:
             f["created_at"] = f"{today}T12:00:00+00:00"
 
-        with patch("mm.metrics_collector.store") as mock_store:
-            mock_store.get_recent_mm_fills = AsyncMock(return_value=fills)
-            mock_store.get_recent_mm_quotes = AsyncMock(return_value=[])
-            mock_store.get_mm_inventory = AsyncMock(return_value=[])
-            mock_store.upsert_mm_daily_metrics = AsyncMock()
-
-            mock_db = MagicMock()
-            mock_cursor = MagicMock()
-            mock_cursor.fetchall = AsyncMock(return_value=[])
-            mock_db.execute = AsyncMock(return_value=mock_cursor)
-            mock_store._get_db = AsyncMock(return_value=mock_db)
-
-            result = await collector.compute_daily_metrics()
+        mock_store.get_mm_fills_today.return_value = fills
+        result = await collector.compute_daily_metrics()
 
-            # profit_factor for all winners = inf, clamped to 999.9
-            assert result["profit_factor"] == 999.9
+        # profit_factor for all winners = inf, clamped to 999.9
+        assert result["profit_factor"] == 999.9
 
-    @pytest.mark.asyncio
-    async def test_upsert_failure_does_not_crash(self, collector):
+    async def test_upsert_failure_does_not_crash(self, collector, mock_store):
         """Exception in upsert_mm_daily_metrics => metrics still returned."""
         today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
         fills = [_make_fill(fill_id=1)]
         fills[0]["created_at"] = f"{today}T12:00:00+00:00"
 
-        with patch("mm.metrics_collector.store") as mock_store:
-            mock_store.get_recent_mm_fills = AsyncMock(return_value=fills)
-            mock_store.get_recent_mm_quotes = AsyncMock(return_value=[])
-            mock_store.get_mm_inventory = AsyncMock(return_value=[])
-            mock_store.upsert_mm_daily_metrics = AsyncMock(
-                side_effect=Exception("persist error")
-            )
+        mock_store.get_mm_fills_today.return_value = fills
+        mock_store.upsert_mm_daily_metrics.side_effect = Exception("persist error")
+        result = await collector.compute_daily_metrics()
 
-            mock_db = MagicMock()
-            mock_cursor = MagicMock()
-            mock_cursor.fetchall = AsyncMock(return_value=[])
-            mock_db.execute = AsyncMock(return_value=mock_cursor)
-            mock_store._get_db = AsyncMock(return_value=mock_db)
+        # Should still return computed metrics despite persist failure
+        assert result["fills_count"] == 1
 
-            result = await collector.compute_daily_metrics()
-
-            # Should still return computed metrics despite persist failure
-            assert result["fills_count"] == 1
-
-    @pytest.mark.asyncio
-    async def test_quotes_exception_gives_zero_scr(self, collector):
+    async def test_quotes_exception_gives_zero_scr(self, collector, mock_store):
         """Exception in get_recent_mm_quotes => spread_capture_rate = 0.0."""
         today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
         fills = [_make_fill(fill_id=1)]
         fills[0]["created_at"] = f"{today}T12:00:00+00:00"
 
-        with patch("mm.metrics_collector.store") as mock_store:
-            mock_store.get_recent_mm_fills = AsyncMock(return_value=fills)
-            mock_store.get_recent_mm_quotes = AsyncMock(
-                side_effect=Exception("quotes error")
-            )
-            mock_store.get_mm_inventory = AsyncMock(return_value=[])
-            mock_store.upsert_mm_daily_metrics = AsyncMock()
-
-            mock_db = MagicMock()
-            mock_cursor = MagicMock()
-            mock_cursor.fetchall = AsyncMock(return_value=[])
-            mock_db.execute = AsyncMock(return_value=mock_cursor)
-            mock_store._get_db = AsyncMock(return_value=mock_db)
+        mock_store.get_mm_fills_today.return_value = fills
+        mock_store.get_recent_mm_quotes.side_effect = Exception("quotes error")
+        result = await collector.compute_daily_metrics()
 
-            result = await collector.compute_daily_metrics()
+        assert result["spread_capture_rate"] == 0.0
 
-            assert result["spread_capture_rate"] == 0.0
-
-    @pytest.mark.asyncio
-    async def test_inventory_exception_gives_zero_max(self, collector):
+    async def test_inventory_exception_gives_zero_max(self, collector, mock_store):
         """Exception in get_mm_inventory => max_inventory = 0."""
         today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
         fills = [_make_fill(fill_id=1)]
         fills[0]["created_at"] = f"{today}T12:00:00+00:00"
 
-        with patch("mm.metrics_collector.store") as mock_store:
-            mock_store.get_recent_mm_fills = AsyncMock(return_value=fills)
-            mock_store.get_recent_mm_quotes = AsyncMock(return_value=[])
-            mock_store.get_mm_inventory = AsyncMock(
-                side_effect=Exception("inventory error")
-            )
-            mock_store.upsert_mm_daily_metrics = AsyncMock()
+        mock_store.get_mm_fills_today.return_value = fills
+        mock_store.get_mm_inventory.side_effect = Exception("inventory error")
+        result = await collector.compute_daily_metrics()
 
-            mock_db = MagicMock()
-            mock_cursor = MagicMock()
-            mock_cursor.fetchall = AsyncMock(return_value=[])
-            mock_db.execute = AsyncMock(return_value=mock_cursor)
-            mock_store._get_db = AsyncMock(return_value=mock_db)
+        assert result["max_inventory"] == 0
 
-            result = await collector.compute_daily_metrics()
 
-            assert result["max_inventory"] == 0
+# ────────────────────────────────────────────────────────────
+# _fill_quality_and_as_averages
+# ────────────────────────────────────────────────────────────
+
+class TestFillQualityAndAsAverages:
+    def test_numpy_path_matches_python_fallback(self, monkeypatch):
+        pytest.importorskip("numpy")
+        fills = [
+            _make_fill(fill_id=1, side="BUY", price=0.48, mid_at_fill=0.50, adverse_selection=10.0),
+            _make_fill(fill_id=2, side="SELL", price=0.53, mid_at_fill=0.50, adverse_selection=None),
+            _make_fill(fill_id=3, side="SELL", price=0.40, mid_at_fill=0, adverse_selection=-4.0),
+            _make_fill(fill_id=4, side="BUY", price=0.31, mid_at_fill=None, adverse_selection=1.5),
+        ]
+        vectorized = mc._fill_quality_and_as_averages(fills)
+        monkeypatch.setattr(mc, "np", None)
+        assert vectorized == pytest.approx(mc._fill_quality_and_as_averages(fills))
+
+    def test_fill_columns_from_rows(self):
+        np = pytest.importorskip("numpy")
+        cols = mc._FillColumns.from_rows([
+            _make_fill(side="BUY", price=0.48, mid_at_fill=0.50, adverse_selection=10.0),
+            _make_fill(side="SELL", price=0.53, mid_at_fill=None, adverse_selection=None),
+        ])
+        assert cols.price.tolist() == [0.48, 0.53]
+        assert cols.side_sign.tolist() == [1, -1]
+        assert cols.side_sign.dtype == np.int8
+        assert cols.mid_at_fill[0] == 0.50 and np.isnan(cols.mid_at_fill[1])
+        assert cols.adverse_selection[0] == 10.0 and np.isnan(cols.adverse_selection[1])
+
+    def test_no_valid_values(self):
+        fills = [_make_fill(mid_at_fill=None, adverse_selection=None)]
+        assert mc._fill_quality_and_as_averages(fills) == (0.0, 0.0)
 
 
 # ────────────────────────────────────────────────────────────
@@ -652,44 +644,83 @@ class TestHoursSinceMidnight:
         assert hours >= 0.1
         assert hours <= 24.0
 
+    def test_exact_fraction_of_hour(self, monkeypatch):
+        class _FixedDatetime(datetime):
+            @classmethod
+            def now(cls, tz=None):
+                return datetime(2026, 3, 1, 6, 30, 18, tzinfo=timezone.utc)
+
+        monkeypatch.setattr(mc, "datetime", _FixedDatetime)
+        assert MetricsCollector._hours_since_midnight() == pytest.approx(6.505)
+
+    def test_floor_just_after_midnight(self, monkeypatch):
+        class _FixedDatetime(datetime):
+            @classmethod
+            def now(cls, tz=None):
+                return datetime(2026, 3, 1, 0, 0, 30, tzinfo=timezone.utc)
+
+        monkeypatch.setattr(mc, "datetime", _FixedDatetime)
+        assert MetricsCollector._hours_since_midnight() == 0.1
+
 
 # ────────────────────────────────────────────────────────────
-# _get_token_id
+# _resolve_token_ids
 # ────────────────────────────────────────────────────────────
 
-class TestGetTokenId:
-    """Tests for _get_token_id() caching and error handling."""
+class TestResolveTokenIds:
+    """Tests for _resolve_token_ids() caching and error handling."""
 
-    @pytest.mark.asyncio
-    async def test_returns_none_for_none_quote_id(self, collector):
-        result = await collector._get_token_id(None)
-        assert result is None
+    async def test_ignores_none_quote_ids(self, collector, mock_store):
+        result = await collector._resolve_token_ids([None, None])
+        assert result == {}
+        mock_store._get_db.assert_not_awaited()
 
-    @pytest.mark.asyncio
-    async def test_returns_cached_value(self, collector):
+    async def test_returns_cached_value(self, collector, mock_store):
         """Pre-populate cache => no DB call."""
         collector._token_cache[42] = "cached-token"
-        result = await collector._get_token_id(42)
-        assert result == "cached-token"
-
-    @pytest.mark.asyncio
-    async def test_returns_none_on_db_exception(self, collector):
-        with patch("mm.metrics_collector.store") as mock_store:
-            mock_store._get_db = AsyncMock(side_effect=Exception("db gone"))
-            result = await collector._get_token_id(99)
-            assert result is None
-
-    @pytest.mark.asyncio
-    async def test_returns_none_when_no_row(self, collector):
-        with patch("mm.metrics_collector.store") as mock_store:
-            mock_db = MagicMock()
-            mock_cursor = MagicMock()
-            mock_cursor.fetchone = AsyncMock(return_value=None)
-            mock_db.execute = AsyncMock(return_value=mock_cursor)
-            mock_store._get_db = AsyncMock(return_value=mock_db)
-
-            result = await collector._get_token_id(99)
-            assert result is None
+        result = await collector._resolve_token_ids([42])
+        assert result == {42: "cached-token"}
+        mock_store._get_db.assert_not_awaited()
+
+    async def test_token_cache_evicts_when_full(self, collector, mock_store):
+        """At capacity the least recently used quote_id is dropped."""
+        for qid in range(mc._TOKEN_CACHE_MAX):
+            collector._token_cache[qid] = f"tok-{qid}"
+        # Touch quote 0 so quote 1 becomes the LRU entry
+        assert await collector._resolve_token_ids([0]) == {0: "tok-0"}
+
+        new_qid = mc._TOKEN_CACHE_MAX
+        _set_rows(mock_store, [{"id": new_qid, "token_id": "tok-new"}])
+        assert await collector._resolve_token_ids([new_qid]) == {new_qid: "tok-new"}
+
+        assert len(collector._token_cache) == mc._TOKEN_CACHE_MAX
+        assert 0 in collector._token_cache
+        assert 1 not in collector._token_cache
+
+    async def test_resolve_queries_only_misses(self, collector, mock_store):
+        """Cached ids are served locally; the rest go into a single IN-list query."""
+        collector._token_cache[1] = "tok-1"
+        mock_db = _set_rows(mock_store, [{"id": 2, "token_id": "tok-2"}])
+
+        result = await collector._resolve_token_ids([1, 2, 3, None, 2])
+
+        assert result == {1: "tok-1", 2: "tok-2"}
+        mock_db.execute.assert_awaited_once()
+        sql, params = mock_db.execute.call_args[0]
+        assert "IN (?,?)" in sql
+        assert sorted(params) == [2, 3]
+        assert collector._token_cache[2] == "tok-2"
+
+    async def test_returns_partial_on_db_exception(self, collector, mock_store):
+        collector._token_cache[1] = "tok-1"
+        mock_store._get_db.side_effect = Exception("db gone")
+        result = await collector._resolve_token_ids([1, 99])
+        assert result == {1: "tok-1"}
+
+    async def test_unknown_quote_id_absent(self, collector, mock_store):
+        result = await collector._resolve_token_ids([99])
+        assert result == {}
+        assert 99 not in collector._token_cache
 
 
 # ────────────────────────────────────────────────────────────
@@ -699,18 +730,15 @@ class TestGetTokenId:
 class TestGetCurrentMid:
     """Tests for _get_current_mid() wrapper around client.get_book_summary."""
 
-    @pytest.mark.asyncio
     async def test_returns_mid_from_book_summary(self, collector, mock_client):
         mid = await collector._get_current_mid("tok-1")
         assert mid == 0.55
 
-    @pytest.mark.asyncio
     async def test_returns_none_when_summary_is_none(self, collector, mock_client):
         mock_client.get_book_summary.return_value = None
         mid = await collector._get_current_mid("tok-1")
         assert mid is None
 
-    @pytest.mark.asyncio
     async def test_returns_none_on_exception(self, collector, mock_client):
         mock_client.get_book_summary.side_effect = Exception("network error")
         mid = await collector._get_current_mid("tok-1")
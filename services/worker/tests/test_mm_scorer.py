@@ -1,5 +1,7 @@
 """Tests for mm/scorer.py — MarketScorer (Sonnet batch scoring)."""
 
+import copy
+import functools
 import json
 import time
 from unittest.mock import AsyncMock, patch
@@ -31,22 +33,33 @@ def _make_market(market_id: str, spread: float = 5.0, mid: float = 0.5) -> dict:
     }
 
 
-def _make_sonnet_response(scores: dict[str, float], flags: dict[str, str | None] | None = None) -> dict:
-    """Build a Sonnet-style response dict."""
-    flags = flags or {}
+@functools.lru_cache(maxsize=64)
+def _sonnet_response(
+    scores: tuple[tuple[str, float], ...], flags: tuple[tuple[str, str | None], ...],
+) -> dict:
+    flag_by_id = dict(flags)
     result = {"scores": {}}
-    for mid, overall in scores.items():
+    for mid, overall in scores:
         result["scores"][mid] = {
             "resolution_clarity": overall,
             "market_quality": overall,
             "profitability": overall,
             "overall": overall,
-            "flag": flags.get(mid),
+            "flag": flag_by_id.get(mid),
             "note": f"score {overall}",
         }
     return result
 
 
+def _make_sonnet_response(scores: dict[str, float], flags: dict[str, str | None] | None = None) -> dict:
+    """Build a Sonnet-style response dict.
+
+    Built once per distinct (scores, flags) and deep-copied out, so a test
+    (or the scorer) mutating its response cannot corrupt the cached one.
+    """
+    return copy.deepcopy(_sonnet_response(tuple(scores.items()), tuple((flags or {}).items())))
+
+
 def _scorer(enabled: bool = True, min_score: float = 5.0, cache_minutes: int = 10) -> MarketScorer:
     mm_cfg = MarketMakingConfig()
     mm_cfg.mm_scorer_enabled = enabled
@@ -1,8 +1,9 @@
 """Tests for mm/state.py — order state machine and QuotePair."""
 
-import pytest
 from mm.state import (
     OrderState,
+    OPEN_STATES,
+    CANCELLABLE_STATES,
     can_transition,
     parse_clob_status,
     QuotePair,
@@ -91,11 +92,20 @@ class TestQuotePairBidAskSize:
 class TestQuotePairProperties:
     def test_spread(self):
         qp = QuotePair(market_id="m1", token_id="t1", bid_price=0.40, ask_price=0.60, size=10)
-        assert qp.spread == pytest.approx(0.20)
+        assert qp.spread == 0.20
 
     def test_mid(self):
         qp = QuotePair(market_id="m1", token_id="t1", bid_price=0.40, ask_price=0.60, size=10)
-        assert qp.mid == pytest.approx(0.50)
+        assert qp.mid == 0.50
+
+    def test_spread_and_mid_exact_on_ticks(self):
+        # Plain float subtraction gives 0.19999999999999998 here
+        qp = QuotePair(market_id="m1", token_id="t1", bid_price=0.10, ask_price=0.30, size=10)
+        assert qp.spread == 0.20
+        assert qp.mid == 0.20
+        qp = QuotePair(market_id="m1", token_id="t1", bid_price=0.471, ask_price=0.474, size=10)
+        assert qp.spread == 0.003
+        assert qp.mid == 0.4725
 
     def test_is_active(self):
         qp = QuotePair(market_id="m1", token_id="t1", bid_price=0.40, ask_price=0.60, size=10)
@@ -136,3 +146,22 @@ class TestQuotePairStateTransitions:
             bid_state=OrderState.LIVE,
         )
         assert qp.update_bid_state(OrderState.LIVE) is False
+
+
+class TestOpenStatesMask:
+    def test_mask_matches_resting_states(self):
+        resting = {OrderState.NEW, OrderState.LIVE, OrderState.PARTIAL}
+        for state in OrderState:
+            assert bool(state & OPEN_STATES) == (state in resting)
+
+    def test_cancellable_mask_excludes_new(self):
+        acked = {OrderState.LIVE, OrderState.PARTIAL}
+        for state in OrderState:
+            assert bool(state & CANCELLABLE_STATES) == (state in acked)
+
+
+class TestOrderStateStr:
+    def test_str_is_member_name(self):
+        assert str(OrderState.LIVE) == "LIVE"
+        assert f"{OrderState.CANCELLED}" == "CANCELLED"
+        assert str(OrderState.LIVE | OrderState.FILLED) == "LIVE|FILLED"